@@ -1,70 +1,150 @@
-from autoarray.mask.mask import Mask as mask
-from autoarray.structures.arrays import Array as array
-from autoarray.structures.grids import (
-    Grid as grid,
-    GridIrregular as grid_irregular,
-    GridRectangular as grid_rectangular,
-    GridVoronoi as grid_voronoi,
-    Coordinates as coordinates,
-)
-from autoarray.structures.kernel import Kernel as kernel
-from autoarray.structures.visibilities import Visibilities as visibilities
-from autoarray.structures.arrays import MaskedArray as masked_array
-from autoarray.structures.grids import MaskedGrid as masked_grid
-from autoarray.dataset.imaging import Imaging as imaging
-from autoarray.dataset.interferometer import Interferometer as interferometer
-from autoarray.dataset import data_converter
-from autoarray.operators.convolver import Convolver as convolver
-from autoarray.operators.transformer import Transformer as transformer
-from autoarray.operators.inversion.mappers import mapper
-from autoarray.operators.inversion.inversions import inversion
-from autoarray.operators.inversion import pixelizations as pix, regularization as reg
-from autoarray import conf
-
-from autoastro import dimensions as dim
-from autoastro import util
-from autoastro.profiles import (
-    light_profiles as lp,
-    mass_profiles as mp,
-    light_and_mass_profiles as lmp,
-)
-from autoastro.galaxy.galaxy import Galaxy, HyperGalaxy, Redshift
-from autoastro.galaxy.galaxy_data import GalaxyData as galaxy_data
-from autoastro.galaxy.fit_galaxy import GalaxyFit as fit_galaxy
-from autoastro.galaxy.galaxy_model import GalaxyModel
-from autoastro.hyper import hyper_data
-
-from autolens import simulator
-from autolens.dataset.dataset import (
-    MaskedImaging as masked_imaging,
-    MaskedInterferometer as masked_interferometer,
-)
-from autolens.lens.plane import Plane
-from autolens.lens.ray_tracing import Tracer
-from autolens import util
-from autolens.fit.fit import fit
-from autolens.fit.fit import PositionsFit as fit_positions
-from autolens.pipeline import tagging
-from autolens.pipeline.phase.abstract import phase
-from autolens.pipeline.phase.abstract.phase import AbstractPhase
-from autolens.pipeline.phase.extensions import CombinedHyperPhase
-from autolens.pipeline.phase.extensions import HyperGalaxyPhase
-from autolens.pipeline.phase.extensions.hyper_galaxy_phase import HyperGalaxyPhase
-from autolens.pipeline.phase.extensions.hyper_phase import HyperPhase
-from autolens.pipeline.phase.extensions.inversion_phase import (
-    InversionBackgroundBothPhase,
-    InversionBackgroundNoisePhase,
-    InversionBackgroundSkyPhase,
-    InversionPhase,
-    ModelFixingHyperPhase,
-)
-from autolens.pipeline.phase.abstract.phase import AbstractPhase
-from autolens.pipeline.phase.dataset.phase import PhaseDataset
-from autolens.pipeline.phase.imaging.phase import PhaseImaging
-from autolens.pipeline.phase.interferometer.phase import PhaseInterferometer
-from autolens.pipeline.phase.phase_galaxy import PhaseGalaxy
-from autolens.pipeline.pipeline import PipelineDataset, PipelinePositions
-from autolens.pipeline import setup
-from autolens import plot
+import importlib
+import sys
+import types
+
+# The public names of autolens are resolved lazily, on first access, via the module level __getattr__ below, so that
+# "import autolens" does not import autoarray, autoastro, the pipeline machinery or matplotlib (which autoarray's
+# plotting imports). Each name maps to the module it is imported from and its attribute in that module, where an
+# attribute of None is the module itself.
+_lazy_imports = {
+    "mask": ("autoarray.mask.mask", "Mask"),
+    "array": ("autoarray.structures.arrays", "Array"),
+    "grid": ("autoarray.structures.grids", "Grid"),
+    "grid_irregular": ("autoarray.structures.grids", "GridIrregular"),
+    "grid_rectangular": ("autoarray.structures.grids", "GridRectangular"),
+    "grid_voronoi": ("autoarray.structures.grids", "GridVoronoi"),
+    "coordinates": ("autoarray.structures.grids", "Coordinates"),
+    "kernel": ("autoarray.structures.kernel", "Kernel"),
+    "visibilities": ("autoarray.structures.visibilities", "Visibilities"),
+    "masked_array": ("autoarray.structures.arrays", "MaskedArray"),
+    "masked_grid": ("autoarray.structures.grids", "MaskedGrid"),
+    "imaging": ("autoarray.dataset.imaging", "Imaging"),
+    "interferometer": ("autoarray.dataset.interferometer", "Interferometer"),
+    "data_converter": ("autoarray.dataset", "data_converter"),
+    "convolver": ("autoarray.operators.convolver", "Convolver"),
+    "transformer": ("autoarray.operators.transformer", "Transformer"),
+    "transformer_nufft": ("autolens.dataset.transformer", "TransformerNUFFT"),
+    "mapper": ("autoarray.operators.inversion.mappers", "mapper"),
+    "inversion": ("autoarray.operators.inversion.inversions", "inversion"),
+    "pix": ("autoarray.operators.inversion", "pixelizations"),
+    "reg": ("autoarray.operators.inversion", "regularization"),
+    "conf": ("autoarray", "conf"),
+    "dim": ("autoastro", "dimensions"),
+    "lp": ("autoastro.profiles", "light_profiles"),
+    "mp": ("autoastro.profiles", "mass_profiles"),
+    "lmp": ("autoastro.profiles", "light_and_mass_profiles"),
+    "Galaxy": ("autoastro.galaxy.galaxy", "Galaxy"),
+    "HyperGalaxy": ("autoastro.galaxy.galaxy", "HyperGalaxy"),
+    "Redshift": ("autoastro.galaxy.galaxy", "Redshift"),
+    "galaxy_data": ("autoastro.galaxy.galaxy_data", "GalaxyData"),
+    "fit_galaxy": ("autoastro.galaxy.fit_galaxy", "GalaxyFit"),
+    "GalaxyModel": ("autoastro.galaxy.galaxy_model", "GalaxyModel"),
+    "hyper_data": ("autoastro.hyper", "hyper_data"),
+    "simulator": ("autolens.simulator", None),
+    "masked_imaging": ("autolens.dataset.dataset", "MaskedImaging"),
+    "masked_interferometer": ("autolens.dataset.dataset", "MaskedInterferometer"),
+    "Plane": ("autolens.lens.plane", "Plane"),
+    "Tracer": ("autolens.lens.ray_tracing", "Tracer"),
+    "util": ("autolens.util", None),
+    "fit": ("autolens.fit.fit", "fit"),
+    "fit_positions": ("autolens.fit.fit", "PositionsFit"),
+    "tagging": ("autolens.pipeline.tagging", None),
+    "phase": ("autolens.pipeline.phase.abstract.phase", None),
+    "AbstractPhase": ("autolens.pipeline.phase.abstract.phase", "AbstractPhase"),
+    "CombinedHyperPhase": ("autolens.pipeline.phase.extensions", "CombinedHyperPhase"),
+    "HyperGalaxyPhase": (
+        "autolens.pipeline.phase.extensions.hyper_galaxy_phase",
+        "HyperGalaxyPhase",
+    ),
+    "HyperPhase": ("autolens.pipeline.phase.extensions.hyper_phase", "HyperPhase"),
+    "InversionBackgroundBothPhase": (
+        "autolens.pipeline.phase.extensions.inversion_phase",
+        "InversionBackgroundBothPhase",
+    ),
+    "InversionBackgroundNoisePhase": (
+        "autolens.pipeline.phase.extensions.inversion_phase",
+        "InversionBackgroundNoisePhase",
+    ),
+    "InversionBackgroundSkyPhase": (
+        "autolens.pipeline.phase.extensions.inversion_phase",
+        "InversionBackgroundSkyPhase",
+    ),
+    "InversionPhase": (
+        "autolens.pipeline.phase.extensions.inversion_phase",
+        "InversionPhase",
+    ),
+    "ModelFixingHyperPhase": (
+        "autolens.pipeline.phase.extensions.inversion_phase",
+        "ModelFixingHyperPhase",
+    ),
+    "PhaseDataset": ("autolens.pipeline.phase.dataset.phase", "PhaseDataset"),
+    "PhaseImaging": ("autolens.pipeline.phase.imaging.phase", "PhaseImaging"),
+    "PhaseInterferometer": (
+        "autolens.pipeline.phase.interferometer.phase",
+        "PhaseInterferometer",
+    ),
+    "PhaseGalaxy": ("autolens.pipeline.phase.phase_galaxy", "PhaseGalaxy"),
+    "PipelineDataset": ("autolens.pipeline.pipeline", "PipelineDataset"),
+    "PipelinePositions": ("autolens.pipeline.pipeline", "PipelinePositions"),
+    "setup": ("autolens.pipeline.setup", None),
+    "plot": ("autolens.plot", None),
+}
+
+
+def __getattr__(name):
+    """Import a public name of autolens the first time it is accessed, storing it in the module so that later \
+    accesses do not call this function.
+
+    An attribute which is not found in its module is imported as a submodule of it, matching the behaviour of \
+    "from module import attribute"."""
+
+    try:
+        module_name, attribute = _lazy_imports[name]
+    except KeyError:
+        raise AttributeError(
+            "module {} has no attribute {}".format(__name__, name)
+        ) from None
+
+    module = importlib.import_module(module_name)
+
+    if attribute is None:
+        value = module
+    else:
+        try:
+            value = getattr(module, attribute)
+        except AttributeError:
+            value = importlib.import_module("{}.{}".format(module_name, attribute))
+
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_imports))
+
+
+class LazyModule(types.ModuleType):
+    def __setattr__(self, name, value):
+        """The import system sets every imported submodule as an attribute of its package, which for the subpackage \
+        autolens.fit would shadow the public function *fit*. A submodule is therefore not set if it shares its name \
+        with a public name it is not the value of."""
+        if (
+            isinstance(value, types.ModuleType)
+            and name in _lazy_imports
+            and value.__name__ == "{}.{}".format(__name__, name)
+            and _lazy_imports[name] != (value.__name__, None)
+        ):
+            return
+
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = LazyModule
+
+# Module level __getattr__ requires Python 3.7, so earlier versions import every public name on import.
+if sys.version_info < (3, 7):
+    for _name in _lazy_imports:
+        __getattr__(_name)
 
 __version__ = '0.41.1'
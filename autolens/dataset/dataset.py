@@ -1,10 +1,60 @@
-from autoarray.structures import grids
-from autoarray.dataset import imaging, interferometer
-from autolens.fit import fit
+import copy
+import os
+
+import numpy as np
+
+from autoarray.structures import grids, kernel, visibilities as vis
+from autoarray.dataset import abstract_dataset, imaging, interferometer
+from autoarray.operators import transformer
 from autolens import exc
+from autolens.util import lens_util
+from autolens.util import visibilities_util
+from autolens.util import w_tilde_util
+
+
+def memory_mapped_array_from_file_path_and_template(file_path, template):
+    """Load a read-only memory-mapped view of an array stored in a .npy file, which has the same type and attributes \
+    (mask, etc.) as the template array."""
+
+    memory_mapped_array = np.load(file_path, mmap_mode="r")
+
+    if type(template) is np.ndarray:
+        return memory_mapped_array.view(np.ndarray)
+
+    array = memory_mapped_array.view(type(template))
+    array.__array_finalize__(template)
+
+    return array
+
+
+class MemoryMappedArrayFile:
+    def __init__(self, file_path, template):
+        """The .npy file of a memory-mapped array of a masked dataset, which is pickled in place of the array such that \
+        unpickled datasets (e.g. in worker processes) memory-map the same file, as opposed to each holding a copy.
+
+        Parameters
+        ----------
+        file_path : str
+            The path of the .npy file the array is stored in.
+        template : np.ndarray
+            A zero-length slice of the array, which retains its type and attributes (mask, etc.).
+        """
+        self.file_path = file_path
+        self.template = template
+
+    @property
+    def array(self):
+        return memory_mapped_array_from_file_path_and_template(
+            file_path=self.file_path, template=self.template
+        )
 
 
 class AbstractLensMasked:
+
+    # The attributes of the masked dataset (or of its attributes, e.g. the convolver) which are output to memory maps
+    # by *output_arrays_to_memory_maps*.
+    memory_mapped_array_paths = ()
+
     def __init__(self, positions, positions_threshold, preload_sparse_grids_of_planes):
 
         if positions is not None:
@@ -14,20 +64,148 @@ class AbstractLensMasked:
 
         self.positions_threshold = positions_threshold
 
+        self._positions_grid = None
+
         self.preload_sparse_grids_of_planes = preload_sparse_grids_of_planes
 
+        self.memory_map_directory = None
+
+    def output_arrays_to_memory_maps(self, directory):
+        """Output the static arrays of the masked dataset (see *memory_mapped_array_paths*) to .npy files in a \
+        directory and replace them with read-only memory-mapped views of these files.
+
+        When the masked dataset is then pickled (e.g. to send it to the processes of a parallelized search), \
+        the paths of these files are pickled in place of the arrays. Every unpickled copy memory-maps the same files, \
+        such that all processes on a node read one physical copy of the arrays.
+
+        Parameters
+        ----------
+        directory : str
+            The directory the .npy files are output to, which is created if it does not exist.
+        """
+
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+        for array_path in self.memory_mapped_array_paths:
+
+            owner, name = self.owner_and_name_of_array_path(array_path=array_path)
+
+            if owner is None:
+                continue
+
+            array = getattr(owner, name, None)
+
+            if array is None:
+                continue
+
+            file_path = "{}/{}.npy".format(directory, array_path)
+
+            np.save(file_path, np.asarray(array))
+
+            setattr(
+                owner,
+                name,
+                memory_mapped_array_from_file_path_and_template(
+                    file_path=file_path, template=array
+                ),
+            )
+
+        self.memory_map_directory = directory
+
+        return self
+
+    def owner_and_name_of_array_path(self, array_path):
+
+        names = array_path.split(".")
+
+        owner = self
+
+        for name in names[:-1]:
+            owner = getattr(owner, name, None)
+
+        return owner, names[-1]
+
+    def __getstate__(self):
+
+        state = self.__dict__.copy()
+
+        if getattr(self, "memory_map_directory", None) is None:
+            return state
+
+        for array_path in self.memory_mapped_array_paths:
+
+            names = array_path.split(".")
+
+            if len(names) == 1:
+                owner_state = state
+            elif state.get(names[0]) is None:
+                continue
+            else:
+                if state[names[0]] is self.__dict__[names[0]]:
+                    state[names[0]] = copy.copy(state[names[0]])
+                owner_state = state[names[0]].__dict__
+
+            array = owner_state.get(names[-1])
+
+            if array is None:
+                continue
+
+            owner_state[names[-1]] = MemoryMappedArrayFile(
+                file_path="{}/{}.npy".format(self.memory_map_directory, array_path),
+                template=array[:0],
+            )
+
+        return state
+
+    def __setstate__(self, state):
+
+        for array_path in self.memory_mapped_array_paths:
+
+            names = array_path.split(".")
+
+            if len(names) == 1:
+                owner_state = state
+            elif state.get(names[0]) is None:
+                continue
+            else:
+                owner_state = state[names[0]].__dict__
+
+            array_file = owner_state.get(names[-1])
+
+            if isinstance(array_file, MemoryMappedArrayFile):
+                owner_state[names[-1]] = array_file.array
+
+        self.__dict__.update(state)
+
+    @property
+    def positions_grid(self):
+        """All lists of positions as one irregular grid of (y,x) coordinates, which is traced through a tracer in a \
+        single pass when checking the positions (see *check_positions_trace_within_threshold_via_tracer*)."""
+        if self._positions_grid is None:
+            self._positions_grid = self.positions.in_1d
+
+        return self._positions_grid
+
     def check_positions_trace_within_threshold_via_tracer(self, tracer):
+        """Raise a *RayTracingException* if any two positions of the same list do not trace to within the positions \
+        threshold of one another in the source-plane of a tracer.
+
+        Only the positions are traced through the tracer, as one grid, and the check exits as soon as a list of \
+        traced positions exceeds the threshold. This makes rejecting a model cheap, which matters because most of the \
+        models sampled at the start of a non-linear search fail the check.
+        """
 
         if self.positions is not None and self.positions_threshold is not None:
 
-            positions_fit = fit.PositionsFit(
-                positions=self.positions,
-                tracer=tracer,
-                noise_map=self.imaging.pixel_scales,
-            )
+            traced_positions = tracer.traced_grids_of_planes_from_grid(
+                grid=self.positions_grid
+            )[-1]
 
-            if not positions_fit.maximum_separation_within_threshold(
-                self.positions_threshold
+            if not lens_util.positions_within_threshold_from_positions_1d_sizes_and_threshold(
+                positions_1d=np.asarray(traced_positions),
+                sizes=np.asarray([len(positions) for positions in self.positions]),
+                threshold=self.positions_threshold,
             ):
                 raise exc.RayTracingException
 
@@ -42,6 +220,20 @@ class AbstractLensMasked:
 
 
 class MaskedImaging(imaging.MaskedImaging, AbstractLensMasked):
+
+    memory_mapped_array_paths = (
+        "image",
+        "noise_map",
+        "grid",
+        "blurring_grid",
+        "convolver.image_frame_1d_indexes",
+        "convolver.image_frame_1d_kernels",
+        "convolver.image_frame_1d_lengths",
+        "convolver.blurring_frame_1d_indexes",
+        "convolver.blurring_frame_1d_kernels",
+        "convolver.blurring_frame_1d_lengths",
+    )
+
     def __init__(
         self,
         imaging,
@@ -53,6 +245,7 @@ class MaskedImaging(imaging.MaskedImaging, AbstractLensMasked):
         positions=None,
         positions_threshold=None,
         preload_sparse_grids_of_planes=None,
+        inversion_uses_sparse_matrices=False,
     ):
         """
         The lens dataset is the collection of data_type (image, noise-map, PSF), a mask, grid, convolver \
@@ -82,6 +275,11 @@ class MaskedImaging(imaging.MaskedImaging, AbstractLensMasked):
         inversion_pixel_limit : int or None
             The maximum number of pixels that can be used by an inversion, with the limit placed primarily to speed \
             up run.
+        inversion_uses_sparse_matrices : bool
+            If *True*, the inversions of every fit use sparse mapping, blurred mapping and curvature matrices (see \
+            *inversions.InversionImagingSparse*), whose memory scales with the number of image pixels times the PSF \
+            size as opposed to the number of image pixels times the number of pixelization pixels. If *False*, the \
+            dense matrices of an *InversionImaging* are used.
         """
 
         super(MaskedImaging, self).__init__(
@@ -100,6 +298,8 @@ class MaskedImaging(imaging.MaskedImaging, AbstractLensMasked):
             preload_sparse_grids_of_planes=preload_sparse_grids_of_planes,
         )
 
+        self.inversion_uses_sparse_matrices = inversion_uses_sparse_matrices
+
     def binned_from_bin_up_factor(self, bin_up_factor):
 
         binned_imaging = self.imaging.binned_from_bin_up_factor(
@@ -119,6 +319,7 @@ class MaskedImaging(imaging.MaskedImaging, AbstractLensMasked):
             positions=self.positions,
             positions_threshold=self.positions_threshold,
             preload_sparse_grids_of_planes=self.preload_sparse_grids_of_planes,
+            inversion_uses_sparse_matrices=self.inversion_uses_sparse_matrices,
         )
 
     def signal_to_noise_limited_from_signal_to_noise_limit(self, signal_to_noise_limit):
@@ -137,10 +338,22 @@ class MaskedImaging(imaging.MaskedImaging, AbstractLensMasked):
             positions=self.positions,
             positions_threshold=self.positions_threshold,
             preload_sparse_grids_of_planes=self.preload_sparse_grids_of_planes,
+            inversion_uses_sparse_matrices=self.inversion_uses_sparse_matrices,
         )
 
 
 class MaskedInterferometer(interferometer.MaskedInterferometer, AbstractLensMasked):
+
+    memory_mapped_array_paths = (
+        "visibilities",
+        "noise_map",
+        "grid",
+        "transformer.preload_real_transforms",
+        "transformer.preload_imag_transforms",
+        "w_tilde",
+        "w_tilde_dirty_image",
+    )
+
     def __init__(
         self,
         interferometer,
@@ -153,6 +366,9 @@ class MaskedInterferometer(interferometer.MaskedInterferometer, AbstractLensMask
         positions=None,
         positions_threshold=None,
         preload_sparse_grids_of_planes=None,
+        transformer_class=transformer.Transformer,
+        uv_cell_size=None,
+        inversion_uses_w_tilde=False,
     ):
         """
         The lens dataset is the collection of data_type (image, noise-map, primary_beam), a mask, grid, convolver \
@@ -182,20 +398,123 @@ class MaskedInterferometer(interferometer.MaskedInterferometer, AbstractLensMask
         inversion_pixel_limit : int or None
             The maximum number of pixels that can be used by an inversion, with the limit placed primarily to speed \
             up run.
+        transformer_class : class
+            The class of the transformer which computes the visibilities of model images, either the *Transformer* \
+            (a direct Fourier transform) or the *TransformerNUFFT* (a non-uniform FFT, whose cost does not scale \
+            with the number of image pixels times the number of visibilities).
+        uv_cell_size : float or None
+            If input, the visibilities are compressed by averaging them in square cells of the uv-plane of this \
+            size (in wavelengths), such that the cost of a fit scales with the number of occupied cells as opposed \
+            to the number of visibilities (see \
+            *visibilities_util.compressed_visibilities_from_visibilities_noise_map_uv_wavelengths_and_mask*). The \
+            interferometer of the masked dataset is then the compressed interferometer. The chi-squared of the \
+            scatter of the original visibilities about their cell means is stored as *uv_compression_chi_squared* \
+            and the difference between the noise normalizations of the original and compressed visibilities as \
+            *uv_compression_noise_normalization*, which every fit adds to its chi-squared and noise normalization \
+            such that its likelihood is that of the original visibilities. These terms are those of the noise-map of \
+            the original visibilities, so compressed visibilities cannot be fitted with a hyper background noise.
+        inversion_uses_w_tilde : bool
+            If *True*, the W-tilde matrix of the real-space pixels (the curvature matrix of an inversion before the \
+            mapping of the pixels to a pixelization) and the dirty image of the visibilities are computed once here \
+            (see *w_tilde_util.w_tilde_from_noise_map_uv_wavelengths_and_grid_radians*), such that the inversions of \
+            every fit use sparse products with the mapping matrix as opposed to transforming it, whose cost scales \
+            with the number of visibilities.
         """
 
-        self.interferometer = interferometer
+        self.uv_cell_size = uv_cell_size
+
+        if uv_cell_size is not None:
+
+            (
+                visibilities,
+                noise_map,
+                uv_wavelengths,
+                self.uv_compression_chi_squared,
+            ) = visibilities_util.compressed_visibilities_from_visibilities_noise_map_uv_wavelengths_and_mask(
+                visibilities=interferometer.visibilities,
+                noise_map=interferometer.noise_map,
+                uv_wavelengths=interferometer.uv_wavelengths,
+                visibilities_mask=visibilities_mask,
+                uv_cell_size=uv_cell_size,
+            )
+
+            self.uv_compression_noise_normalization = visibilities_util.uv_compression_noise_normalization_from_noise_maps_and_mask(
+                noise_map=interferometer.noise_map,
+                compressed_noise_map=noise_map,
+                visibilities_mask=visibilities_mask,
+            )
 
-        super(MaskedInterferometer, self).__init__(
-            interferometer=interferometer,
-            visibilities_mask=visibilities_mask,
-            real_space_mask=real_space_mask,
-            primary_beam_shape_2d=primary_beam_shape_2d,
+            interferometer = copy.copy(interferometer)
+            interferometer.data = vis.Visibilities(visibilities_1d=visibilities)
+            interferometer.noise_map = vis.Visibilities(visibilities_1d=noise_map)
+            interferometer.uv_wavelengths = uv_wavelengths
+            interferometer.exposure_time_map = None
+
+            visibilities_mask = np.full(fill_value=False, shape=visibilities.shape)
+
+        else:
+
+            self.uv_compression_chi_squared = 0.0
+            self.uv_compression_noise_normalization = 0.0
+
+        # The fields of the autoarray masked interferometer are set up here, as opposed to via its __init__, which
+        # always sets up the direct Fourier transform of the *Transformer* and its preloaded transforms.
+
+        abstract_dataset.AbstractMaskedDataset.__init__(
+            self=self,
+            mask=real_space_mask,
             pixel_scale_interpolation_grid=pixel_scale_interpolation_grid,
             inversion_pixel_limit=inversion_pixel_limit,
             inversion_uses_border=inversion_uses_border,
         )
 
+        self.interferometer = interferometer
+
+        if interferometer.primary_beam is None:
+            self.primary_beam_shape_2d = None
+        elif primary_beam_shape_2d is None:
+            self.primary_beam_shape_2d = interferometer.primary_beam.shape_2d
+        else:
+            self.primary_beam_shape_2d = primary_beam_shape_2d
+
+        if self.primary_beam_shape_2d is not None:
+            self.primary_beam = kernel.Kernel.manual_2d(
+                array=interferometer.primary_beam.resized_from_new_shape(
+                    new_shape=self.primary_beam_shape_2d
+                ).in_2d
+            )
+
+        self.transformer = transformer_class(
+            uv_wavelengths=interferometer.uv_wavelengths,
+            grid_radians=self.grid.in_1d_binned.in_radians,
+        )
+
+        self.visibilities = interferometer.visibilities
+        self.noise_map = interferometer.noise_map
+        self.visibilities_mask = visibilities_mask
+
+        self.inversion_uses_w_tilde = inversion_uses_w_tilde
+
+        if inversion_uses_w_tilde:
+
+            self.w_tilde = w_tilde_util.w_tilde_from_noise_map_uv_wavelengths_and_grid_radians(
+                noise_map=self.noise_map,
+                uv_wavelengths=self.interferometer.uv_wavelengths,
+                grid_radians=self.grid.in_1d_binned.in_radians,
+            )
+
+            self.w_tilde_dirty_image = w_tilde_util.dirty_image_from_visibilities_noise_map_uv_wavelengths_and_grid_radians(
+                visibilities=self.visibilities,
+                noise_map=self.noise_map,
+                uv_wavelengths=self.interferometer.uv_wavelengths,
+                grid_radians=self.grid.in_1d_binned.in_radians,
+            )
+
+        else:
+
+            self.w_tilde = None
+            self.w_tilde_dirty_image = None
+
         AbstractLensMasked.__init__(
             self=self,
             positions=positions,
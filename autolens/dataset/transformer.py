@@ -0,0 +1,200 @@
+import numpy as np
+
+from autoarray.structures import visibilities as vis
+from autolens.util import nufft_util
+
+
+class TransformerNUFFT:
+    def __init__(
+        self, uv_wavelengths, grid_radians, oversampling_factor=2.0, kernel_width=6
+    ):
+        """
+        Computes the visibilities of an image (and the transformed mapping matrices of an inversion) at a set of \
+        uv-wavelengths via a non-uniform FFT, as opposed to the direct Fourier transform of the *Transformer*, \
+        whose cost scales as the number of image pixels times the number of visibilities.
+
+        The image is divided by the Fourier transform of a Kaiser-Bessel kernel, padded to a grid \
+        *oversampling_factor* times its size and FFT'd, with the visibility at every uv-wavelength then \
+        interpolated from the *kernel_width* x *kernel_width* cells of the FFT nearest it (weighted by the kernel). \
+        The cost is therefore that of one FFT of the padded grid plus *kernel_width* ** 2 operations per \
+        visibility.
+
+        The visibilities are approximate. For the default oversampling factor of 2 and kernel width of 6 the \
+        error of every visibility is below 1e-5 times the sum of the absolute values of the image's pixels, which \
+        falls to below 1e-7 for a kernel width of 8 and 1e-9 for a kernel width of 10 (at a higher degridding cost).
+
+        Parameters
+        ----------
+        uv_wavelengths : np.ndarray
+            The (u,v) wavelengths of the visibilities, with shape [total_visibilities, 2].
+        grid_radians : grids.Grid
+            The grid (in radians) of the real-space mask, which must be a uniform grid of pixels such that the \
+            image can be FFT'd.
+        oversampling_factor : float
+            The factor the image is padded by before its FFT.
+        kernel_width : int
+            The width (in cells of the padded grid) of the Kaiser-Bessel kernel the visibilities are interpolated \
+            with.
+        """
+
+        self.uv_wavelengths = uv_wavelengths.astype("float")
+        self.grid_radians = grid_radians.in_1d_binned
+
+        self.total_visibilities = uv_wavelengths.shape[0]
+        self.total_image_pixels = grid_radians.shape_1d
+
+        self.oversampling_factor = oversampling_factor
+        self.kernel_width = kernel_width
+
+        beta = nufft_util.kaiser_bessel_beta_from_kernel_width_and_oversampling_factor(
+            kernel_width=kernel_width, oversampling_factor=oversampling_factor
+        )
+
+        pixel_indexes, image_shape = nufft_util.pixel_indexes_from_mask(
+            mask=self.grid_radians.mask
+        )
+
+        self.grid_shape = nufft_util.grid_shape_from_image_shape_and_oversampling_factor(
+            image_shape=image_shape,
+            oversampling_factor=oversampling_factor,
+            kernel_width=kernel_width,
+        )
+
+        centred_pixel_indexes = pixel_indexes - np.asarray(image_shape) // 2
+
+        pixel_scales = (
+            np.asarray(self.grid_radians.mask.pixel_scales) * np.pi / 648000.0
+        )
+
+        grid_radians = np.asarray(self.grid_radians)
+
+        centre_y = np.mean(
+            grid_radians[:, 0] + centred_pixel_indexes[:, 0] * pixel_scales[0]
+        )
+        centre_x = np.mean(
+            grid_radians[:, 1] - centred_pixel_indexes[:, 1] * pixel_scales[1]
+        )
+
+        self.grid_1d_indexes = np.mod(
+            centred_pixel_indexes[:, 0], self.grid_shape[0]
+        ) * self.grid_shape[1] + np.mod(centred_pixel_indexes[:, 1], self.grid_shape[1])
+
+        self.deapodization_weights = 1.0 / (
+            nufft_util.kaiser_bessel_deapodization_from_indexes(
+                indexes=centred_pixel_indexes[:, 0],
+                grid_size=self.grid_shape[0],
+                kernel_width=kernel_width,
+                beta=beta,
+            )
+            * nufft_util.kaiser_bessel_deapodization_from_indexes(
+                indexes=centred_pixel_indexes[:, 1],
+                grid_size=self.grid_shape[1],
+                kernel_width=kernel_width,
+                beta=beta,
+            )
+        )
+
+        # The y coordinates of the grid decrease with the row index of the image, so the y frequencies are negated.
+
+        self.degridding_indexes_y, self.degridding_weights_y = nufft_util.degridding_indexes_and_weights_from_frequencies(
+            frequencies=-self.uv_wavelengths[:, 1] * pixel_scales[0],
+            grid_size=self.grid_shape[0],
+            kernel_width=kernel_width,
+            beta=beta,
+        )
+
+        self.degridding_indexes_x, self.degridding_weights_x = nufft_util.degridding_indexes_and_weights_from_frequencies(
+            frequencies=self.uv_wavelengths[:, 0] * pixel_scales[1],
+            grid_size=self.grid_shape[1],
+            kernel_width=kernel_width,
+            beta=beta,
+        )
+
+        self.phase_shifts = np.exp(
+            -2.0j
+            * np.pi
+            * (
+                self.uv_wavelengths[:, 0] * centre_x
+                + self.uv_wavelengths[:, 1] * centre_y
+            )
+        )
+
+    def complex_visibilities_from_image_stack(self, image_stack):
+        """The complex visibilities of a stack of 1D images with shape [total_images, total_image_pixels], returned \
+        with shape [total_visibilities, total_images]. Large stacks are transformed in chunks of \
+        *nufft_util.max_transformed_images* images."""
+
+        image_stack = np.asarray(image_stack)
+
+        visibilities = np.zeros(
+            shape=(self.total_visibilities, image_stack.shape[0]), dtype="complex"
+        )
+
+        for chunk_start in range(
+            0, image_stack.shape[0], nufft_util.max_transformed_images
+        ):
+
+            chunk = image_stack[
+                chunk_start : chunk_start + nufft_util.max_transformed_images
+            ]
+
+            padded_images = np.zeros(
+                shape=(chunk.shape[0], self.grid_shape[0] * self.grid_shape[1])
+            )
+
+            padded_images[:, self.grid_1d_indexes] = chunk * self.deapodization_weights
+
+            gridded_visibilities = np.fft.fft2(
+                padded_images.reshape((chunk.shape[0],) + self.grid_shape)
+            )
+
+            visibilities[
+                :, chunk_start : chunk_start + chunk.shape[0]
+            ] = nufft_util.visibilities_from_gridded_visibilities_jit(
+                gridded_visibilities=np.ascontiguousarray(
+                    np.moveaxis(gridded_visibilities, 0, -1)
+                ),
+                degridding_indexes_y=self.degridding_indexes_y,
+                degridding_weights_y=self.degridding_weights_y,
+                degridding_indexes_x=self.degridding_indexes_x,
+                degridding_weights_x=self.degridding_weights_x,
+            )
+
+        return visibilities * self.phase_shifts[:, None]
+
+    def complex_visibilities_from_image(self, image):
+        return self.complex_visibilities_from_image_stack(
+            image_stack=np.asarray(image.in_1d_binned)[None, :]
+        )[:, 0]
+
+    def real_visibilities_from_image(self, image):
+        return self.complex_visibilities_from_image(image=image).real
+
+    def imag_visibilities_from_image(self, image):
+        return self.complex_visibilities_from_image(image=image).imag
+
+    def visibilities_from_image(self, image):
+
+        visibilities = self.complex_visibilities_from_image(image=image)
+
+        return vis.Visibilities(
+            visibilities_1d=np.stack((visibilities.real, visibilities.imag), axis=-1)
+        )
+
+    def real_transformed_mapping_matrix_from_mapping_matrix(self, mapping_matrix):
+        return self.transformed_mapping_matrices_from_mapping_matrix(
+            mapping_matrix=mapping_matrix
+        )[0]
+
+    def imag_transformed_mapping_matrix_from_mapping_matrix(self, mapping_matrix):
+        return self.transformed_mapping_matrices_from_mapping_matrix(
+            mapping_matrix=mapping_matrix
+        )[1]
+
+    def transformed_mapping_matrices_from_mapping_matrix(self, mapping_matrix):
+
+        transformed_mapping_matrix = self.complex_visibilities_from_image_stack(
+            image_stack=np.asarray(mapping_matrix).T
+        )
+
+        return [transformed_mapping_matrix.real, transformed_mapping_matrix.imag]
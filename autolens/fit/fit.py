@@ -2,7 +2,10 @@ import numpy as np
 
 from autoarray.fit import fit as aa_fit
 from autoastro.galaxy import galaxy as g
+from autolens import exc
 from autolens.dataset import dataset as d
+from autolens.util import lens_util
+from autolens.util import profiling_util
 
 
 def fit(masked_dataset, tracer, hyper_image_sky=None, hyper_background_noise=None):
@@ -50,11 +53,15 @@ class ImagingFit(aa_fit.ImagingFit):
             hyper_background_noise=hyper_background_noise,
         )
 
-        self.blurred_profile_image = tracer.blurred_profile_image_from_grid_and_convolver(
-            grid=masked_imaging.grid,
-            convolver=masked_imaging.convolver,
-            blurring_grid=masked_imaging.blurring_grid,
-        )
+        with profiling_util.stage("profile_image"):
+            profile_image, blurring_image = tracer.profile_image_and_blurring_image_from_grid_and_blurring_grid(
+                grid=masked_imaging.grid, blurring_grid=masked_imaging.blurring_grid
+            )
+
+        with profiling_util.stage("blurring_convolution"):
+            self.blurred_profile_image = masked_imaging.convolver.convolved_image_from_image_and_blurring_image(
+                image=profile_image, blurring_image=blurring_image
+            )
 
         self.profile_subtracted_image = image - self.blurred_profile_image
 
@@ -65,14 +72,16 @@ class ImagingFit(aa_fit.ImagingFit):
 
         else:
 
-            inversion = tracer.inversion_imaging_from_grid_and_data(
-                grid=masked_imaging.grid,
-                image=self.profile_subtracted_image,
-                noise_map=noise_map,
-                convolver=masked_imaging.convolver,
-                inversion_uses_border=masked_imaging.inversion_uses_border,
-                preload_sparse_grids_of_planes=masked_imaging.preload_sparse_grids_of_planes,
-            )
+            with profiling_util.stage("inversion"):
+                inversion = tracer.inversion_imaging_from_grid_and_data(
+                    grid=masked_imaging.grid,
+                    image=self.profile_subtracted_image,
+                    noise_map=noise_map,
+                    convolver=masked_imaging.convolver,
+                    inversion_uses_border=masked_imaging.inversion_uses_border,
+                    preload_sparse_grids_of_planes=masked_imaging.preload_sparse_grids_of_planes,
+                    inversion_uses_sparse_matrices=masked_imaging.inversion_uses_sparse_matrices,
+                )
 
             model_image = (
                 self.blurred_profile_image + inversion.mapped_reconstructed_image
@@ -168,6 +177,21 @@ class InterferometerFit(aa_fit.InterferometerFit):
             A function which maps the 1D lens hyper_galaxies to its unmasked 2D arrays.
         """
 
+        # The compressed visibilities, their uv-wavelengths and the chi-squared and noise normalization terms of
+        # uv compression are weighted by the noise-map of the original visibilities, so they are not those of a
+        # hyper noise-map, which would need the original visibilities to be compressed again for every fit.
+
+        if (
+            hyper_background_noise is not None
+            and masked_interferometer.uv_cell_size is not None
+        ):
+            raise exc.SettingsException(
+                "A hyper background noise cannot be fitted to a masked interferometer whose visibilities are "
+                "compressed into uv cells (uv_cell_size={}).".format(
+                    masked_interferometer.uv_cell_size
+                )
+            )
+
         if hyper_background_noise is not None:
             noise_map = hyper_background_noise.hyper_noise_map_from_noise_map(
                 noise_map=masked_interferometer.noise_map
@@ -178,11 +202,23 @@ class InterferometerFit(aa_fit.InterferometerFit):
         self.masked_dataset = masked_interferometer
         self.tracer = tracer
 
-        self.profile_visibilities = tracer.profile_visibilities_from_grid_and_transformer(
-            grid=masked_interferometer.grid,
-            transformer=masked_interferometer.transformer,
+        # The W-tilde matrix of the masked interferometer is computed for its noise-map, so it is not used for the
+        # noise-map of a hyper background noise.
+
+        uses_w_tilde = (
+            masked_interferometer.w_tilde is not None and hyper_background_noise is None
         )
 
+        with profiling_util.stage("profile_image"):
+            profile_image = tracer.profile_image_from_grid(
+                grid=masked_interferometer.grid
+            )
+
+        with profiling_util.stage("fourier_transform"):
+            self.profile_visibilities = masked_interferometer.transformer.visibilities_from_image(
+                image=profile_image
+            )
+
         self.profile_subtracted_visibilities = (
             masked_interferometer.visibilities - self.profile_visibilities
         )
@@ -194,14 +230,32 @@ class InterferometerFit(aa_fit.InterferometerFit):
 
         else:
 
-            inversion = tracer.inversion_interferometer_from_grid_and_data(
-                grid=masked_interferometer.grid,
-                visibilities=self.profile_subtracted_visibilities,
-                noise_map=noise_map,
-                transformer=masked_interferometer.transformer,
-                inversion_uses_border=masked_interferometer.inversion_uses_border,
-                preload_sparse_grids_of_planes=masked_interferometer.preload_sparse_grids_of_planes,
-            )
+            if uses_w_tilde:
+
+                # The dirty image of the profile visibilities is W-tilde times the profile image, such that the
+                # profile-subtracted visibilities are never transformed back to real-space.
+
+                w_tilde = masked_interferometer.w_tilde
+                dirty_image = masked_interferometer.w_tilde_dirty_image - np.dot(
+                    w_tilde, profile_image.in_1d_binned
+                )
+
+            else:
+
+                w_tilde = None
+                dirty_image = None
+
+            with profiling_util.stage("inversion"):
+                inversion = tracer.inversion_interferometer_from_grid_and_data(
+                    grid=masked_interferometer.grid,
+                    visibilities=self.profile_subtracted_visibilities,
+                    noise_map=noise_map,
+                    transformer=masked_interferometer.transformer,
+                    inversion_uses_border=masked_interferometer.inversion_uses_border,
+                    preload_sparse_grids_of_planes=masked_interferometer.preload_sparse_grids_of_planes,
+                    w_tilde=w_tilde,
+                    dirty_image=dirty_image,
+                )
 
             model_visibilities = (
                 self.profile_visibilities + inversion.mapped_reconstructed_visibilities
@@ -219,6 +273,25 @@ class InterferometerFit(aa_fit.InterferometerFit):
     def grid(self):
         return self.masked_interferometer.grid
 
+    @property
+    def chi_squared(self):
+        """The chi-squared of the fit, including the chi-squared of the scatter of the visibilities of a compressed \
+        masked interferometer about the means of their uv-plane cells (see *uv_compression_chi_squared*)."""
+        return (
+            super(InterferometerFit, self).chi_squared
+            + self.masked_dataset.uv_compression_chi_squared
+        )
+
+    @property
+    def noise_normalization(self):
+        """The noise normalization of the fit, including the difference between the noise normalizations of the \
+        original and compressed visibilities of a compressed masked interferometer (see \
+        *uv_compression_noise_normalization*)."""
+        return (
+            super(InterferometerFit, self).noise_normalization
+            + self.masked_dataset.uv_compression_noise_normalization
+        )
+
     @property
     def galaxy_model_image_dict(self) -> {g.Galaxy: np.ndarray}:
         """
@@ -308,24 +381,46 @@ class PositionsFit:
         )[-1]
         self.noise_map = noise_map
 
+    @property
+    def source_plane_positions_1d(self):
+        return np.asarray(
+            [
+                position
+                for positions in self.source_plane_positions
+                for position in positions
+            ],
+            dtype="float",
+        ).reshape(-1, 2)
+
+    @property
+    def sizes(self):
+        return np.asarray(
+            [len(positions) for positions in self.source_plane_positions], dtype="int"
+        )
+
     def maximum_separation_within_threshold(self, threshold):
-        return max(self.maximum_separations) <= threshold
+        """Returns True if every list of positions traces to within the threshold of one another in the source-plane, \
+        exiting as soon as one pair of positions is found to exceed it."""
+        return lens_util.positions_within_threshold_from_positions_1d_sizes_and_threshold(
+            positions_1d=self.source_plane_positions_1d,
+            sizes=self.sizes,
+            threshold=threshold,
+        )
 
     @property
     def maximum_separations(self):
-        return [
-            self.max_separation_of_grid(grid=position_list)
-            for position_list in self.source_plane_positions.list_in_1d
-        ]
+        return list(
+            lens_util.max_separations_of_positions_from_positions_1d_and_sizes(
+                positions_1d=self.source_plane_positions_1d, sizes=self.sizes
+            )
+        )
 
     @staticmethod
     def max_separation_of_grid(grid):
-        rdist_max = np.zeros((grid.sub_shape_1d))
-        for i in range(grid.sub_shape_1d):
-            xdists = np.square(np.subtract(grid[i, 0], grid[:, 0]))
-            ydists = np.square(np.subtract(grid[i, 1], grid[:, 1]))
-            rdist_max[i] = np.max(np.add(xdists, ydists))
-        return np.max(np.sqrt(rdist_max))
+        grid = np.asarray(grid, dtype="float")
+        return lens_util.max_separations_of_positions_from_positions_1d_and_sizes(
+            positions_1d=grid, sizes=np.asarray([grid.shape[0]])
+        )[0]
 
     @property
     def chi_squared_map(self):
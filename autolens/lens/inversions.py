@@ -0,0 +1,254 @@
+import numpy as np
+from scipy import sparse
+from scipy.sparse import linalg
+
+from autoarray import exc
+from autoarray.operators.inversion import inversions as inv
+from autolens.util import sparse_inversion_util
+from autolens.util import w_tilde_util
+
+
+class InversionImagingSparse(inv.InversionImaging):
+    def __init__(
+        self,
+        image,
+        noise_map,
+        mapper,
+        regularization,
+        blurred_mapping_matrix,
+        regularization_matrix,
+        curvature_reg_matrix,
+        reconstruction,
+        curvature_reg_matrix_factor_diagonal,
+    ):
+        """ An inversion of an imaging dataset, whose mapping matrix, blurred mapping matrix and curvature matrix \
+        are sparse matrices (see *sparse_inversion_util*), as opposed to the dense matrices of an *InversionImaging*.
+
+        Every sub-pixel maps to one pixelization pixel, so the memory of the mapping matrices scales with the number \
+        of image pixels (times the PSF size) as opposed to the number of image pixels times the number of \
+        pixelization pixels. The linear system is solved via a sparse LU decomposition, whose diagonal gives the log \
+        determinant of the curvature_reg_matrix.
+
+        Parameters
+        -----------
+        blurred_mapping_matrix : scipy.sparse.csc_matrix
+            The matrix representing the blurred mappings between the image's sub-grid of pixels and the pixelization \
+            pixels.
+        curvature_reg_matrix : scipy.sparse.csc_matrix
+            The curvature_matrix + regularization matrix.
+        curvature_reg_matrix_factor_diagonal : ndarray
+            The diagonal of the U factor of the symmetric LU decomposition of the curvature_reg_matrix.
+        """
+
+        inv.Inversion.__init__(
+            self=self,
+            noise_map=noise_map,
+            mapper=mapper,
+            regularization=regularization,
+            regularization_matrix=regularization_matrix,
+            curvature_reg_matrix=curvature_reg_matrix,
+            reconstruction=reconstruction,
+        )
+
+        self.image = image
+        self.blurred_mapping_matrix = blurred_mapping_matrix
+        self.curvature_reg_matrix_factor_diagonal = curvature_reg_matrix_factor_diagonal
+
+    @classmethod
+    def from_data_mapper_and_regularization(
+        cls, image, noise_map, convolver, mapper, regularization
+    ):
+
+        mapping_matrix = sparse_inversion_util.sparse_mapping_matrix_from_mapper(
+            mapper=mapper
+        )
+
+        blurred_mapping_matrix = sparse_inversion_util.blurred_sparse_mapping_matrix_from_sparse_mapping_matrix_and_convolver(
+            mapping_matrix=mapping_matrix, convolver=convolver
+        )
+
+        data_vector = blurred_mapping_matrix.T.dot(
+            np.asarray(image) / np.asarray(noise_map) ** 2.0
+        )
+
+        curvature_matrix = sparse_inversion_util.sparse_curvature_matrix_from_blurred_sparse_mapping_matrix_and_noise_map(
+            blurred_mapping_matrix=blurred_mapping_matrix, noise_map=noise_map
+        )
+
+        regularization_matrix = regularization.regularization_matrix_from_mapper(
+            mapper=mapper
+        )
+
+        curvature_reg_matrix = sparse.csc_matrix(
+            curvature_matrix + sparse.csc_matrix(regularization_matrix)
+        )
+
+        # The curvature_reg_matrix is symmetric, so it is decomposed with symmetric permutations and diagonal
+        # pivots, such that the diagonal of U is positive if and only if the matrix is positive-definite.
+
+        try:
+            factor = linalg.splu(
+                curvature_reg_matrix,
+                permc_spec="MMD_AT_PLUS_A",
+                diag_pivot_thresh=0.0,
+                options=dict(SymmetricMode=True),
+            )
+        except RuntimeError:
+            raise exc.InversionException()
+
+        values = factor.solve(data_vector)
+
+        return InversionImagingSparse(
+            image=image,
+            noise_map=noise_map,
+            mapper=mapper,
+            regularization=regularization,
+            blurred_mapping_matrix=blurred_mapping_matrix,
+            regularization_matrix=regularization_matrix,
+            curvature_reg_matrix=curvature_reg_matrix,
+            reconstruction=values,
+            curvature_reg_matrix_factor_diagonal=factor.U.diagonal(),
+        )
+
+    @property
+    def errors_with_covariance(self):
+        return np.linalg.inv(self.curvature_reg_matrix.toarray())
+
+    @property
+    def log_det_curvature_reg_matrix_term(self):
+        if np.any(self.curvature_reg_matrix_factor_diagonal <= 0.0):
+            raise exc.InversionException()
+
+        return np.sum(np.log(self.curvature_reg_matrix_factor_diagonal))
+
+    @property
+    def mapped_reconstructed_image(self):
+        return self.mapper.grid.mapping.array_stored_1d_from_array_1d(
+            array_1d=self.blurred_mapping_matrix.dot(self.reconstruction)
+        )
+
+
+class InversionInterferometerWTilde(inv.InversionInterferometer):
+    def __init__(
+        self,
+        visibilities,
+        noise_map,
+        transformer,
+        mapper,
+        regularization,
+        mapping_matrix,
+        regularization_matrix,
+        curvature_reg_matrix,
+        reconstruction,
+    ):
+        """ An inversion of an interferometer dataset, whose curvature matrix and data vector are computed from the \
+        W-tilde matrix and dirty image of the dataset's real-space pixels (see \
+        *w_tilde_util.w_tilde_from_noise_map_uv_wavelengths_and_grid_radians*), as opposed to from the transformed \
+        mapping matrices.
+
+        The mapping matrix is therefore never transformed, and is a sparse matrix (see \
+        *sparse_inversion_util.sparse_mapping_matrix_from_mapper*) whose products with the W-tilde matrix, dirty \
+        image and reconstruction scale with the number of sub-pixels. The mapped reconstructed visibilities are the \
+        transform of the mapped reconstructed image.
+
+        Parameters
+        -----------
+        visibilities : vis.Visibilities
+            The visibilities the inversion is fitting.
+        noise_map : vis.Visibilities
+            The noise-map of the visibilities.
+        transformer : transformer.Transformer or transformer.TransformerNUFFT
+            The transformer which computes the mapped reconstructed visibilities.
+        mapper : inversion.mappers.Mapper
+            The util between the image-pixels (via its / sub-grid) and pixelization pixels.
+        regularization : inversion.regularization.Regularization
+            The regularization scheme applied to smooth the pixelization used to reconstruct the image for the \
+            inversion
+        mapping_matrix : scipy.sparse.csc_matrix
+            The sparse matrix representing the mappings between the image's pixels and the pixelization pixels.
+        """
+
+        super(InversionInterferometerWTilde, self).__init__(
+            visibilities=visibilities,
+            noise_map=noise_map,
+            mapper=mapper,
+            regularization=regularization,
+            transformed_mapping_matrices=None,
+            regularization_matrix=regularization_matrix,
+            curvature_reg_matrix=curvature_reg_matrix,
+            reconstruction=reconstruction,
+        )
+
+        self.transformer = transformer
+        self.mapping_matrix = mapping_matrix
+
+    @classmethod
+    def from_data_mapper_and_regularization(
+        cls,
+        visibilities,
+        noise_map,
+        transformer,
+        mapper,
+        regularization,
+        w_tilde,
+        dirty_image,
+    ):
+        """Perform the inversion of visibilities via the W-tilde matrix and the dirty image of the visibilities, \
+        which must both have been computed for the noise-map of the inversion.
+
+        Parameters
+        -----------
+        w_tilde : np.ndarray
+            The W-tilde matrix of the dataset's real-space pixels, with shape [total_image_pixels, \
+            total_image_pixels].
+        dirty_image : np.ndarray
+            The noise-weighted dirty image of the visibilities at the dataset's real-space pixels.
+        """
+
+        mapping_matrix = sparse_inversion_util.sparse_mapping_matrix_from_mapper(
+            mapper=mapper
+        )
+
+        data_vector = mapping_matrix.T.dot(np.asarray(dirty_image))
+
+        curvature_matrix = w_tilde_util.curvature_matrix_from_w_tilde_and_mapping_matrix(
+            w_tilde=w_tilde, mapping_matrix=mapping_matrix
+        )
+
+        regularization_matrix = regularization.regularization_matrix_from_mapper(
+            mapper=mapper
+        )
+
+        # The regularization matrix is added to the curvature matrices of both the real and imaginary visibilities
+        # of an *InversionInterferometer*, which is matched here such that both inversions are identical.
+
+        curvature_reg_matrix = np.add(curvature_matrix, 2.0 * regularization_matrix)
+
+        try:
+            values = np.linalg.solve(curvature_reg_matrix, data_vector)
+        except np.linalg.LinAlgError:
+            raise exc.InversionException()
+
+        return InversionInterferometerWTilde(
+            visibilities=visibilities,
+            noise_map=noise_map,
+            transformer=transformer,
+            mapper=mapper,
+            regularization=regularization,
+            mapping_matrix=mapping_matrix,
+            regularization_matrix=regularization_matrix,
+            curvature_reg_matrix=curvature_reg_matrix,
+            reconstruction=values,
+        )
+
+    @property
+    def mapped_reconstructed_image(self):
+        return self.mapper.grid.mapping.array_stored_1d_from_array_1d(
+            array_1d=self.mapping_matrix.dot(self.reconstruction)
+        )
+
+    @property
+    def mapped_reconstructed_visibilities(self):
+        return self.transformer.visibilities_from_image(
+            image=self.mapped_reconstructed_image
+        )
@@ -8,10 +8,14 @@ from autoastro.util import cosmology_util
 from autolens import exc
 from autoastro import dimensions as dim
 from autolens.util import lens_util
+from autolens.util import plane_util
+from autolens.util import visibilities_util
 
 
 class AbstractPlane(lensing.LensingObject):
-    def __init__(self, redshift, galaxies, cosmology):
+    def __init__(
+        self, redshift, galaxies, cosmology, truncation_radii_of_galaxies=None
+    ):
         """A plane of galaxies where all galaxies are at the same redshift.
 
         Parameters
@@ -22,6 +26,11 @@ class AbstractPlane(lensing.LensingObject):
             The list of galaxies in this plane.
         cosmology : astropy.cosmology
             The cosmology associated with the plane, used to convert arc-second coordinates to physical values.
+        truncation_radii_of_galaxies : [float or None] or None
+            The arc-second truncation radius of every galaxy (None if the galaxy is not truncated), where the \
+            convergence, potential and deflection angles of each mass profile of a truncated galaxy are only computed \
+            on the coordinates within this radius of its centre and are zero beyond it (see \
+            *plane_util.deflections_of_galaxies_from_grid*). If None, no galaxy is truncated.
         """
 
         if redshift is None:
@@ -44,6 +53,7 @@ class AbstractPlane(lensing.LensingObject):
         self.redshift = redshift
         self.galaxies = galaxies
         self.cosmology = cosmology
+        self.truncation_radii_of_galaxies = truncation_radii_of_galaxies
 
     @property
     def galaxy_redshifts(self):
@@ -207,7 +217,10 @@ class AbstractPlane(lensing.LensingObject):
         )
 
         return self.__class__(
-            galaxies=new_galaxies, redshift=self.redshift, cosmology=self.cosmology
+            galaxies=new_galaxies,
+            redshift=self.redshift,
+            cosmology=self.cosmology,
+            truncation_radii_of_galaxies=self.truncation_radii_of_galaxies,
         )
 
     @property
@@ -237,10 +250,15 @@ class AbstractPlane(lensing.LensingObject):
 
 
 class AbstractPlaneCosmology(AbstractPlane):
-    def __init__(self, redshift, galaxies, cosmology):
+    def __init__(
+        self, redshift, galaxies, cosmology, truncation_radii_of_galaxies=None
+    ):
 
         super(AbstractPlaneCosmology, self).__init__(
-            redshift=redshift, galaxies=galaxies, cosmology=cosmology
+            redshift=redshift,
+            galaxies=galaxies,
+            cosmology=cosmology,
+            truncation_radii_of_galaxies=truncation_radii_of_galaxies,
         )
 
     @property
@@ -270,13 +288,20 @@ class AbstractPlaneCosmology(AbstractPlane):
 
 
 class AbstractPlaneLensing(AbstractPlaneCosmology):
-    def __init__(self, redshift, galaxies, cosmology):
+    def __init__(
+        self, redshift, galaxies, cosmology, truncation_radii_of_galaxies=None
+    ):
         super(AbstractPlaneCosmology, self).__init__(
-            redshift=redshift, galaxies=galaxies, cosmology=cosmology
+            redshift=redshift,
+            galaxies=galaxies,
+            cosmology=cosmology,
+            truncation_radii_of_galaxies=truncation_radii_of_galaxies,
         )
 
     @grids.convert_coordinates_to_grid
-    def profile_image_from_grid(self, grid):
+    def profile_image_from_grid(
+        self, grid, fractional_accuracy=None, sub_sizes=(1, 2, 4, 8)
+    ):
         """Compute the profile-image plane image of the list of galaxies of the plane's sub-grid, by summing the
         individual images of each galaxy's light profile.
 
@@ -286,16 +311,32 @@ class AbstractPlaneLensing(AbstractPlaneCosmology):
         If the plane has no galaxies (or no galaxies have mass profiles) an arrays of all zeros the shape of the plane's
         sub-grid is returned.
 
+        If a *fractional_accuracy* is input, the image is instead computed on an adaptive sub-grid, where each pixel \
+        is evaluated at the *sub_sizes* in turn until its binned value changes by less than this fraction (see \
+        *lens_util.array_binned_iterated_from_grid_func_and_fractional_accuracy*), and the binned image is returned.
+
         Parameters
         -----------
-
+        grid : aa.Grid
+            The grid the image is computed on.
+        fractional_accuracy : float or None
+            If input, the fractional accuracy every pixel of the adaptive sub-grid image is computed to.
+        sub_sizes : (int)
+            The sub sizes of the adaptive sub-grid, in ascending order.
         """
+        if fractional_accuracy is not None:
+            return lens_util.array_binned_iterated_from_grid_func_and_fractional_accuracy(
+                grid=grid,
+                func=lambda iterate_grid: self.profile_image_from_grid(
+                    grid=iterate_grid
+                ),
+                fractional_accuracy=fractional_accuracy,
+                sub_sizes=sub_sizes,
+            )
+
         if self.galaxies:
-            profile_image = sum(
-                map(
-                    lambda galaxy: galaxy.profile_image_from_grid(grid=grid),
-                    self.galaxies,
-                )
+            profile_image = plane_util.profile_image_of_galaxies_from_grid(
+                galaxies=self.galaxies, grid=grid
             )
             return grid.mapping.array_stored_1d_from_sub_array_1d(
                 sub_array_1d=profile_image
@@ -330,8 +371,10 @@ class AbstractPlaneLensing(AbstractPlaneCosmology):
             The galaxies whose mass profiles are used to compute the surface densities.
         """
         if self.galaxies:
-            convergence = sum(
-                map(lambda g: g.convergence_from_grid(grid=grid), self.galaxies)
+            convergence = plane_util.convergence_of_galaxies_from_grid(
+                galaxies=self.galaxies,
+                grid=grid,
+                truncation_radii_of_galaxies=self.truncation_radii_of_galaxies,
             )
             return grid.mapping.array_stored_1d_from_sub_array_1d(
                 sub_array_1d=convergence
@@ -361,8 +404,10 @@ class AbstractPlaneLensing(AbstractPlaneCosmology):
             The galaxies whose mass profiles are used to compute the surface densities.
         """
         if self.galaxies:
-            potential = sum(
-                map(lambda g: g.potential_from_grid(grid=grid), self.galaxies)
+            potential = plane_util.potential_of_galaxies_from_grid(
+                galaxies=self.galaxies,
+                grid=grid,
+                truncation_radii_of_galaxies=self.truncation_radii_of_galaxies,
             )
             return grid.mapping.array_stored_1d_from_sub_array_1d(
                 sub_array_1d=potential
@@ -374,9 +419,19 @@ class AbstractPlaneLensing(AbstractPlaneCosmology):
 
     @grids.convert_coordinates_to_grid
     def deflections_from_grid(self, grid):
+        """Compute the deflection angles of the plane's galaxies on a grid, where the *SphericalIsothermal*, \
+        *PointMass* and *SphericalNFW* profiles of all galaxies are evaluated together for each of these types on a \
+        grid without an interpolator, and every other mass profile by its own method (see \
+        *plane_util.deflections_of_galaxies_from_grid*).
+
+        The mass profiles of a galaxy with a truncation radius (see *truncation_radii_of_galaxies*) are only evaluated \
+        on the coordinates of the grid within this radius of their centre, which for a plane with many small halos \
+        (e.g. a substructure search) avoids computing every halo's deflection angles over the whole grid."""
         if self.galaxies:
-            deflections = sum(
-                map(lambda g: g.deflections_from_grid(grid=grid), self.galaxies)
+            deflections = plane_util.deflections_of_galaxies_from_grid(
+                galaxies=self.galaxies,
+                grid=grid,
+                truncation_radii_of_galaxies=self.truncation_radii_of_galaxies,
             )
             return grid.mapping.grid_stored_1d_from_sub_grid_1d(sub_grid_1d=deflections)
         else:
@@ -451,10 +506,15 @@ class AbstractPlaneLensing(AbstractPlaneCosmology):
 
 
 class AbstractPlaneData(AbstractPlaneLensing):
-    def __init__(self, redshift, galaxies, cosmology):
+    def __init__(
+        self, redshift, galaxies, cosmology, truncation_radii_of_galaxies=None
+    ):
 
         super(AbstractPlaneData, self).__init__(
-            redshift=redshift, galaxies=galaxies, cosmology=cosmology
+            redshift=redshift,
+            galaxies=galaxies,
+            cosmology=cosmology,
+            truncation_radii_of_galaxies=truncation_radii_of_galaxies,
         )
 
     def blurred_profile_image_from_grid_and_psf(self, grid, psf, blurring_grid):
@@ -513,12 +573,12 @@ class AbstractPlaneData(AbstractPlaneLensing):
     def profile_visibilities_of_galaxies_from_grid_and_transformer(
         self, grid, transformer
     ):
-        return [
-            galaxy.profile_visibilities_from_grid_and_transformer(
-                grid=grid, transformer=transformer
-            )
-            for galaxy in self.galaxies
-        ]
+        """The visibilities of the profile image of every galaxy in the plane, where the images of all galaxies are \
+        transformed together in one batched transform."""
+        return visibilities_util.visibilities_of_images_from_images_and_transformer(
+            images=self.profile_images_of_galaxies_from_grid(grid=grid),
+            transformer=transformer,
+        )
 
     def sparse_image_plane_grid_from_grid(self, grid):
 
@@ -641,10 +701,19 @@ class AbstractPlaneData(AbstractPlaneLensing):
 
 
 class Plane(AbstractPlaneData):
-    def __init__(self, redshift=None, galaxies=None, cosmology=cosmo.Planck15):
+    def __init__(
+        self,
+        redshift=None,
+        galaxies=None,
+        cosmology=cosmo.Planck15,
+        truncation_radii_of_galaxies=None,
+    ):
 
         super(Plane, self).__init__(
-            redshift=redshift, galaxies=galaxies, cosmology=cosmology
+            redshift=redshift,
+            galaxies=galaxies,
+            cosmology=cosmology,
+            truncation_radii_of_galaxies=truncation_radii_of_galaxies,
         )
 
     # noinspection PyUnusedLocal
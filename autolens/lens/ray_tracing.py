@@ -1,3 +1,4 @@
+import weakref
 from abc import ABC
 
 import numpy as np
@@ -10,13 +11,22 @@ from autoarray.structures import grids
 from autoarray.structures.arrays import MaskedArray
 from autoarray.operators.inversion import inversions as inv
 from autoastro.galaxy import galaxy as g
-from autoastro.util import cosmology_util
+from autolens import exc
+from autolens.lens import inversions
 from autolens.lens import plane as pl
 from autolens.util import lens_util
+from autolens.util import plane_util
+from autolens.util import visibilities_util
 
 
 class AbstractTracer(lensing.LensingObject, ABC):
-    def __init__(self, planes, cosmology):
+    def __init__(
+        self,
+        planes,
+        cosmology,
+        pixel_scale_interpolation_grid=None,
+        interpolation_accuracy=None,
+    ):
         """Ray-tracer for a lens system with any number of planes.
 
         The redshift of these planes are specified by the redshits of the galaxies; there is a unique plane redshift \
@@ -39,11 +49,32 @@ class AbstractTracer(lensing.LensingObject, ABC):
             source-plane borders.
         cosmology : astropy.cosmology
             The cosmology of the ray-tracing calculation.
+        pixel_scale_interpolation_grid : float or None
+            If input, the deflection angles of every grid traced by the tracer are computed on a uniform grid of \
+            this pixel scale and bilinearly interpolated to the grid (see *traced_grids_of_planes_from_grid*).
+        interpolation_accuracy : float or None
+            If input, the interpolated deflection angles are checked against the exact deflection angles on a \
+            subset of the grid, and the exact calculation is used if they differ by more than this many arc-seconds.
         """
         self.planes = planes
         self.plane_redshifts = [plane.redshift for plane in planes]
         self.cosmology = cosmology
 
+        self.pixel_scale_interpolation_grid = pixel_scale_interpolation_grid
+        self.interpolation_accuracy = interpolation_accuracy
+
+        self._tracer_cosmology = None
+        self._traced_grids_cache = {}
+        self._profile_images_cache = None
+        self._critical_curves = None
+        self._caustics = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_traced_grids_cache"] = {}
+        state["_profile_images_cache"] = None
+        return state
+
     @property
     def total_planes(self):
         return len(self.plane_redshifts)
@@ -64,6 +95,17 @@ class AbstractTracer(lensing.LensingObject, ABC):
     def all_planes_have_redshifts(self):
         return None not in self.plane_redshifts
 
+    @property
+    def tracer_cosmology(self):
+        """The distances and scaling factors of the tracer's plane redshifts in its cosmology, which are computed \
+        the first time they are used and shared by all tracers with the same plane redshifts and cosmology."""
+        if self._tracer_cosmology is None and self.all_planes_have_redshifts:
+            self._tracer_cosmology = lens_util.TracerCosmology.from_plane_redshifts_and_cosmology(
+                plane_redshifts=self.plane_redshifts, cosmology=self.cosmology
+            )
+
+        return self._tracer_cosmology
+
     @property
     def has_light_profile(self):
         return any(list(map(lambda plane: plane.has_light_profile, self.planes)))
@@ -199,7 +241,12 @@ class AbstractTracer(lensing.LensingObject, ABC):
             )
         )
 
-        return self.__class__(planes=new_planes, cosmology=self.cosmology)
+        return self.__class__(
+            planes=new_planes,
+            cosmology=self.cosmology,
+            pixel_scale_interpolation_grid=self.pixel_scale_interpolation_grid,
+            interpolation_accuracy=self.interpolation_accuracy,
+        )
 
     @property
     def unit_length(self):
@@ -228,10 +275,12 @@ class AbstractTracer(lensing.LensingObject, ABC):
 
 
 class AbstractTracerCosmology(AbstractTracer, ABC):
+    @property
+    def scaling_factors_between_planes(self):
+        return self.tracer_cosmology.scaling_factors
+
     def arcsec_per_kpc_proper_of_plane(self, i):
-        return cosmology_util.arcsec_per_kpc_from_redshift_and_cosmology(
-            redshift=self.plane_redshifts[i], cosmology=self.cosmology
-        )
+        return self.tracer_cosmology.arcsec_per_kpc_proper_of_plane(i=i)
 
     def kpc_per_arcsec_proper_of_plane(self, i):
         return 1.0 / self.arcsec_per_kpc_proper_of_plane(i=i)
@@ -239,47 +288,31 @@ class AbstractTracerCosmology(AbstractTracer, ABC):
     def angular_diameter_distance_of_plane_to_earth_in_units(
         self, i, unit_length="arcsec"
     ):
-        return cosmology_util.angular_diameter_distance_to_earth_from_redshift_and_cosmology(
-            redshift=self.plane_redshifts[i],
-            cosmology=self.cosmology,
-            unit_length=unit_length,
+        return self.tracer_cosmology.angular_diameter_distance_of_plane_to_earth_in_units(
+            i=i, unit_length=unit_length
         )
 
     def angular_diameter_distance_between_planes_in_units(
         self, i, j, unit_length="arcsec"
     ):
-        return cosmology_util.angular_diameter_distance_between_redshifts_from_redshifts_and_cosmlology(
-            redshift_0=self.plane_redshifts[i],
-            redshift_1=self.plane_redshifts[j],
-            cosmology=self.cosmology,
-            unit_length=unit_length,
+        return self.tracer_cosmology.angular_diameter_distance_between_planes_in_units(
+            i=i, j=j, unit_length=unit_length
         )
 
     def angular_diameter_distance_to_source_plane_in_units(self, unit_length="arcsec"):
-        return cosmology_util.angular_diameter_distance_to_earth_from_redshift_and_cosmology(
-            redshift=self.plane_redshifts[-1],
-            cosmology=self.cosmology,
-            unit_length=unit_length,
+        return self.angular_diameter_distance_of_plane_to_earth_in_units(
+            i=-1, unit_length=unit_length
         )
 
     def critical_surface_density_between_planes_in_units(
         self, i, j, unit_length="arcsec", unit_mass="solMass"
     ):
-        return cosmology_util.critical_surface_density_between_redshifts_from_redshifts_and_cosmology(
-            redshift_0=self.plane_redshifts[i],
-            redshift_1=self.plane_redshifts[j],
-            cosmology=self.cosmology,
-            unit_length=unit_length,
-            unit_mass=unit_mass,
+        return self.tracer_cosmology.critical_surface_density_between_planes_in_units(
+            i=i, j=j, unit_length=unit_length, unit_mass=unit_mass
         )
 
     def scaling_factor_between_planes(self, i, j):
-        return cosmology_util.scaling_factor_between_redshifts_from_redshifts_and_cosmology(
-            redshift_0=self.plane_redshifts[i],
-            redshift_1=self.plane_redshifts[j],
-            redshift_final=self.plane_redshifts[-1],
-            cosmology=self.cosmology,
-        )
+        return self.tracer_cosmology.scaling_factor_between_planes(i=i, j=j)
 
     def angular_diameter_distance_from_image_to_source_plane_in_units(
         self, unit_length="arcsec"
@@ -290,52 +323,418 @@ class AbstractTracerCosmology(AbstractTracer, ABC):
 
 
 class AbstractTracerLensing(AbstractTracerCosmology, ABC):
+
+    max_cached_grids = 10
+    trace_grids_in_place = True
+    interpolation_check_step = 100
+    critical_curves_coarse_factor = 4
+
     @grids.convert_coordinates_to_grid
     def traced_grids_of_planes_from_grid(self, grid, plane_index_limit=None):
+        """Trace a grid of (y,x) arc-second image-plane coordinates through every plane of the tracer, returning the \
+        traced grid of every plane (up to and including the plane *plane_index_limit*, if input).
+
+        The traced grids and deflection angles of every plane are stored by the tracer (keyed by the identity of the \
+        input grid), such that a grid which is used in several calculations (e.g. the masked grid used to compute \
+        the profile image, blurred image and inversion of a fit) is only ray-traced once. If a grid is modified \
+        in-place after being traced, *clear_traced_grids_cache* must be called before tracing it again. Copies of the \
+        stored traced grids are returned, such that modifying them does not affect later ray-tracing.
+
+        If *trace_grids_in_place* is True (the default) the scaled deflection angles of the previous planes are \
+        subtracted from each plane's grid using a single buffer which is reused for every plane, as opposed to \
+        allocating a new array for every pair of planes. Both modes give identical traced grids; the in-place mode \
+        reduces the memory allocated when tracing large sub-gridded masks through many planes.
+
+        If the tracer has a *pixel_scale_interpolation_grid*, a uniform interpolation grid of this pixel scale which \
+        covers the input grid is traced through the planes exactly. The deflection angles of every plane at each \
+        (y,x) image-plane coordinate of the input grid are then bilinearly interpolated from those of the \
+        interpolation grid. This applies to every grid the tracer traces (e.g. padded grids, positions and grids \
+        traced to a redshift), but is skipped for grids with fewer coordinates than the interpolation grid, for which \
+        the exact calculation is cheaper. If the tracer also has an *interpolation_accuracy*, the deflection angles \
+        of each plane are computed exactly at every *interpolation_check_step*'th coordinate of the grid and the \
+        exact deflection angles of that plane are used if any interpolated value differs by more than this accuracy.
 
-        grid_calc = grid.copy()  # TODO looks unnecessary? Probably pretty expensive too
+        Parameters
+        ----------
+        grid : aa.Grid
+            The image-plane grid which is traced through the planes.
+        plane_index_limit : int or None
+            If input, tracing stops at this plane, skipping the deflection-angle calculations of later planes.
+        """
+        return [
+            traced_grid.copy()
+            for traced_grid in self._traced_grids_of_planes_from_grid(
+                grid=grid, plane_index_limit=plane_index_limit
+            )
+        ]
 
-        traced_grids = []
-        traced_deflections = []
+    def _traced_grids_of_planes_from_grid(self, grid, plane_index_limit=None):
+        """The traced grids stored by the tracer (see *traced_grids_of_planes_from_grid*), as opposed to copies of \
+        them, for the tracer's own calculations which do not modify them."""
+        traced_grids, traced_deflections = self.traced_grids_and_deflections_of_planes_from_grid(
+            grid=grid, plane_index_limit=plane_index_limit
+        )
 
-        for (plane_index, plane) in enumerate(self.planes):
+        return traced_grids
+
+    @grids.convert_coordinates_to_grid
+    def traced_deflections_of_planes_from_grid(self, grid):
+        """The deflection angles of every plane, computed on that plane's traced grid (see \
+        *traced_grids_of_planes_from_grid*)."""
+        traced_grids, traced_deflections = self.traced_grids_and_deflections_of_planes_from_grid(
+            grid=grid
+        )
+
+        return [traced_deflection.copy() for traced_deflection in traced_deflections]
+
+    def traced_grids_and_deflections_of_planes_from_grid(
+        self, grid, plane_index_limit=None
+    ):
 
-            scaled_grid = grid_calc.copy()
+        if plane_index_limit is not None and not (
+            0 <= plane_index_limit < self.total_planes
+        ):
+            plane_index_limit = None
+
+        if plane_index_limit is None:
+            last_plane_index = self.total_planes - 1
+        else:
+            last_plane_index = plane_index_limit
+
+        traced_grids, traced_deflections = self.traced_grids_and_deflections_from_cache(
+            grid=grid
+        )
+
+        self.trace_grid_through_planes(
+            grid=grid,
+            traced_grids=traced_grids,
+            traced_deflections=traced_deflections,
+            last_plane_index=last_plane_index,
+            plane_index_limit=plane_index_limit,
+            interpolate_deflections=self.pixel_scale_interpolation_grid is not None,
+        )
+
+        self.cache_traced_grids_and_deflections(
+            grid=grid, traced_grids=traced_grids, traced_deflections=traced_deflections
+        )
+
+        return traced_grids[: last_plane_index + 1], traced_deflections[:]
+
+    def trace_grid_through_planes(
+        self,
+        grid,
+        traced_grids,
+        traced_deflections,
+        last_plane_index,
+        plane_index_limit,
+        interpolate_deflections=False,
+    ):
+        """Extend the traced grids and deflection angles of a grid (which may already be traced through some planes) \
+        up to the plane *last_plane_index*, in-place."""
+
+        deflections_interpolator = None
+        scaled_deflections = None
+
+        for plane_index in range(len(traced_deflections), last_plane_index + 1):
+
+            if plane_index == len(traced_grids):
+
+                scaled_grid = grid.copy()
 
-            if plane_index > 0:
                 for previous_plane_index in range(plane_index):
-                    scaling_factor = cosmology_util.scaling_factor_between_redshifts_from_redshifts_and_cosmology(
-                        redshift_0=self.plane_redshifts[previous_plane_index],
-                        redshift_1=plane.redshift,
-                        redshift_final=self.plane_redshifts[-1],
-                        cosmology=self.cosmology,
+
+                    scaling_factor = self.scaling_factors_between_planes[
+                        previous_plane_index, plane_index
+                    ]
+
+                    if self.trace_grids_in_place:
+
+                        if scaled_deflections is None:
+                            scaled_deflections = np.empty(shape=grid.shape)
+
+                        np.multiply(
+                            traced_deflections[previous_plane_index],
+                            scaling_factor,
+                            out=scaled_deflections,
+                        )
+
+                    else:
+
+                        scaled_deflections = (
+                            scaling_factor * traced_deflections[previous_plane_index]
+                        )
+
+                    scaled_grid -= scaled_deflections
+
+                traced_grids.append(scaled_grid)
+
+            if plane_index == plane_index_limit:
+                break
+
+            if interpolate_deflections and deflections_interpolator is None:
+                deflections_interpolator = self.deflections_interpolator_from_grid(
+                    grid=grid, plane_index_limit=plane_index_limit
+                )
+                interpolate_deflections = deflections_interpolator is not None
+
+            if deflections_interpolator is None:
+                traced_deflections.append(
+                    self.planes[plane_index].deflections_from_grid(
+                        grid=traced_grids[plane_index]
                     )
+                )
+            else:
+                traced_deflections.append(
+                    self.interpolated_deflections_of_plane_from_traced_grid(
+                        plane_index=plane_index,
+                        traced_grid=traced_grids[plane_index],
+                        deflections_interpolator=deflections_interpolator,
+                    )
+                )
+
+    def deflections_interpolator_from_grid(self, grid, plane_index_limit=None):
+        """Trace the interpolation grid covering a grid through the planes exactly, returning the interpolator and \
+        the deflection angles of every plane on the interpolation grid (see *traced_grids_of_planes_from_grid*). \
+        Returns None if the grid has fewer coordinates than the interpolation grid."""
+
+        interpolator = lens_util.BilinearInterpolator(
+            grid=grid,
+            pixel_scale_interpolation_grid=self.pixel_scale_interpolation_grid,
+        )
 
-                    scaled_deflections = (
-                        scaling_factor * traced_deflections[previous_plane_index]
+        if interpolator.total_interp_pixels >= grid.shape[0]:
+            return None
+
+        interp_traced_grids = []
+        interp_traced_deflections = []
+
+        self.trace_grid_through_planes(
+            grid=interpolator.interp_grid,
+            traced_grids=interp_traced_grids,
+            traced_deflections=interp_traced_deflections,
+            last_plane_index=self.total_planes - 1
+            if plane_index_limit is None
+            else plane_index_limit,
+            plane_index_limit=plane_index_limit,
+        )
+
+        return interpolator, interp_traced_deflections
+
+    def interpolated_deflections_of_plane_from_traced_grid(
+        self, plane_index, traced_grid, deflections_interpolator
+    ):
+
+        interpolator, interp_traced_deflections = deflections_interpolator
+
+        deflections = traced_grid.copy()
+        deflections[:] = interpolator.interpolated_values_from_values(
+            values=interp_traced_deflections[plane_index]
+        )
+
+        if self.interpolation_accuracy is not None:
+
+            check_deflections = self.planes[plane_index].deflections_from_grid(
+                grid=grids.GridIrregular.manual_1d(
+                    grid=np.asarray(traced_grid)[:: self.interpolation_check_step]
+                )
+            )
+
+            if (
+                np.max(
+                    np.abs(
+                        np.asarray(deflections)[:: self.interpolation_check_step]
+                        - np.asarray(check_deflections)
                     )
+                )
+                > self.interpolation_accuracy
+            ):
+                return self.planes[plane_index].deflections_from_grid(grid=traced_grid)
 
-                    scaled_grid -= scaled_deflections
+        return deflections
 
-            traced_grids.append(scaled_grid)
+    def traced_grids_and_deflections_from_cache(self, grid):
 
-            if plane_index_limit is not None:
-                if plane_index == plane_index_limit:
-                    return traced_grids
+        cached = self._traced_grids_cache.get(id(grid))
 
-            traced_deflections.append(plane.deflections_from_grid(grid=scaled_grid))
+        if cached is None or cached[0]() is not grid:
+            return [], []
 
-        return traced_grids
+        return list(cached[1]), list(cached[2])
+
+    def cache_traced_grids_and_deflections(
+        self, grid, traced_grids, traced_deflections
+    ):
+
+        if (
+            id(grid) not in self._traced_grids_cache
+            and len(self._traced_grids_cache) >= self.max_cached_grids
+        ):
+            del self._traced_grids_cache[next(iter(self._traced_grids_cache))]
+
+        # The grid is referenced weakly, such that the tracer does not keep it alive, and its entry is removed when
+        # it is garbage collected, before its identity can be reused by a new grid.
+
+        grid_id = id(grid)
+        traced_grids_cache = self._traced_grids_cache
+
+        def remove_entry(grid_reference):
+            entry = traced_grids_cache.get(grid_id)
+            if entry is not None and entry[0] is grid_reference:
+                del traced_grids_cache[grid_id]
+
+        self._traced_grids_cache[grid_id] = (
+            weakref.ref(grid, remove_entry),
+            list(traced_grids),
+            list(traced_deflections),
+        )
+
+    def clear_traced_grids_cache(self):
+        """Remove all traced grids and deflection angles stored by the tracer, such that every grid is ray-traced \
+        again the next time it is input into the tracer."""
+        self._traced_grids_cache = {}
+        self._profile_images_cache = None
+
+    def traced_joint_grids_of_planes_from_grid_and_blurring_grid(
+        self, grid, blurring_grid, plane_index_limit=None
+    ):
+        """Trace a grid and its blurring grid through the planes together, returning the traced *joint* grid of \
+        every plane, which is the traced grid followed by the traced blurring grid in a single irregular grid.
+
+        This performs the deflection angle calculation of every plane once on the joint grid, as opposed to once on \
+        the grid and again on the blurring grid, and allows the light profiles of every plane to be evaluated on \
+        both grids at once (see *profile_images_of_planes_from_grid_and_blurring_grid*). The traced grids and \
+        deflection angles of the grid and blurring grid are stored by the tracer (see \
+        *traced_grids_of_planes_from_grid*), such that later calculations on either grid reuse them.
+
+        If either grid has already been traced or has an interpolator (e.g. the grids of a masked dataset with a \
+        *pixel_scale_interpolation_grid*, whose interpolators the deflection angle calculations use), or the tracer \
+        interpolates its deflection angles, the grids are traced separately and the traced grids of every plane are \
+        concatenated.
+
+        Parameters
+        ----------
+        grid : aa.Grid
+            The image-plane grid which is traced through the planes.
+        blurring_grid : aa.Grid
+            The image-plane blurring grid of the grid, which is traced through the planes.
+        plane_index_limit : int or None
+            If input, tracing stops at this plane, skipping the deflection-angle calculations of later planes.
+        """
+        if (
+            self.pixel_scale_interpolation_grid is not None
+            or getattr(grid, "interpolator", None) is not None
+            or getattr(blurring_grid, "interpolator", None) is not None
+            or self.traced_grids_and_deflections_from_cache(grid=grid)[0]
+            or self.traced_grids_and_deflections_from_cache(grid=blurring_grid)[0]
+        ):
+            traced_grids = self.traced_grids_of_planes_from_grid(
+                grid=grid, plane_index_limit=plane_index_limit
+            )
+            traced_blurring_grids = self.traced_grids_of_planes_from_grid(
+                grid=blurring_grid, plane_index_limit=plane_index_limit
+            )
+
+            return [
+                grids.GridIrregular.manual_1d(
+                    grid=np.concatenate((traced_grid, traced_blurring_grid))
+                )
+                for traced_grid, traced_blurring_grid in zip(
+                    traced_grids, traced_blurring_grids
+                )
+            ]
+
+        if plane_index_limit is not None and not (
+            0 <= plane_index_limit < self.total_planes
+        ):
+            plane_index_limit = None
+
+        joint_grid = grids.GridIrregular.manual_1d(
+            grid=np.concatenate((grid, blurring_grid))
+        )
+
+        traced_joint_grids = []
+        traced_joint_deflections = []
+
+        self.trace_grid_through_planes(
+            grid=joint_grid,
+            traced_grids=traced_joint_grids,
+            traced_deflections=traced_joint_deflections,
+            last_plane_index=self.total_planes - 1
+            if plane_index_limit is None
+            else plane_index_limit,
+            plane_index_limit=plane_index_limit,
+        )
+
+        for grid_of_joint_grid, joint_slice in [
+            (grid, slice(0, grid.shape[0])),
+            (blurring_grid, slice(grid.shape[0], None)),
+        ]:
+            self.cache_traced_grids_and_deflections(
+                grid=grid_of_joint_grid,
+                traced_grids=[
+                    self.grid_view_from_grid_and_array(
+                        grid=grid_of_joint_grid, array=traced_joint_grid[joint_slice]
+                    )
+                    for traced_joint_grid in traced_joint_grids
+                ],
+                traced_deflections=[
+                    grid_of_joint_grid.mapping.grid_stored_1d_from_sub_grid_1d(
+                        sub_grid_1d=np.asarray(traced_joint_deflection)[joint_slice]
+                    )
+                    for traced_joint_deflection in traced_joint_deflections
+                ],
+            )
+
+        return traced_joint_grids
+
+    @staticmethod
+    def grid_view_from_grid_and_array(grid, array):
+        """A view of an array of (y,x) coordinates with the same type and attributes (mask, interpolator, etc.) as a \
+        copy of a grid, for example a traced grid which is part of a larger array of traced coordinates."""
+        grid_view = np.asarray(array).view(type(grid))
+        grid_view.__array_finalize__(grid)
+
+        return grid_view
 
     @grids.convert_coordinates_to_grid
     def deflections_between_planes_from_grid(self, grid, plane_i=0, plane_j=-1):
 
-        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(grid=grid)
+        traced_grids_of_planes = self._traced_grids_of_planes_from_grid(grid=grid)
 
         return traced_grids_of_planes[plane_i] - traced_grids_of_planes[plane_j]
 
     @grids.convert_coordinates_to_grid
-    def profile_image_from_grid(self, grid):
+    def profile_image_from_grid(
+        self, grid, fractional_accuracy=None, sub_sizes=(1, 2, 4, 8)
+    ):
+        """Compute the image of all light profiles of the tracer's planes on a grid, where each plane's light is \
+        evaluated on that plane's traced grid.
+
+        If a *fractional_accuracy* is input, the image is computed on an adaptive sub-grid, where each pixel is \
+        ray-traced and evaluated at the *sub_sizes* in turn until its binned value changes by less than this fraction \
+        (see *lens_util.array_binned_iterated_from_grid_func_and_fractional_accuracy*), and the binned image is \
+        returned. This gives the accuracy of a high sub size at the steep centres of light profiles (or where the \
+        lensed source is compact) without using it across the whole mask.
+
+        Parameters
+        -----------
+        grid : aa.Grid
+            The image-plane grid the image is computed on.
+        fractional_accuracy : float or None
+            If input, the fractional accuracy every pixel of the adaptive sub-grid image is computed to.
+        sub_sizes : (int)
+            The sub sizes of the adaptive sub-grid, in ascending order.
+        """
+        if fractional_accuracy is not None:
+            return lens_util.array_binned_iterated_from_grid_func_and_fractional_accuracy(
+                grid=grid,
+                func=lambda iterate_grid: self.profile_image_from_grid(
+                    grid=iterate_grid
+                ),
+                fractional_accuracy=fractional_accuracy,
+                sub_sizes=sub_sizes,
+            )
+
         profile_image = sum(self.profile_images_of_planes_from_grid(grid=grid))
         return grid.mapping.array_stored_1d_from_sub_array_1d(
             sub_array_1d=profile_image
@@ -343,7 +742,7 @@ class AbstractTracerLensing(AbstractTracerCosmology, ABC):
 
     @grids.convert_coordinates_to_grid
     def profile_images_of_planes_from_grid(self, grid):
-        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(
+        traced_grids_of_planes = self._traced_grids_of_planes_from_grid(
             grid=grid, plane_index_limit=self.upper_plane_index_with_light_profile
         )
 
@@ -395,6 +794,57 @@ class AbstractTracerLensing(AbstractTracerCosmology, ABC):
         )
         return grid.mapping.grid_stored_1d_from_sub_grid_1d(sub_grid_1d=deflections)
 
+    @property
+    def critical_curves(self):
+        """The tangential and radial critical curves of the tracer, which are computed on its *calculation_grid* the \
+        first time they are used and then stored by the tracer, whose mass model does not change. They are shared by \
+        every plot of a visualization, which requests them many times.
+
+        The eigen values of the lensing Jacobian are computed on a grid *critical_curves_coarse_factor* times coarser \
+        than the calculation grid and only refined to its resolution near their sign changes (see \
+        *lens_util.critical_curves_from_deflections_func_and_grid*), such that far fewer multi-plane deflection angles \
+        are computed than for the whole calculation grid."""
+
+        if self._critical_curves is None:
+            self._critical_curves = lens_util.critical_curves_from_deflections_func_and_grid(
+                deflections_func=self.deflections_from_grid,
+                grid=self.calculation_grid,
+                coarse_factor=self.critical_curves_coarse_factor,
+            )
+
+        return self._critical_curves
+
+    @property
+    def tangential_critical_curve(self):
+        return self.critical_curves[0]
+
+    @property
+    def radial_critical_curve(self):
+        return self.critical_curves[1]
+
+    @property
+    def caustics(self):
+        """The tangential and radial caustics of the tracer, which are its critical curves traced to the source \
+        plane and are stored by the tracer the first time they are used."""
+
+        if self._caustics is None:
+            self._caustics = [
+                critical_curve - self.deflections_from_grid(grid=critical_curve)
+                if len(critical_curve) > 0
+                else []
+                for critical_curve in self.critical_curves
+            ]
+
+        return self._caustics
+
+    @property
+    def tangential_caustic(self):
+        return self.caustics[0]
+
+    @property
+    def radial_caustic(self):
+        return self.caustics[1]
+
     def grid_at_redshift_from_grid_and_redshift(self, grid, redshift):
         """For an input grid of (y,x) arc-second image-plane coordinates, ray-trace the coordinates to any redshift in \
         the strong lens configuration.
@@ -430,15 +880,20 @@ class AbstractTracerLensing(AbstractTracerCosmology, ABC):
             if redshift < plane_redshift:
                 plane_index_insert = plane_index
 
-        planes = self.planes
+        planes = list(self.planes)
         planes.insert(
             plane_index_insert,
             pl.Plane(redshift=redshift, galaxies=[], cosmology=self.cosmology),
         )
 
-        tracer = Tracer(planes=planes, cosmology=self.cosmology)
+        tracer = Tracer(
+            planes=planes,
+            cosmology=self.cosmology,
+            pixel_scale_interpolation_grid=self.pixel_scale_interpolation_grid,
+            interpolation_accuracy=self.interpolation_accuracy,
+        )
 
-        return tracer.traced_grids_of_planes_from_grid(grid=grid)[plane_index_insert]
+        return tracer._traced_grids_of_planes_from_grid(grid=grid)[plane_index_insert]
 
     def image_plane_multiple_image_positions_of_galaxies(self, grid):
         return [
@@ -455,7 +910,7 @@ class AbstractTracerLensing(AbstractTracerCosmology, ABC):
         if grid.sub_size > 1:
             grid = grid.in_1d_binned
 
-        source_plane_grid = self.traced_grids_of_planes_from_grid(grid=grid)[-1]
+        source_plane_grid = self._traced_grids_of_planes_from_grid(grid=grid)[-1]
 
         source_plane_squared_distances = source_plane_grid.squared_distances_from_coordinate(
             coordinate=source_plane_coordinate
@@ -515,6 +970,93 @@ class AbstractTracerLensing(AbstractTracerCosmology, ABC):
 
 
 class AbstractTracerData(AbstractTracerLensing, ABC):
+    def profile_images_of_planes_from_grid_and_blurring_grid(self, grid, blurring_grid):
+        """Compute the profile image of every plane on a grid and its blurring grid, returning the images of every \
+        plane on the grid and the images of every plane on the blurring grid.
+
+        The grid and blurring grid are traced through the planes together and each plane's light profiles are \
+        evaluated once, on the plane's traced joint grid (see \
+        *traced_joint_grids_of_planes_from_grid_and_blurring_grid*), which is then split into the image and \
+        blurring image of the plane.
+
+        The images of the last grid and blurring grid input are stored by the tracer, such that the summed blurred \
+        image and blurred images of every plane (e.g. the model image and model images of planes of a fit) are \
+        computed from the same evaluation of the light profiles.
+
+        Parameters
+        ----------
+        grid : aa.Grid
+            The image-plane grid the images are computed on.
+        blurring_grid : aa.Grid
+            The image-plane blurring grid of the grid, which the blurring images are computed on.
+        """
+        cached = self._profile_images_cache
+
+        if cached is not None and cached[0] is grid and cached[1] is blurring_grid:
+            return list(cached[2]), list(cached[3])
+
+        traced_joint_grids = self.traced_joint_grids_of_planes_from_grid_and_blurring_grid(
+            grid=grid,
+            blurring_grid=blurring_grid,
+            plane_index_limit=self.upper_plane_index_with_light_profile,
+        )
+
+        total_grid_pixels = grid.shape[0]
+
+        profile_images_of_planes = []
+        blurring_images_of_planes = []
+
+        for plane_index in range(self.total_planes):
+
+            if plane_index < len(traced_joint_grids):
+                joint_profile_image = np.asarray(
+                    self.planes[plane_index].profile_image_from_grid(
+                        grid=traced_joint_grids[plane_index]
+                    )
+                )
+            else:
+                joint_profile_image = np.zeros(
+                    shape=(total_grid_pixels + blurring_grid.shape[0],)
+                )
+
+            profile_images_of_planes.append(
+                grid.mapping.array_stored_1d_from_sub_array_1d(
+                    sub_array_1d=joint_profile_image[:total_grid_pixels]
+                )
+            )
+            blurring_images_of_planes.append(
+                blurring_grid.mapping.array_stored_1d_from_sub_array_1d(
+                    sub_array_1d=joint_profile_image[total_grid_pixels:]
+                )
+            )
+
+        self._profile_images_cache = (
+            grid,
+            blurring_grid,
+            profile_images_of_planes,
+            blurring_images_of_planes,
+        )
+
+        return list(profile_images_of_planes), list(blurring_images_of_planes)
+
+    def profile_image_and_blurring_image_from_grid_and_blurring_grid(
+        self, grid, blurring_grid
+    ):
+        """The summed profile image of all planes on a grid and its blurring grid (see \
+        *profile_images_of_planes_from_grid_and_blurring_grid*)."""
+        profile_images_of_planes, blurring_images_of_planes = self.profile_images_of_planes_from_grid_and_blurring_grid(
+            grid=grid, blurring_grid=blurring_grid
+        )
+
+        return (
+            grid.mapping.array_stored_1d_from_sub_array_1d(
+                sub_array_1d=sum(profile_images_of_planes)
+            ),
+            blurring_grid.mapping.array_stored_1d_from_sub_array_1d(
+                sub_array_1d=sum(blurring_images_of_planes)
+            ),
+        )
+
     def blurred_profile_image_from_grid_and_psf(self, grid, psf, blurring_grid):
         """Extract the 1D image and 1D blurring image of every plane and blur each with the \
         PSF using a psf (see imaging.convolution).
@@ -527,9 +1069,9 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
             Class which performs the PSF convolution of a masked image in 1D.
         """
 
-        profile_image = self.profile_image_from_grid(grid=grid)
-
-        blurring_image = self.profile_image_from_grid(grid=blurring_grid)
+        profile_image, blurring_image = self.profile_image_and_blurring_image_from_grid_and_blurring_grid(
+            grid=grid, blurring_grid=blurring_grid
+        )
 
         return psf.convolved_array_from_array_2d_and_mask(
             array_2d=profile_image.in_2d_binned + blurring_image.in_2d_binned,
@@ -550,18 +1092,18 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
             Class which performs the PSF convolution of a masked image in 1D.
         """
 
-        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(grid=grid)
-        traced_blurring_grids_of_planes = self.traced_grids_of_planes_from_grid(
-            grid=blurring_grid
+        profile_images_of_planes, blurring_images_of_planes = self.profile_images_of_planes_from_grid_and_blurring_grid(
+            grid=grid, blurring_grid=blurring_grid
         )
 
         return [
-            plane.blurred_profile_image_from_grid_and_psf(
-                grid=traced_grids_of_planes[plane_index],
-                psf=psf,
-                blurring_grid=traced_blurring_grids_of_planes[plane_index],
+            psf.convolved_array_from_array_2d_and_mask(
+                array_2d=profile_image.in_2d_binned + blurring_image.in_2d_binned,
+                mask=grid.mask,
+            )
+            for profile_image, blurring_image in zip(
+                profile_images_of_planes, blurring_images_of_planes
             )
-            for (plane_index, plane) in enumerate(self.planes)
         ]
 
     def blurred_profile_image_from_grid_and_convolver(
@@ -578,9 +1120,9 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
             Class which performs the PSF convolution of a masked image in 1D.
         """
 
-        profile_image = self.profile_image_from_grid(grid=grid)
-
-        blurring_image = self.profile_image_from_grid(grid=blurring_grid)
+        profile_image, blurring_image = self.profile_image_and_blurring_image_from_grid_and_blurring_grid(
+            grid=grid, blurring_grid=blurring_grid
+        )
 
         return convolver.convolved_image_from_image_and_blurring_image(
             image=profile_image, blurring_image=blurring_image
@@ -600,18 +1142,17 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
             Class which performs the PSF convolution of a masked image in 1D.
         """
 
-        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(grid=grid)
-        traced_blurring_grids_of_planes = self.traced_grids_of_planes_from_grid(
-            grid=blurring_grid
+        profile_images_of_planes, blurring_images_of_planes = self.profile_images_of_planes_from_grid_and_blurring_grid(
+            grid=grid, blurring_grid=blurring_grid
         )
 
         return [
-            plane.blurred_profile_image_from_grid_and_convolver(
-                grid=traced_grids_of_planes[plane_index],
-                convolver=convolver,
-                blurring_grid=traced_blurring_grids_of_planes[plane_index],
+            convolver.convolved_image_from_image_and_blurring_image(
+                image=profile_image, blurring_image=blurring_image
+            )
+            for profile_image, blurring_image in zip(
+                profile_images_of_planes, blurring_images_of_planes
             )
-            for (plane_index, plane) in enumerate(self.planes)
         ]
 
     def unmasked_blurred_profile_image_from_grid_and_psf(self, grid, psf):
@@ -628,7 +1169,7 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
 
         padded_grid = grid.padded_grid_from_kernel_shape(kernel_shape_2d=psf.shape_2d)
 
-        traced_padded_grids = self.traced_grids_of_planes_from_grid(grid=padded_grid)
+        traced_padded_grids = self._traced_grids_of_planes_from_grid(grid=padded_grid)
 
         unmasked_blurred_profile_images_of_planes = []
 
@@ -651,7 +1192,7 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
 
         padded_grid = grid.padded_grid_from_kernel_shape(kernel_shape_2d=psf.shape_2d)
 
-        traced_padded_grids = self.traced_grids_of_planes_from_grid(grid=padded_grid)
+        traced_padded_grids = self._traced_grids_of_planes_from_grid(grid=padded_grid)
 
         for plane, traced_padded_grid in zip(self.planes, traced_padded_grids):
             padded_image_1d_of_galaxies = plane.profile_images_of_galaxies_from_grid(
@@ -678,17 +1219,21 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
     def profile_visibilities_from_grid_and_transformer(self, grid, transformer):
 
         profile_image = self.profile_image_from_grid(grid=grid)
+
         return transformer.visibilities_from_image(image=profile_image)
 
     def profile_visibilities_of_planes_from_grid_and_transformer(
         self, grid, transformer
     ):
+        """The visibilities of the profile image of every plane, where the images of all planes are transformed \
+        together in one batched transform (see \
+        *visibilities_util.visibilities_of_images_from_images_and_transformer*)."""
 
         profile_images_1d_of_planes = self.profile_images_of_planes_from_grid(grid=grid)
-        return [
-            transformer.visibilities_from_image(image=profile_image_1d)
-            for profile_image_1d in profile_images_1d_of_planes
-        ]
+
+        return visibilities_util.visibilities_of_images_from_images_and_transformer(
+            images=profile_images_1d_of_planes, transformer=transformer
+        )
 
     def sparse_image_plane_grids_of_planes_from_grid(self, grid):
 
@@ -745,9 +1290,22 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
             if not plane.has_pixelization:
                 mappers_of_planes.append(None)
             else:
+
+                traced_grid = traced_grids_of_planes[plane_index]
+                traced_sparse_grid = traced_sparse_grids_of_planes[plane_index]
+
+                # Border relocation moves the grid's coordinates in-place, so the traced grids stored by the tracer
+                # are copied before being relocated.
+
+                if inversion_uses_border:
+                    traced_grid = traced_grid.copy()
+
+                    if traced_sparse_grid is not None:
+                        traced_sparse_grid = traced_sparse_grid.copy()
+
                 mapper = plane.mapper_from_grid_and_sparse_grid(
-                    grid=traced_grids_of_planes[plane_index],
-                    sparse_grid=traced_sparse_grids_of_planes[plane_index],
+                    grid=traced_grid,
+                    sparse_grid=traced_sparse_grid,
                     inversion_uses_border=inversion_uses_border,
                 )
                 mappers_of_planes.append(mapper)
@@ -762,14 +1320,30 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
         convolver,
         inversion_uses_border=False,
         preload_sparse_grids_of_planes=None,
+        inversion_uses_sparse_matrices=False,
     ):
+        """The inversion of the image by the pixelization of the tracer's last plane.
 
+        If *inversion_uses_sparse_matrices* is *True*, the mapping, blurred mapping and curvature matrices of the \
+        inversion are sparse matrices (see *inversions.InversionImagingSparse*), as opposed to the dense matrices of \
+        an *InversionImaging*.
+        """
         mappers_of_planes = self.mappers_of_planes_from_grid(
             grid=grid,
             inversion_uses_border=inversion_uses_border,
             preload_sparse_grids_of_planes=preload_sparse_grids_of_planes,
         )
 
+        if inversion_uses_sparse_matrices:
+
+            return inversions.InversionImagingSparse.from_data_mapper_and_regularization(
+                image=image,
+                noise_map=noise_map,
+                convolver=convolver,
+                mapper=mappers_of_planes[-1],
+                regularization=self.regularizations_of_planes[-1],
+            )
+
         return inv.InversionImaging.from_data_mapper_and_regularization(
             image=image,
             noise_map=noise_map,
@@ -786,13 +1360,33 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
         transformer,
         inversion_uses_border=False,
         preload_sparse_grids_of_planes=None,
+        w_tilde=None,
+        dirty_image=None,
     ):
+        """The inversion of the visibilities by the pixelization of the tracer's last plane.
+
+        If the W-tilde matrix of the dataset and the dirty image of the visibilities are input, the curvature matrix \
+        and data vector of the inversion are computed from them via sparse products with the mapping matrix (see \
+        *inversions.InversionInterferometerWTilde*), as opposed to transforming every column of the mapping matrix.
+        """
         mappers_of_planes = self.mappers_of_planes_from_grid(
             grid=grid,
             inversion_uses_border=inversion_uses_border,
             preload_sparse_grids_of_planes=preload_sparse_grids_of_planes,
         )
 
+        if w_tilde is not None:
+
+            return inversions.InversionInterferometerWTilde.from_data_mapper_and_regularization(
+                visibilities=visibilities,
+                noise_map=noise_map,
+                transformer=transformer,
+                mapper=mappers_of_planes[-1],
+                regularization=self.regularizations_of_planes[-1],
+                w_tilde=w_tilde,
+                dirty_image=dirty_image,
+            )
+
         return inv.InversionInterferometer.from_data_mapper_and_regularization(
             visibilities=visibilities,
             noise_map=noise_map,
@@ -820,7 +1414,7 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
 
         galaxy_profile_image_dict = dict()
 
-        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(grid=grid)
+        traced_grids_of_planes = self._traced_grids_of_planes_from_grid(grid=grid)
 
         for (plane_index, plane) in enumerate(self.planes):
             profile_images_of_galaxies = plane.profile_images_of_galaxies_from_grid(
@@ -842,22 +1436,29 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
 
         galaxy_blurred_profile_image_dict = dict()
 
-        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(grid=grid)
-
-        traced_blurring_grids_of_planes = self.traced_grids_of_planes_from_grid(
-            grid=blurring_grid
+        traced_joint_grids = self.traced_joint_grids_of_planes_from_grid_and_blurring_grid(
+            grid=grid, blurring_grid=blurring_grid
         )
 
+        total_grid_pixels = grid.shape[0]
+
         for (plane_index, plane) in enumerate(self.planes):
-            blurred_profile_images_of_galaxies = plane.blurred_profile_images_of_galaxies_from_grid_and_convolver(
-                grid=traced_grids_of_planes[plane_index],
-                convolver=convolver,
-                blurring_grid=traced_blurring_grids_of_planes[plane_index],
-            )
-            for (galaxy_index, galaxy) in enumerate(plane.galaxies):
+            for galaxy in plane.galaxies:
+
+                joint_profile_image = np.asarray(
+                    galaxy.profile_image_from_grid(grid=traced_joint_grids[plane_index])
+                )
+
                 galaxy_blurred_profile_image_dict[
                     galaxy
-                ] = blurred_profile_images_of_galaxies[galaxy_index]
+                ] = convolver.convolved_image_from_image_and_blurring_image(
+                    image=grid.mapping.array_stored_1d_from_sub_array_1d(
+                        sub_array_1d=joint_profile_image[:total_grid_pixels]
+                    ),
+                    blurring_image=blurring_grid.mapping.array_stored_1d_from_sub_array_1d(
+                        sub_array_1d=joint_profile_image[total_grid_pixels:]
+                    ),
+                )
 
         return galaxy_blurred_profile_image_dict
 
@@ -865,28 +1466,41 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
         self, grid, transformer
     ) -> {g.Galaxy: np.ndarray}:
         """
-        A dictionary associating galaxies with their corresponding model images
+        A dictionary associating galaxies with their corresponding model visibilities, where the profile images \
+        of the galaxies of all planes are transformed together in one batched transform (see \
+        *visibilities_util.visibilities_of_images_from_images_and_transformer*).
         """
 
-        galaxy_profile_visibilities_image_dict = dict()
+        traced_grids_of_planes = self._traced_grids_of_planes_from_grid(grid=grid)
 
-        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(grid=grid)
+        galaxies = []
+        profile_images_of_galaxies = []
 
         for (plane_index, plane) in enumerate(self.planes):
-            profile_visibilities_of_galaxies = plane.profile_visibilities_of_galaxies_from_grid_and_transformer(
-                grid=traced_grids_of_planes[plane_index], transformer=transformer
-            )
-            for (galaxy_index, galaxy) in enumerate(plane.galaxies):
-                galaxy_profile_visibilities_image_dict[
-                    galaxy
-                ] = profile_visibilities_of_galaxies[galaxy_index]
+            for galaxy in plane.galaxies:
+                galaxies.append(galaxy)
+                profile_images_of_galaxies.append(
+                    galaxy.profile_image_from_grid(
+                        grid=traced_grids_of_planes[plane_index]
+                    )
+                )
+
+        profile_visibilities_of_galaxies = visibilities_util.visibilities_of_images_from_images_and_transformer(
+            images=profile_images_of_galaxies, transformer=transformer
+        )
 
-        return galaxy_profile_visibilities_image_dict
+        return dict(zip(galaxies, profile_visibilities_of_galaxies))
 
 
 class Tracer(AbstractTracerData):
     @classmethod
-    def from_galaxies(cls, galaxies, cosmology=cosmo.Planck15):
+    def from_galaxies(
+        cls,
+        galaxies,
+        cosmology=cosmo.Planck15,
+        pixel_scale_interpolation_grid=None,
+        interpolation_accuracy=None,
+    ):
 
         plane_redshifts = lens_util.ordered_plane_redshifts_from_galaxies(
             galaxies=galaxies
@@ -903,7 +1517,12 @@ class Tracer(AbstractTracerData):
                 pl.Plane(galaxies=galaxies_in_planes[plane_index], cosmology=cosmology)
             )
 
-        return Tracer(planes=planes, cosmology=cosmology)
+        return Tracer(
+            planes=planes,
+            cosmology=cosmology,
+            pixel_scale_interpolation_grid=pixel_scale_interpolation_grid,
+            interpolation_accuracy=interpolation_accuracy,
+        )
 
     @classmethod
     def sliced_tracer_from_lens_line_of_sight_and_source_galaxies(
@@ -913,6 +1532,7 @@ class Tracer(AbstractTracerData):
         source_galaxies,
         planes_between_lenses,
         cosmology=cosmo.Planck15,
+        line_of_sight_truncation_radius=None,
     ):
 
         """Ray-tracer for a lens system with any number of planes.
@@ -940,6 +1560,11 @@ class Tracer(AbstractTracerData):
             source-plane borders.
         cosmology : astropy.cosmology
             The cosmology of the ray-tracing calculation.
+        line_of_sight_truncation_radius : float or None
+            If input, the convergence, potential and deflection angles of every mass profile of the line-of-sight \
+            galaxies are only computed on the coordinates within this arc-second radius of its centre, and are zero \
+            beyond it. This is a setting of the planes (see *Plane.truncation_radii_of_galaxies*), such that the \
+            galaxies and their profiles are not changed.
         """
 
         lens_redshifts = lens_util.ordered_plane_redshifts_from_galaxies(
@@ -963,12 +1588,213 @@ class Tracer(AbstractTracerData):
         planes = []
 
         for plane_index in range(0, len(plane_redshifts)):
+
+            if line_of_sight_truncation_radius is None:
+                truncation_radii_of_galaxies = None
+            else:
+                truncation_radii_of_galaxies = [
+                    line_of_sight_truncation_radius
+                    if any(
+                        [
+                            galaxy is line_of_sight_galaxy
+                            for line_of_sight_galaxy in line_of_sight_galaxies
+                        ]
+                    )
+                    else None
+                    for galaxy in galaxies_in_planes[plane_index]
+                ]
+
             planes.append(
                 pl.Plane(
                     redshift=plane_redshifts[plane_index],
                     galaxies=galaxies_in_planes[plane_index],
                     cosmology=cosmology,
+                    truncation_radii_of_galaxies=truncation_radii_of_galaxies,
                 )
             )
 
         return Tracer(planes=planes, cosmology=cosmology)
+
+    @classmethod
+    def traced_grids_of_planes_of_tracers_from_grid(cls, tracers, grid):
+        """Trace a grid of (y,x) arc-second image-plane coordinates through every plane of many tracers at once, \
+        for example the tracers of the model instances proposed together by the walkers of an ensemble sampler.
+
+        The tracers must have the same plane redshifts and cosmology (but their galaxies and profiles can have \
+        different parameters). The multi-plane ray-tracing of every plane is then performed on arrays of shape \
+        [total_tracers, total_grid_pixels, 2], which are returned as a list with one entry per plane.
+
+        The deflection angles of each plane are computed for all tracers together (see \
+        *plane_util.deflections_stack_of_galaxies_of_planes_from_grids*), where the mass profiles of every tracer \
+        with a vectorised deflection calculation are evaluated in one pass over the stack of traced grids. Any other \
+        mass profile is evaluated on its own tracer's traced grid.
+
+        The traced grids and deflection angles of every tracer are stored by that tracer (see \
+        *traced_grids_of_planes_from_grid*), such that a subsequent fit of each tracer to the grid reuses them.
+
+        If any tracer interpolates its deflection angles (see *pixel_scale_interpolation_grid*) or the grid has an \
+        interpolator, each tracer traces the grid separately and the results are stacked.
+
+        Parameters
+        ----------
+        tracers : [Tracer]
+            The tracers the grid is traced through, which all have the same plane redshifts and cosmology.
+        grid : aa.Grid
+            The image-plane grid which is traced through the planes.
+        """
+        traced_grids, traced_deflections = cls.traced_grids_and_deflections_of_planes_of_tracers_from_grid(
+            tracers=tracers, grid=grid
+        )
+
+        return traced_grids
+
+    @classmethod
+    def traced_deflections_of_planes_of_tracers_from_grid(cls, tracers, grid):
+        """The deflection angles of every plane of many tracers, computed on the traced grids of that plane and \
+        returned as a list of arrays of shape [total_tracers, total_grid_pixels, 2] (see \
+        *traced_grids_of_planes_of_tracers_from_grid*)."""
+        traced_grids, traced_deflections = cls.traced_grids_and_deflections_of_planes_of_tracers_from_grid(
+            tracers=tracers, grid=grid
+        )
+
+        return traced_deflections
+
+    @classmethod
+    def profile_images_of_tracers_from_grid(cls, tracers, grid):
+        """The profile image of many tracers, returned as an array of shape [total_tracers, total_image_pixels], \
+        where the grid is traced through all tracers at once (see *traced_grids_of_planes_of_tracers_from_grid*) and \
+        the light profiles of each tracer are then evaluated on its stored traced grids."""
+        cls.traced_grids_and_deflections_of_planes_of_tracers_from_grid(
+            tracers=tracers, grid=grid
+        )
+
+        return np.stack(
+            [tracer.profile_image_from_grid(grid=grid) for tracer in tracers]
+        )
+
+    @classmethod
+    def traced_grids_and_deflections_of_planes_of_tracers_from_grid(cls, tracers, grid):
+
+        tracer = tracers[0]
+
+        if not all(
+            [
+                other_tracer.plane_redshifts == tracer.plane_redshifts
+                and repr(other_tracer.cosmology) == repr(tracer.cosmology)
+                for other_tracer in tracers
+            ]
+        ):
+            raise exc.RayTracingException(
+                "Tracers with different plane redshifts or cosmologies were input to a batched ray-tracing "
+                "calculation. The tracers cannot therefore be traced together."
+            )
+
+        if getattr(grid, "interpolator", None) is not None or any(
+            [
+                other_tracer.pixel_scale_interpolation_grid is not None
+                for other_tracer in tracers
+            ]
+        ):
+            traced_grids_and_deflections = [
+                other_tracer.traced_grids_and_deflections_of_planes_from_grid(grid=grid)
+                for other_tracer in tracers
+            ]
+
+            return (
+                [
+                    np.stack(
+                        [
+                            traced_grids[plane_index]
+                            for traced_grids, _ in traced_grids_and_deflections
+                        ]
+                    )
+                    for plane_index in range(tracer.total_planes)
+                ],
+                [
+                    np.stack(
+                        [
+                            traced_deflections[plane_index]
+                            for _, traced_deflections in traced_grids_and_deflections
+                        ]
+                    )
+                    for plane_index in range(tracer.total_planes)
+                ],
+            )
+
+        stack_shape = (len(tracers),) + grid.shape
+
+        traced_grids = []
+        traced_deflections = []
+        scaled_deflections = None
+
+        for plane_index in range(tracer.total_planes):
+
+            traced_grid_stack = np.empty(shape=stack_shape)
+            traced_grid_stack[:] = grid
+
+            for previous_plane_index in range(plane_index):
+
+                if scaled_deflections is None:
+                    scaled_deflections = np.empty(shape=stack_shape)
+
+                np.multiply(
+                    traced_deflections[previous_plane_index],
+                    tracer.scaling_factors_between_planes[
+                        previous_plane_index, plane_index
+                    ],
+                    out=scaled_deflections,
+                )
+
+                traced_grid_stack -= scaled_deflections
+
+            traced_grids.append(traced_grid_stack)
+
+            traced_deflections.append(
+                plane_util.deflections_stack_of_galaxies_of_planes_from_grids(
+                    galaxies_of_planes=[
+                        other_tracer.planes[plane_index].galaxies
+                        for other_tracer in tracers
+                    ],
+                    grids=[
+                        cls.grid_of_tracer_from_grid_and_grid_stack(
+                            grid=grid,
+                            grid_stack=traced_grid_stack,
+                            tracer_index=tracer_index,
+                        )
+                        for tracer_index in range(len(tracers))
+                    ],
+                    truncation_radii_of_galaxies_of_planes=[
+                        other_tracer.planes[plane_index].truncation_radii_of_galaxies
+                        for other_tracer in tracers
+                    ],
+                )
+            )
+
+        for tracer_index, other_tracer in enumerate(tracers):
+            other_tracer.cache_traced_grids_and_deflections(
+                grid=grid,
+                traced_grids=[
+                    cls.grid_of_tracer_from_grid_and_grid_stack(
+                        grid=grid,
+                        grid_stack=traced_grid_stack,
+                        tracer_index=tracer_index,
+                    )
+                    for traced_grid_stack in traced_grids
+                ],
+                traced_deflections=[
+                    grid.mapping.grid_stored_1d_from_sub_grid_1d(
+                        sub_grid_1d=traced_deflections_stack[tracer_index]
+                    )
+                    for traced_deflections_stack in traced_deflections
+                ],
+            )
+
+        return traced_grids, traced_deflections
+
+    @staticmethod
+    def grid_of_tracer_from_grid_and_grid_stack(grid, grid_stack, tracer_index):
+        """The traced grid of one tracer in a batched ray-tracing calculation, which shares memory with the stack of \
+        traced grids and has the same type and attributes (mask, interpolator, etc.) as a copy of the input grid."""
+        return AbstractTracerLensing.grid_view_from_grid_and_array(
+            grid=grid, array=grid_stack[tracer_index]
+        )
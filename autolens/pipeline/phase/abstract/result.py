@@ -1,7 +1,31 @@
+from functools import wraps
+
 import autofit as af
 from autoastro.galaxy import galaxy as g
 
 
+def cached_property(func):
+    """Decorate a method of a result as a property which is computed the first time it is accessed and then taken from \
+    the result's cache, which is emptied by *Result.invalidate_cache*.
+
+    Parameters
+    ----------
+    func : (Result) -> object
+        A method of a result computing e.g. its most likely fit, which depends only on the result's instance and \
+        analysis.
+    """
+
+    @wraps(func)
+    def wrapper(self):
+
+        if func.__name__ not in self._cache:
+            self._cache[func.__name__] = func(self)
+
+        return self._cache[func.__name__]
+
+    return property(wrapper)
+
+
 class Result(af.Result):
     def __init__(
         self,
@@ -27,7 +51,23 @@ class Result(af.Result):
         self.optimizer = optimizer
         self.use_as_hyper_dataset = use_as_hyper_dataset
 
-    @property
+        self._cache = {}
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_cache"] = {}
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._cache = {}
+
+    def invalidate_cache(self):
+        """Empty the result's cache of its most likely tracer, fit and galaxy images, such that they are recomputed the \
+        next time they are accessed (e.g. after changing the result's instance or analysis)."""
+        self._cache = {}
+
+    @cached_property
     def most_likely_tracer(self):
         return self.analysis.tracer_for_instance(instance=self.instance)
 
@@ -1,6 +1,14 @@
+import collections
+
+import numpy as np
+
 import autofit as af
+from autofit.exc import FitException
 from autoastro.galaxy import galaxy as g
+from autolens import exc
 from autolens.lens import ray_tracing
+from autolens.pipeline import visualizer as vis
+from autolens.util import profiling_util
 
 
 def last_result_with_use_as_hyper_dataset(results):
@@ -11,10 +19,45 @@ def last_result_with_use_as_hyper_dataset(results):
                 return result
 
 
+def fit_cache_key_from_instance(instance):
+    """The key of an instance in an analysis's cache of fits, which is made of the path and value of every parameter \
+    (float, int or tuple) of the instance, and is therefore the same for any two instances of the same parameter vector.
+
+    The ids autofit gives every object of the instance are not parameters and so are omitted, whereas arrays (e.g. the \
+    hyper images associated with galaxies) are fixed for the analysis and so are not searched."""
+    return tuple(
+        (path, value)
+        for path, value in instance.path_instance_tuples_for_class(
+            cls=(float, int, tuple), ignore_class=np.ndarray
+        )
+        if path[-1] not in ("id", "component_number", "item_number")
+    )
+
+
+def stage_timings_setting():
+    try:
+        return af.conf.instance.general.get("profiling", "stage_timings", bool)
+    except Exception:
+        return False
+
+
 class Analysis(af.Analysis):
+
+    fit_cache_size = 5
+
     def __init__(self, cosmology, results):
 
         self.cosmology = cosmology
+        self._background_visualizer = None
+        self._fit_cache = collections.OrderedDict()
+        self._last_fit = None
+
+        self.total_positions_checks = 0
+        self.total_positions_rejections = 0
+
+        self.stage_timer = (
+            profiling_util.StageTimer() if stage_timings_setting() else None
+        )
 
         result = last_result_with_use_as_hyper_dataset(results=results)
 
@@ -28,6 +71,103 @@ class Analysis(af.Analysis):
             self.hyper_galaxy_image_path_dict = None
             self.hyper_model_image = None
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_background_visualizer"] = None
+        state["_fit_cache"] = collections.OrderedDict()
+        state["_last_fit"] = None
+        return state
+
+    @property
+    def background_visualizer(self):
+        """The background visualizer which visualizes instances in a worker process when the visualize general config \
+        setting *visualize_in_background* is True, which is created the first time it is used."""
+        if self._background_visualizer is None:
+            self._background_visualizer = vis.BackgroundVisualizer(analysis=self)
+
+        return self._background_visualizer
+
+    def visualize(self, instance, during_analysis):
+        """Visualize an instance (e.g. the best-fit instance of the non-linear search), either directly or by handing \
+        a snapshot of it to the background visualizer, such that the non-linear search continues while it renders.
+
+        The final visualization after the non-linear search is always performed directly, once the background \
+        visualizer has finished, so that it is never overwritten by a stale instance."""
+
+        if during_analysis and self.visualizer.visualize_in_background:
+            self.background_visualizer.submit(
+                instance=instance, during_analysis=during_analysis
+            )
+        else:
+            self.close_background_visualizer()
+            self.visualize_instance(instance=instance, during_analysis=during_analysis)
+
+    def visualize_instance(self, instance, during_analysis):
+        raise NotImplementedError()
+
+    def close_background_visualizer(self):
+        """Wait for the background visualizer to finish the last instance submitted to it and shut it down, if it has \
+        been created."""
+        if self._background_visualizer is not None:
+            self._background_visualizer.close()
+            self._background_visualizer = None
+
+    def check_positions_trace_within_threshold_via_tracer(self, tracer):
+        """Check that the positions of the masked dataset trace within the positions threshold (see \
+        *AbstractLensMasked.check_positions_trace_within_threshold_via_tracer*), counting the models which are checked \
+        and rejected such that the rejection rate of the positions check can be output after the phase."""
+
+        if (
+            self.masked_dataset.positions is None
+            or self.masked_dataset.positions_threshold is None
+        ):
+            return
+
+        self.total_positions_checks += 1
+
+        try:
+            self.masked_dataset.check_positions_trace_within_threshold_via_tracer(
+                tracer=tracer
+            )
+        except exc.RayTracingException:
+            self.total_positions_rejections += 1
+            raise
+
+    @property
+    def positions_rejection_rate(self):
+        """The fraction of models rejected by the positions check, or None if no models have been checked."""
+        if self.total_positions_checks == 0:
+            return None
+
+        return self.total_positions_rejections / self.total_positions_checks
+
+    def output_positions_rejection_rate(self, file_path):
+        """Output the number of models checked and rejected by the positions check to a file, if any were checked."""
+
+        if self.positions_rejection_rate is None:
+            return
+
+        with open(file_path, "w") as positions_info:
+            positions_info.write(
+                "Positions Checks = {} \n".format(self.total_positions_checks)
+            )
+            positions_info.write(
+                "Positions Rejections = {} \n".format(self.total_positions_rejections)
+            )
+            positions_info.write(
+                "Positions Rejection Rate = {} \n".format(self.positions_rejection_rate)
+            )
+
+    def output_stage_timings(self, file_path):
+        """Output the total time and number of calls of every stage of the analysis's fits (the tracer, positions \
+        check, profile image, blurring convolution or Fourier transform, inversion and likelihood) to a \
+        file, if the general config setting *stage_timings* of the [profiling] section is True."""
+
+        if self.stage_timer is None or len(self.stage_timer.times) == 0:
+            return
+
+        self.stage_timer.output_to_file(file_path=file_path)
+
     def hyper_image_sky_for_instance(self, instance):
 
         if hasattr(instance, "hyper_image_sky"):
@@ -47,6 +187,133 @@ class Analysis(af.Analysis):
             galaxies=instance.galaxies, cosmology=self.cosmology
         )
 
+    def fit_batch(self, instances):
+        """
+        Determine the fit of many model instances to the masked dataset at once, for example the instances proposed \
+        together by the walkers of an ensemble sampler.
+
+        The tracers of all instances which pass the position and inversion pixel checks are ray-traced together \
+        (see *Tracer.traced_grids_of_planes_of_tracers_from_grid*), where tracers are grouped by their plane \
+        redshifts. Each tracer is then fitted reusing its traced grids.
+
+        Parameters
+        ----------
+        instances : [af.ModelInstance]
+            The model instances which are fitted.
+
+        Returns
+        -------
+        figures_of_merit : np.ndarray
+            The figure of merit of every instance, which is -np.inf for an instance whose fit raised a FitException \
+            (matching how the non-linear searches treat the fit of a single instance).
+        """
+
+        figures_of_merit = np.full(shape=len(instances), fill_value=-np.inf)
+
+        tracers = {}
+
+        for instance_index, instance in enumerate(instances):
+
+            tracer = self.tracer_for_instance(instance=instance)
+
+            try:
+                self.check_positions_trace_within_threshold_via_tracer(tracer=tracer)
+                self.associate_hyper_images(instance=instance)
+                self.masked_dataset.check_inversion_pixels_are_below_limit_via_tracer(
+                    tracer=tracer
+                )
+            except FitException:
+                continue
+
+            tracers[instance_index] = tracer
+
+        tracers_of_plane_redshifts = {}
+
+        for tracer in tracers.values():
+            tracers_of_plane_redshifts.setdefault(
+                tuple(tracer.plane_redshifts), []
+            ).append(tracer)
+
+        for tracers_with_plane_redshifts in tracers_of_plane_redshifts.values():
+            ray_tracing.Tracer.traced_grids_of_planes_of_tracers_from_grid(
+                tracers=tracers_with_plane_redshifts, grid=self.masked_dataset.grid
+            )
+
+        with profiling_util.activate(self.stage_timer):
+
+            for instance_index, tracer in tracers.items():
+
+                try:
+                    figures_of_merit[
+                        instance_index
+                    ] = self.figure_of_merit_for_instance_and_tracer(
+                        instance=instances[instance_index], tracer=tracer
+                    )
+                except FitException:
+                    pass
+
+        return figures_of_merit
+
+    def figure_of_merit_for_instance_and_tracer(self, instance, tracer):
+        raise NotImplementedError()
+
+    def masked_dataset_fit_for_instance_and_tracer(self, instance, tracer):
+        raise NotImplementedError()
+
+    def store_last_fit_of_instance(self, instance, fit):
+        """Store the fit of the instance most recently fitted by *fit*, replacing the previous one, such that a \
+        visualization of the same instance (which the non-linear search performs immediately after fitting a new \
+        best-fit instance) reuses it.
+
+        This is called for every likelihood evaluation, so the instance is stored by reference and matched by \
+        identity, without computing its key in the cache of fits (see *fit_cache_key_from_instance*)."""
+        self._last_fit = (instance, fit)
+
+    def cache_fit_of_instance(self, instance, fit):
+        """Store the fit of an instance in the analysis's cache of the *fit_cache_size* most recent fits used for \
+        visualization and results, removing the least recently used fit if the cache is full."""
+
+        self._fit_cache[fit_cache_key_from_instance(instance=instance)] = fit
+
+        while len(self._fit_cache) > self.fit_cache_size:
+            self._fit_cache.popitem(last=False)
+
+    def masked_dataset_fit_for_instance(self, instance):
+        """
+        The fit of an instance to the masked dataset for visualization and results, such that its tracer and \
+        inversion are not recomputed if it has been fitted already.
+
+        The fit is reused if the instance is the one most recently fitted by *fit* (e.g. the best-fit instance, \
+        which the non-linear search visualizes immediately after fitting it), or if the instance's parameter vector \
+        is in the analysis's cache of fits for visualization and results (e.g. the most likely instance of a result, \
+        which was visualized at the end of the non-linear search).
+
+        Parameters
+        ----------
+        instance : af.ModelInstance
+            The model instance which is fitted.
+        """
+
+        key = fit_cache_key_from_instance(instance=instance)
+
+        if key in self._fit_cache:
+            self._fit_cache.move_to_end(key)
+            return self._fit_cache[key]
+
+        if self._last_fit is not None and self._last_fit[0] is instance:
+            fit = self._last_fit[1]
+        else:
+            instance = self.associate_hyper_images(instance=instance)
+            tracer = self.tracer_for_instance(instance=instance)
+
+            fit = self.masked_dataset_fit_for_instance_and_tracer(
+                instance=instance, tracer=tracer
+            )
+
+        self.cache_fit_of_instance(instance=instance, fit=fit)
+
+        return fit
+
     def associate_hyper_images(self, instance: af.ModelInstance) -> af.ModelInstance:
         """
         Takes images from the last result, if there is one, and associates them with galaxies in this phase
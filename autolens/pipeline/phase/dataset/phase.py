@@ -5,6 +5,7 @@ import autoarray as aa
 from autofit.tools.phase import Dataset
 from autolens.pipeline.phase import abstract
 from autolens.pipeline.phase import extensions
+from autolens.pipeline.phase.dataset import analysis as analysis_dataset
 from autolens.pipeline.phase.dataset.result import Result
 
 
@@ -84,6 +85,19 @@ class PhaseDataset(abstract.AbstractPhase):
 
         result = self.run_analysis(analysis)
 
+        if isinstance(analysis, analysis_dataset.Analysis):
+            analysis.close_background_visualizer()
+            analysis.output_positions_rejection_rate(
+                file_path="{}/{}".format(
+                    self.optimizer.paths.phase_output_path, "positions.info"
+                )
+            )
+            analysis.output_stage_timings(
+                file_path="{}/{}".format(
+                    self.optimizer.paths.phase_output_path, "timings.info"
+                )
+            )
+
         return self.make_result(result=result, analysis=analysis)
 
     def make_analysis(self, dataset, mask, results=None, positions=None):
@@ -1,23 +1,22 @@
 from autolens.pipeline.phase import abstract
+from autolens.pipeline.phase.abstract.result import cached_property
 
 
 class Result(abstract.result.Result):
-    @property
+    @cached_property
     def most_likely_fit(self):
+        return self.analysis.masked_dataset_fit_for_instance(instance=self.instance)
 
-        hyper_image_sky = self.analysis.hyper_image_sky_for_instance(
-            instance=self.instance
-        )
+    def galaxy_of_most_likely_fit(self, galaxy):
+        """The galaxy of the most likely fit's tracer with the same parameters as a galaxy of the result's instance.
 
-        hyper_background_noise = self.analysis.hyper_background_noise_for_instance(
-            instance=self.instance
-        )
+        The fit may be taken from the analysis's cache of fits, having been computed for a different instance of the \
+        same parameters, in which case its galaxies (the keys of its galaxy image dictionaries) are different objects."""
+        for fit_galaxy in self.most_likely_fit.tracer.galaxies:
+            if fit_galaxy == galaxy:
+                return fit_galaxy
 
-        return self.analysis.masked_imaging_fit_for_tracer(
-            tracer=self.most_likely_tracer,
-            hyper_image_sky=hyper_image_sky,
-            hyper_background_noise=hyper_background_noise,
-        )
+        return galaxy
 
     @property
     def mask(self):
@@ -187,6 +187,9 @@ class HyperGalaxyPhase(HyperPhase):
                 imaging.PhaseImaging, phase
             ).meta_dataset.inversion_uses_border,
             preload_sparse_grids_of_planes=None,
+            inversion_uses_sparse_matrices=cast(
+                imaging.PhaseImaging, phase
+            ).meta_dataset.inversion_uses_sparse_matrices,
         )
 
         hyper_result = copy.deepcopy(results.last)
@@ -34,6 +34,7 @@ class PhaseImaging(dataset.PhaseDataset):
         pixel_scale_interpolation_grid=None,
         inversion_uses_border=True,
         inversion_pixel_limit=None,
+        inversion_uses_sparse_matrices=False,
     ):
 
         """
@@ -47,6 +48,10 @@ class PhaseImaging(dataset.PhaseDataset):
             The class of a non_linear optimizer
         sub_size: int
             The side length of the subgrid
+        inversion_uses_sparse_matrices: bool
+            If *True*, the mapping, blurred mapping and curvature matrices of the inversion of every fit are sparse \
+            matrices, which gives the same reconstruction as the dense matrices for less memory and time when the \
+            source-plane pixelization has many pixels (see *MaskedImaging*).
         """
 
         phase_tag = tagging.phase_tag_from_phase_settings(
@@ -81,6 +86,7 @@ class PhaseImaging(dataset.PhaseDataset):
             pixel_scale_interpolation_grid=pixel_scale_interpolation_grid,
             inversion_uses_border=inversion_uses_border,
             inversion_pixel_limit=inversion_pixel_limit,
+            inversion_uses_sparse_matrices=inversion_uses_sparse_matrices,
         )
 
     # noinspection PyMethodMayBeStatic,PyUnusedLocal
@@ -4,6 +4,7 @@ from autoastro.galaxy import galaxy as g
 from autofit.exc import FitException
 from autolens.fit import fit
 from autolens.pipeline import visualizer
+from autolens.util import profiling_util
 from autolens.pipeline.phase.dataset import analysis as analysis_data
 
 
@@ -57,29 +58,50 @@ class Analysis(analysis_data.Analysis):
             A fractional value indicating how well this model fit and the model masked_interferometer itself
         """
 
-        self.associate_hyper_images(instance=instance)
-        tracer = self.tracer_for_instance(instance=instance)
+        with profiling_util.activate(self.stage_timer), profiling_util.stage("fit"):
 
-        self.masked_dataset.check_positions_trace_within_threshold_via_tracer(
-            tracer=tracer
-        )
-        self.masked_dataset.check_inversion_pixels_are_below_limit_via_tracer(
-            tracer=tracer
-        )
+            with profiling_util.stage("tracer"):
+                tracer = self.tracer_for_instance(instance=instance)
 
-        hyper_background_noise = self.hyper_background_noise_for_instance(
-            instance=instance
-        )
+            with profiling_util.stage("positions_check"):
+                self.check_positions_trace_within_threshold_via_tracer(tracer=tracer)
+
+            self.associate_hyper_images(instance=instance)
+
+            self.masked_dataset.check_inversion_pixels_are_below_limit_via_tracer(
+                tracer=tracer
+            )
+
+            return self.figure_of_merit_for_instance_and_tracer(
+                instance=instance, tracer=tracer
+            )
+
+    def figure_of_merit_for_instance_and_tracer(self, instance, tracer):
 
         try:
-            fit = self.masked_interferometer_fit_for_tracer(
-                tracer=tracer, hyper_background_noise=hyper_background_noise
+            fit = self.masked_dataset_fit_for_instance_and_tracer(
+                instance=instance, tracer=tracer
             )
 
-            return fit.figure_of_merit
+            with profiling_util.stage("likelihood"):
+                figure_of_merit = fit.figure_of_merit
         except InversionException as e:
             raise FitException from e
 
+        self.store_last_fit_of_instance(instance=instance, fit=fit)
+
+        return figure_of_merit
+
+    def masked_dataset_fit_for_instance_and_tracer(self, instance, tracer):
+
+        hyper_background_noise = self.hyper_background_noise_for_instance(
+            instance=instance
+        )
+
+        return self.masked_interferometer_fit_for_tracer(
+            tracer=tracer, hyper_background_noise=hyper_background_noise
+        )
+
     def associate_hyper_visibilities(
         self, instance: af.ModelInstance
     ) -> af.ModelInstance:
@@ -126,17 +148,10 @@ class Analysis(analysis_data.Analysis):
             hyper_background_noise=hyper_background_noise,
         )
 
-    def visualize(self, instance, during_analysis):
+    def visualize_instance(self, instance, during_analysis):
 
-        self.associate_hyper_images(instance=instance)
-        tracer = self.tracer_for_instance(instance=instance)
-        hyper_background_noise = self.hyper_background_noise_for_instance(
-            instance=instance
-        )
-
-        fit = self.masked_interferometer_fit_for_tracer(
-            tracer=tracer, hyper_background_noise=hyper_background_noise
-        )
+        fit = self.masked_dataset_fit_for_instance(instance=instance)
+        tracer = fit.tracer
 
         visualizer = self.visualizer.new_visualizer_with_preloaded_critical_curves_and_caustics(
             preloaded_critical_curves=tracer.critical_curves,
@@ -1,3 +1,4 @@
+from autoarray.operators import transformer
 from autolens.dataset import dataset as d
 from autolens.pipeline.phase.dataset import meta_dataset
 
@@ -15,6 +16,9 @@ class MetaInterferometer(meta_dataset.MetaDataset):
         inversion_pixel_limit=None,
         primary_beam_shape_2d=None,
         bin_up_factor=None,
+        transformer_class=transformer.Transformer,
+        uv_cell_size=None,
+        inversion_uses_w_tilde=False,
     ):
         super().__init__(
             model=model,
@@ -28,6 +32,9 @@ class MetaInterferometer(meta_dataset.MetaDataset):
         self.real_space_mask = real_space_mask
         self.primary_beam_shape_2d = primary_beam_shape_2d
         self.bin_up_factor = bin_up_factor
+        self.transformer_class = transformer_class
+        self.uv_cell_size = uv_cell_size
+        self.inversion_uses_w_tilde = inversion_uses_w_tilde
 
     def masked_dataset_from(
         self, dataset, mask, positions, results, modified_visibilities
@@ -56,6 +63,9 @@ class MetaInterferometer(meta_dataset.MetaDataset):
             inversion_pixel_limit=self.inversion_pixel_limit,
             inversion_uses_border=self.inversion_uses_border,
             preload_sparse_grids_of_planes=preload_sparse_grids_of_planes,
+            transformer_class=self.transformer_class,
+            uv_cell_size=self.uv_cell_size,
+            inversion_uses_w_tilde=self.inversion_uses_w_tilde,
         )
 
         return masked_interferometer
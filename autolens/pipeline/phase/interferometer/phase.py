@@ -1,6 +1,7 @@
 from astropy import cosmology as cosmo
 
 import autofit as af
+from autoarray.operators import transformer
 from autolens.pipeline import tagging
 from autolens.pipeline.phase import dataset
 from autolens.pipeline.phase.interferometer.analysis import Analysis
@@ -34,6 +35,9 @@ class PhaseInterferometer(dataset.PhaseDataset):
         pixel_scale_interpolation_grid=None,
         inversion_uses_border=True,
         inversion_pixel_limit=None,
+        transformer_class=transformer.Transformer,
+        uv_cell_size=None,
+        inversion_uses_w_tilde=False,
     ):
 
         """
@@ -47,6 +51,17 @@ class PhaseInterferometer(dataset.PhaseDataset):
             The class of a non_linear optimizer
         sub_size: int
             The side length of the subgrid
+        transformer_class: class
+            The class of the transformer which computes the visibilities of model images, either the direct Fourier \
+            transform of the *Transformer* or the non-uniform FFT of the *TransformerNUFFT*, which is much faster \
+            for large numbers of visibilities but is accurate to a tolerance (see *TransformerNUFFT*).
+        uv_cell_size: float or None
+            If input, the visibilities are compressed by averaging them in cells of the uv-plane of this size (in \
+            wavelengths) before the non-linear search (see *MaskedInterferometer*).
+        inversion_uses_w_tilde: bool
+            If *True*, the W-tilde matrix of the real-space mask is computed once before the non-linear search, such \
+            that the inversion of every fit uses sparse products with the mapping matrix as opposed to transforming \
+            it (see *MaskedInterferometer*).
         """
 
         paths.phase_tag = tagging.phase_tag_from_phase_settings(
@@ -56,6 +71,8 @@ class PhaseInterferometer(dataset.PhaseDataset):
             primary_beam_shape_2d=primary_beam_shape_2d,
             positions_threshold=positions_threshold,
             pixel_scale_interpolation_grid=pixel_scale_interpolation_grid,
+            transformer_class=transformer_class,
+            uv_cell_size=uv_cell_size,
         )
 
         super().__init__(
@@ -78,6 +95,9 @@ class PhaseInterferometer(dataset.PhaseDataset):
             pixel_scale_interpolation_grid=pixel_scale_interpolation_grid,
             inversion_uses_border=inversion_uses_border,
             inversion_pixel_limit=inversion_pixel_limit,
+            transformer_class=transformer_class,
+            uv_cell_size=uv_cell_size,
+            inversion_uses_w_tilde=inversion_uses_w_tilde,
         )
 
     # noinspection PyMethodMayBeStatic,PyUnusedLocal
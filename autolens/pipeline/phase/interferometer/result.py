@@ -4,21 +4,10 @@ import autofit as af
 import autoarray as aa
 from autoastro.galaxy import galaxy as g
 from autolens.pipeline.phase import dataset
+from autolens.pipeline.phase.abstract.result import cached_property
 
 
 class Result(dataset.Result):
-    @property
-    def most_likely_fit(self):
-
-        hyper_background_noise = self.analysis.hyper_background_noise_for_instance(
-            instance=self.instance
-        )
-
-        return self.analysis.masked_interferometer_fit_for_tracer(
-            tracer=self.most_likely_tracer,
-            hyper_background_noise=hyper_background_noise,
-        )
-
     @property
     def real_space_mask(self):
         return self.most_likely_fit.masked_interferometer.real_space_mask
@@ -48,9 +37,11 @@ class Result(dataset.Result):
         ndarray or None
             A numpy arrays giving the model visibilities of that galaxy
         """
-        return self.most_likely_fit.galaxy_model_visibilities_dict[galaxy]
+        return self.most_likely_fit.galaxy_model_visibilities_dict[
+            self.galaxy_of_most_likely_fit(galaxy=galaxy)
+        ]
 
-    @property
+    @cached_property
     def visibilities_galaxy_dict(self) -> {str: g.Galaxy}:
         """
         A dictionary associating galaxy names with model visibilities of those galaxies
@@ -60,7 +51,7 @@ class Result(dataset.Result):
             for galaxy_path, galaxy in self.path_galaxy_tuples
         }
 
-    @property
+    @cached_property
     def hyper_galaxy_visibilities_path_dict(self):
         """
         A dictionary associating 1D hyper_galaxies galaxy visibilities with their names.
@@ -76,7 +67,7 @@ class Result(dataset.Result):
 
         return hyper_galaxy_visibilities_path_dict
 
-    @property
+    @cached_property
     def hyper_model_visibilities(self):
 
         hyper_model_visibilities = aa.visibilities.zeros(
@@ -100,9 +91,11 @@ class Result(dataset.Result):
         ndarray or None
             A numpy arrays giving the model image of that galaxy
         """
-        return self.most_likely_fit.galaxy_model_image_dict[galaxy]
+        return self.most_likely_fit.galaxy_model_image_dict[
+            self.galaxy_of_most_likely_fit(galaxy=galaxy)
+        ]
 
-    @property
+    @cached_property
     def image_galaxy_dict(self) -> {str: g.Galaxy}:
         """
         A dictionary associating galaxy names with model images of those galaxies
@@ -112,7 +105,7 @@ class Result(dataset.Result):
             for galaxy_path, galaxy in self.path_galaxy_tuples
         }
 
-    @property
+    @cached_property
     def hyper_galaxy_image_path_dict(self):
         """
         A dictionary associating 1D hyper_galaxies galaxy images with their names.
@@ -126,7 +119,7 @@ class Result(dataset.Result):
 
         for path, galaxy in self.path_galaxy_tuples:
 
-            galaxy_image = self.image_galaxy_dict[path]
+            galaxy_image = self.image_galaxy_dict[path].copy()
 
             if not np.all(galaxy_image == 0):
                 minimum_galaxy_value = hyper_minimum_percent * max(galaxy_image)
@@ -136,7 +129,7 @@ class Result(dataset.Result):
 
         return hyper_galaxy_image_path_dict
 
-    @property
+    @cached_property
     def hyper_model_image(self):
 
         hyper_model_image = aa.masked_array.zeros(mask=self.real_space_mask.mask_sub_1)
@@ -1,3 +1,6 @@
+from autolens.dataset import transformer
+
+
 def phase_tag_from_phase_settings(
     sub_size,
     signal_to_noise_limit=None,
@@ -8,6 +11,8 @@ def phase_tag_from_phase_settings(
     pixel_scale_interpolation_grid=None,
     real_space_shape_2d=None,
     real_space_pixel_scales=None,
+    transformer_class=None,
+    uv_cell_size=None,
 ):
 
     sub_size_tag = sub_size_tag_from_sub_size(sub_size=sub_size)
@@ -35,6 +40,10 @@ def phase_tag_from_phase_settings(
     real_space_pixel_scales_tag = real_space_pixel_scales_tag_from_real_space_pixel_scales(
         real_space_pixel_scales=real_space_pixel_scales
     )
+    transformer_tag = transformer_tag_from_transformer_class(
+        transformer_class=transformer_class
+    )
+    uv_cell_size_tag = uv_cell_size_tag_from_uv_cell_size(uv_cell_size=uv_cell_size)
 
     return (
         "phase_tag"
@@ -47,6 +56,8 @@ def phase_tag_from_phase_settings(
         + primary_beam_shape_tag
         + positions_threshold_tag
         + pixel_scale_interpolation_grid_tag
+        + transformer_tag
+        + uv_cell_size_tag
     )
 
 
@@ -194,3 +205,35 @@ def real_space_pixel_scales_tag_from_real_space_pixel_scales(real_space_pixel_sc
     y = "{0:.2f}".format(real_space_pixel_scales[0])
     x = "{0:.2f}".format(real_space_pixel_scales[1])
     return "__rs_pix_" + y + "x" + x
+
+
+def transformer_tag_from_transformer_class(transformer_class):
+    """Generate a transformer tag, to customize phase names based on the transformer used to compute the \
+    visibilities of model images.
+
+    This changes the phase name 'phase_name' as follows:
+
+    transformer_class = None -> phase_name
+    transformer_class = Transformer -> phase_name
+    transformer_class = TransformerNUFFT -> phase_name__nufft
+    """
+    if transformer_class is transformer.TransformerNUFFT:
+        return "__nufft"
+    else:
+        return ""
+
+
+def uv_cell_size_tag_from_uv_cell_size(uv_cell_size):
+    """Generate a uv cell size tag, to customize phase names based on the size of the uv-plane cells the visibilities \
+    are compressed into.
+
+    This changes the phase name 'phase_name' as follows:
+
+    uv_cell_size = None -> phase_name
+    uv_cell_size = 100.0 -> phase_name__uv_cell_100.0
+    uv_cell_size = 2500.0 -> phase_name__uv_cell_2500.0
+    """
+    if uv_cell_size is None:
+        return ""
+    else:
+        return "__uv_cell_{0:.1f}".format(uv_cell_size)
@@ -1,3 +1,8 @@
+import copy
+import logging
+import multiprocessing
+import queue
+
 import autoarray as aa
 import autofit as af
 from autoarray.plot import mat_objs
@@ -10,13 +15,21 @@ from autolens.plot import (
     fit_interferometer_plots,
     inversion_plots,
 )
-import copy
+
+logger = logging.getLogger(__name__)
 
 
 def setting(section, name):
     return af.conf.instance.visualize_plots.get(section, name, bool)
 
 
+def general_setting(name):
+    try:
+        return af.conf.instance.visualize_general.get("general", name, bool)
+    except Exception:
+        return False
+
+
 def plot_setting(section, name):
     return setting(section, name)
 
@@ -111,6 +124,8 @@ class PhaseDatasetVisualizer(AbstractVisualizer):
         super().__init__(image_path)
         self.masked_dataset = masked_dataset
 
+        self.visualize_in_background = general_setting("visualize_in_background")
+
         self.plot_subplot_dataset = plot_setting("dataset", "subplot_dataset")
         self.plot_dataset_data = plot_setting("dataset", "data")
         self.plot_dataset_noise_map = plot_setting("dataset", "noise_map")
@@ -287,6 +302,74 @@ class PhaseDatasetVisualizer(AbstractVisualizer):
             )
 
 
+def visualize_jobs_in_worker(analysis, jobs):
+    """Visualize the jobs (pairs of an instance and *during_analysis*) of a background visualizer's queue with the \
+    analysis, in the background visualizer's worker process, until the job None is received."""
+
+    while True:
+
+        job = jobs.get()
+
+        if job is None:
+            break
+
+        instance, during_analysis = job
+
+        try:
+            analysis.visualize_instance(
+                instance=instance, during_analysis=during_analysis
+            )
+        except Exception:
+            logger.exception("Visualization in the background visualizer failed.")
+
+
+class BackgroundVisualizer:
+    def __init__(self, analysis):
+        """Visualizes the instances of an analysis (e.g. the best-fit instance of a non-linear search) in a worker \
+        process, such that rebuilding the tracer and fit, computing critical curves and caustics and rendering the \
+        figures does not stall the non-linear search.
+
+        The worker receives a copy of the analysis when it starts. The queue of jobs holds at most one instance, so if \
+        a newer instance is submitted before the worker starts the previous one, the stale instance is dropped.
+
+        Parameters
+        ----------
+        analysis : Analysis
+            The analysis whose *visualize_instance* method is called in the worker process.
+        """
+        self.jobs = multiprocessing.Queue(maxsize=1)
+
+        self.process = multiprocessing.Process(
+            target=visualize_jobs_in_worker, args=(analysis, self.jobs)
+        )
+        self.process.daemon = True
+        self.process.start()
+
+    def submit(self, instance, during_analysis):
+        """Submit a snapshot of an instance to the worker, dropping any instance it has not yet started."""
+
+        instance = copy.deepcopy(instance)
+
+        self.drop_stale_jobs()
+
+        self.jobs.put((instance, during_analysis))
+
+    def drop_stale_jobs(self):
+
+        while True:
+            try:
+                self.jobs.get_nowait()
+            except queue.Empty:
+                break
+
+    def close(self):
+        """Wait for the worker to visualize the last instance submitted and shut it down."""
+
+        if self.process.is_alive():
+            self.jobs.put(None)
+            self.process.join()
+
+
 class PhaseImagingVisualizer(PhaseDatasetVisualizer):
     def __init__(self, masked_dataset, image_path, results=None):
         super(PhaseImagingVisualizer, self).__init__(
@@ -11,3 +11,9 @@ from autoarray.util import inversion_util as inversion
 from autoarray.util import transformer_util as transformer
 from autoastro.util import cosmology_util as cosmology
 from autolens.util import lens_util as lens
+from autolens.util import profiling_util as profiling
+from autolens.util import plane_util as plane
+from autolens.util import nufft_util as nufft
+from autolens.util import visibilities_util as visibilities
+from autolens.util import w_tilde_util as w_tilde
+from autolens.util import sparse_inversion_util as sparse_inversion
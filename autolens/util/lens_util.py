@@ -1,8 +1,12 @@
+from autoarray.mask import mask as msk
 from autoarray.structures import grids
+from autoastro.util import cosmology_util
+from autolens import decorator_util
 from autolens import exc
 from autolens.lens import plane as pl
 
 import numpy as np
+from skimage import measure
 
 
 def plane_image_of_galaxies_from_grid(shape, grid, galaxies, buffer=1.0e-2):
@@ -27,6 +31,338 @@ def plane_image_of_galaxies_from_grid(shape, grid, galaxies, buffer=1.0e-2):
     return pl.PlaneImage(array=image, grid=grid)
 
 
+@decorator_util.jit()
+def max_separations_of_positions_from_positions_1d_and_sizes(positions_1d, sizes):
+    """Compute the maximum separation of every list of (y,x) positions, where all lists are stored in one 1D \
+    array of positions and the sizes give the number of positions in each list (in the order the lists are stored).
+
+    Parameters
+    ----------
+    positions_1d : ndarray
+        The (y,x) coordinates of the positions of every list, with shape [total_positions, 2].
+    sizes : ndarray
+        The number of positions in each list.
+    """
+
+    max_separations = np.zeros(sizes.shape[0])
+
+    list_index_start = 0
+
+    for list_index in range(sizes.shape[0]):
+
+        list_index_end = list_index_start + sizes[list_index]
+
+        max_separation_squared = 0.0
+
+        for i in range(list_index_start, list_index_end):
+            for j in range(i + 1, list_index_end):
+
+                y_separation = positions_1d[i, 0] - positions_1d[j, 0]
+                x_separation = positions_1d[i, 1] - positions_1d[j, 1]
+
+                separation_squared = (
+                    y_separation * y_separation + x_separation * x_separation
+                )
+
+                if separation_squared > max_separation_squared:
+                    max_separation_squared = separation_squared
+
+        max_separations[list_index] = np.sqrt(max_separation_squared)
+
+        list_index_start = list_index_end
+
+    return max_separations
+
+
+@decorator_util.jit()
+def positions_within_threshold_from_positions_1d_sizes_and_threshold(
+    positions_1d, sizes, threshold
+):
+    """Returns True if every pair of (y,x) positions in the same list are separated by no more than the threshold, \
+    where the lists are stored as for *max_separations_of_positions_from_positions_1d_and_sizes*.
+
+    Squared separations are compared to the squared threshold and the function returns False as soon as one pair of \
+    positions exceeds it, without computing the maximum separation of every list.
+    """
+
+    threshold_squared = threshold * threshold
+
+    list_index_start = 0
+
+    for list_index in range(sizes.shape[0]):
+
+        list_index_end = list_index_start + sizes[list_index]
+
+        for i in range(list_index_start, list_index_end):
+            for j in range(i + 1, list_index_end):
+
+                y_separation = positions_1d[i, 0] - positions_1d[j, 0]
+                x_separation = positions_1d[i, 1] - positions_1d[j, 1]
+
+                if (
+                    y_separation * y_separation + x_separation * x_separation
+                    > threshold_squared
+                ):
+                    return False
+
+        list_index_start = list_index_end
+
+    return True
+
+
+def array_binned_iterated_from_grid_func_and_fractional_accuracy(
+    grid, func, fractional_accuracy, sub_sizes=(1, 2, 4, 8)
+):
+    """Compute an array (e.g. a profile image) on a grid using an adaptive sub-grid, where every pixel is evaluated \
+    on sub-grids of increasing sub size until its binned value changes by less than a fractional accuracy between \
+    two successive sub sizes (or the final sub size is reached).
+
+    Only the pixels which have not yet met the fractional accuracy are evaluated at the next sub size, such that \
+    the high sub sizes needed where the array is steep (e.g. the centre of a Sersic profile) are not used \
+    everywhere else.
+
+    Parameters
+    ----------
+    grid : aa.Grid
+        The grid whose mask defines the pixels the array is computed on (its sub size is not used).
+    func : (aa.Grid) -> aa.Array
+        The function which computes the array on a sub-grid, returning its values on the sub-grid.
+    fractional_accuracy : float
+        The fractional change in a pixel's binned value between two successive sub sizes below which it is accepted.
+    sub_sizes : (int)
+        The sub sizes the unconverged pixels are evaluated at, in ascending order.
+
+    Returns
+    -------
+    aa.Array
+        The binned-up array (with a sub size of 1).
+    """
+
+    mask = grid.mask
+
+    mask_2d_index_for_mask_1d_index = mask.regions._mask_2d_index_for_mask_1d_index
+
+    iterate_indexes = np.arange(mask_2d_index_for_mask_1d_index.shape[0])
+
+    array_binned_1d = None
+
+    for sub_size in sub_sizes:
+
+        iterate_mask_2d = np.full(fill_value=True, shape=mask.shape)
+        iterate_mask_2d[
+            mask_2d_index_for_mask_1d_index[iterate_indexes, 0],
+            mask_2d_index_for_mask_1d_index[iterate_indexes, 1],
+        ] = False
+
+        iterate_grid = grids.Grid.from_mask(
+            mask=msk.Mask(
+                mask_2d=iterate_mask_2d,
+                pixel_scales=mask.pixel_scales,
+                sub_size=sub_size,
+                origin=mask.origin,
+            )
+        )
+
+        iterate_array_binned_1d = np.asarray(
+            iterate_grid.mapping.array_stored_1d_binned_from_sub_array_1d(
+                sub_array_1d=func(iterate_grid)
+            )
+        )
+
+        if array_binned_1d is None:
+            array_binned_1d = iterate_array_binned_1d
+            continue
+
+        converged = np.abs(
+            iterate_array_binned_1d - array_binned_1d[iterate_indexes]
+        ) <= fractional_accuracy * np.abs(iterate_array_binned_1d)
+
+        array_binned_1d[iterate_indexes] = iterate_array_binned_1d
+
+        iterate_indexes = iterate_indexes[~converged]
+
+        if iterate_indexes.shape[0] == 0:
+            break
+
+    return mask.mapping.mask_sub_1.mapping.array_stored_1d_from_sub_array_1d(
+        sub_array_1d=array_binned_1d
+    )
+
+
+def eigen_values_from_deflections_func_and_grid(deflections_func, grid, pixel_scales):
+    """Compute the tangential and radial eigen values of the lensing Jacobian at every (y,x) coordinate of a grid, \
+    using central differences of the deflection angles at the coordinates offset by one pixel in y and x.
+
+    At the coordinates of a uniform grid of these pixel scales, these are the eigen values computed by \
+    *LensingObject.tangential_eigen_value_from_grid* and *radial_eigen_value_from_grid* (which differentiate the \
+    deflection angles of the whole grid), but they can be computed at any subset of the grid's coordinates.
+
+    Parameters
+    ----------
+    deflections_func : (aa.GridIrregular) -> aa.GridIrregular
+        The function computing the deflection angles of the lens (e.g. a tracer's *deflections_from_grid*).
+    grid : ndarray
+        The (y,x) arc-second coordinates where the eigen values are computed, with shape [total_coordinates, 2].
+    pixel_scales : (float, float)
+        The (y,x) arc-second offsets used for the central differences.
+
+    Returns
+    -------
+    (ndarray, ndarray)
+        The tangential and radial eigen values at every coordinate.
+    """
+
+    grid = np.asarray(grid)
+
+    total_coordinates = grid.shape[0]
+
+    offset_y = np.array([pixel_scales[0], 0.0])
+    offset_x = np.array([0.0, pixel_scales[1]])
+
+    offset_grid = np.concatenate(
+        (grid + offset_y, grid - offset_y, grid + offset_x, grid - offset_x)
+    )
+
+    deflections = np.asarray(
+        deflections_func(grids.GridIrregular.manual_1d(grid=offset_grid))
+    ).reshape((4, total_coordinates, 2))
+
+    deflections_dy = (deflections[0] - deflections[1]) / (2.0 * pixel_scales[0])
+    deflections_dx = (deflections[2] - deflections[3]) / (2.0 * pixel_scales[1])
+
+    a11 = 1.0 - deflections_dx[:, 1]
+    a12 = -1.0 * deflections_dy[:, 1]
+    a21 = -1.0 * deflections_dx[:, 0]
+    a22 = 1.0 - deflections_dy[:, 0]
+
+    convergence = 1.0 - 0.5 * (a11 + a22)
+    shear = np.sqrt((0.5 * (a22 - a11)) ** 2 + (0.5 * (a12 + a21)) ** 2)
+
+    return 1.0 - convergence - shear, 1.0 - convergence + shear
+
+
+def critical_curves_from_deflections_func_and_grid(
+    deflections_func, grid, coarse_factor=4
+):
+    """Compute the tangential and radial critical curves of a lens on a uniform grid, by evaluating the eigen values \
+    of the lensing Jacobian on a coarse grid and refining them only near their sign changes.
+
+    The coarse grid is every *coarse_factor*'th coordinate of the grid in y and x. Each cell of the coarse grid \
+    whose corner eigen values change sign (together with its neighbouring cells) is refined by computing the eigen \
+    values at every coordinate of the grid inside it, whereas the eigen values of all other cells are bilinearly \
+    interpolated from their corners (and so do not change sign). The critical curves are the zero contours of the \
+    eigen values, found via marching squares.
+
+    A critical curve small enough to pass between the corners of a coarse cell without changing their signs (e.g. \
+    the radial critical curve of a very compact core) is missed, therefore the *coarse_factor* should be reduced for \
+    lenses with such features.
+
+    Parameters
+    ----------
+    deflections_func : (aa.GridIrregular) -> aa.GridIrregular
+        The function computing the deflection angles of the lens (e.g. a tracer's *deflections_from_grid*).
+    grid : aa.Grid
+        The uniform grid (e.g. a lens's *calculation_grid*) whose resolution the critical curves are computed at.
+    coarse_factor : int
+        The factor by which the coarse grid the eigen values are first computed on is coarser than the grid.
+
+    Returns
+    -------
+    [aa.GridIrregular or []]
+        The tangential and radial critical curves, where a critical curve which does not exist is an empty list.
+    """
+
+    grid_2d = np.asarray(grid.in_2d)
+
+    shape_2d = grid_2d.shape[0:2]
+
+    y_coarse = np.unique(
+        np.append(np.arange(0, shape_2d[0], coarse_factor), shape_2d[0] - 1)
+    )
+    x_coarse = np.unique(
+        np.append(np.arange(0, shape_2d[1], coarse_factor), shape_2d[1] - 1)
+    )
+
+    coarse_grid_2d = grid_2d[np.ix_(y_coarse, x_coarse)]
+
+    eigen_values_coarse = [
+        eigen_values.reshape(coarse_grid_2d.shape[0:2])
+        for eigen_values in eigen_values_from_deflections_func_and_grid(
+            deflections_func=deflections_func,
+            grid=coarse_grid_2d.reshape((-1, 2)),
+            pixel_scales=grid.pixel_scales,
+        )
+    ]
+
+    eigen_values_2d = []
+    refine_2d = np.full(fill_value=False, shape=shape_2d)
+
+    for eigen_values in eigen_values_coarse:
+
+        eigen_values_rows = np.array(
+            [np.interp(np.arange(shape_2d[1]), x_coarse, row) for row in eigen_values]
+        )
+
+        eigen_values_2d.append(
+            np.array(
+                [
+                    np.interp(np.arange(shape_2d[0]), y_coarse, column)
+                    for column in eigen_values_rows.T
+                ]
+            ).T
+        )
+
+        corners = np.stack(
+            (
+                eigen_values[:-1, :-1],
+                eigen_values[:-1, 1:],
+                eigen_values[1:, :-1],
+                eigen_values[1:, 1:],
+            )
+        )
+
+        sign_change = (np.min(corners, axis=0) <= 0.0) & (
+            np.max(corners, axis=0) >= 0.0
+        )
+
+        for y, x in np.argwhere(sign_change):
+            refine_2d[
+                y_coarse[max(y - 1, 0)] : y_coarse[min(y + 2, len(y_coarse) - 1)] + 1,
+                x_coarse[max(x - 1, 0)] : x_coarse[min(x + 2, len(x_coarse) - 1)] + 1,
+            ] = True
+
+    if np.any(refine_2d):
+
+        eigen_values_refined = eigen_values_from_deflections_func_and_grid(
+            deflections_func=deflections_func,
+            grid=grid_2d[refine_2d],
+            pixel_scales=grid.pixel_scales,
+        )
+
+        for eigen_values, eigen_values_refine in zip(
+            eigen_values_2d, eigen_values_refined
+        ):
+            eigen_values[refine_2d] = eigen_values_refine
+
+    critical_curves = []
+
+    for eigen_values in eigen_values_2d:
+
+        critical_curve_indices = measure.find_contours(eigen_values, 0)
+
+        if len(critical_curve_indices) == 0:
+            critical_curves.append([])
+            continue
+
+        critical_curve = grid.geometry.grid_scaled_from_grid_pixels_1d_for_marching_squares(
+            grid_pixels_1d=critical_curve_indices[0], shape_2d=shape_2d
+        )
+
+        critical_curves.append(grids.GridIrregular(grid=critical_curve))
+
+    return critical_curves
+
+
 def ordered_plane_redshifts_from_galaxies(galaxies):
     """Given a list of galaxies (with redshifts), return a list of the redshifts in ascending order.
 
@@ -130,3 +466,255 @@ def galaxies_in_redshift_ordered_planes_from_galaxies(galaxies, plane_redshifts)
         galaxies_in_redshift_ordered_planes[index].append(galaxy)
 
     return galaxies_in_redshift_ordered_planes
+
+
+def scaling_factors_between_planes_from_plane_redshifts_and_cosmology(
+    plane_redshifts, cosmology
+):
+    """Given the (ascending) redshifts of the planes of a multi-plane lens system, compute the matrix of \
+    scaling factors used to rescale the deflection angles of every plane when ray-tracing to every subsequent plane.
+
+    Entry [i, j] of the returned matrix is the factor by which the deflection angles of plane i are scaled when they \
+    are subtracted from the grid traced to plane j, with the final redshift taken as that of the last plane. This \
+    gives the same values as *cosmology_util.scaling_factor_between_redshifts_from_redshifts_and_cosmology*, but \
+    computes every angular diameter distance once, as opposed to four times per pair of planes.
+
+    Only entries where i < j are used by ray-tracing and computed; all other entries are NaN.
+
+    Parameters
+    -----------
+    plane_redshifts : [float]
+        The redshifts of the planes, in ascending order.
+    cosmology : astropy.cosmology
+        The cosmology of the ray-tracing calculation.
+    """
+    redshifts = np.asarray(plane_redshifts, dtype="float64")
+    total_planes = redshifts.shape[0]
+
+    scaling_factors = np.full((total_planes, total_planes), np.nan)
+
+    if total_planes < 2:
+        return scaling_factors
+
+    angular_diameter_distances_to_earth = (
+        cosmology.angular_diameter_distance(redshifts).to("kpc").value
+    )
+
+    plane_indexes_0, plane_indexes_1 = np.triu_indices(n=total_planes, k=1)
+
+    angular_diameter_distances_between_planes = np.zeros((total_planes, total_planes))
+    angular_diameter_distances_between_planes[plane_indexes_0, plane_indexes_1] = (
+        cosmology.angular_diameter_distance_z1z2(
+            redshifts[plane_indexes_0], redshifts[plane_indexes_1]
+        )
+        .to("kpc")
+        .value
+    )
+
+    scaling_factors[plane_indexes_0, plane_indexes_1] = (
+        angular_diameter_distances_between_planes[plane_indexes_0, plane_indexes_1]
+        * angular_diameter_distances_to_earth[-1]
+    ) / (
+        angular_diameter_distances_to_earth[plane_indexes_1]
+        * angular_diameter_distances_between_planes[plane_indexes_0, -1]
+    )
+
+    return scaling_factors
+
+
+class TracerCosmology:
+
+    instances = {}
+    max_instances = 100
+
+    def __init__(self, plane_redshifts, cosmology):
+        """The cosmological quantities of a set of plane redshifts (e.g. the scaling factors, angular diameter \
+        distances and critical surface densities between planes), which are computed once and reused by every \
+        tracer whose planes share these redshifts and cosmology.
+
+        The scaling-factor matrix used for multi-plane ray-tracing is computed on creation. Distances and critical \
+        surface densities depend on the units requested, so are computed the first time they are requested and \
+        stored thereafter.
+
+        Instances should be created via *from_plane_redshifts_and_cosmology*, so that they are shared between tracers.
+
+        Parameters
+        -----------
+        plane_redshifts : (float)
+            The redshifts of the planes, in ascending order.
+        cosmology : astropy.cosmology
+            The cosmology of the ray-tracing calculation.
+        """
+        self.plane_redshifts = plane_redshifts
+        self.cosmology = cosmology
+
+        self.scaling_factors = scaling_factors_between_planes_from_plane_redshifts_and_cosmology(
+            plane_redshifts=plane_redshifts, cosmology=cosmology
+        )
+
+        self.results = {}
+
+    @classmethod
+    def from_plane_redshifts_and_cosmology(cls, plane_redshifts, cosmology):
+        """Return the *TracerCosmology* of a set of plane redshifts and cosmology, reusing a previously computed \
+        instance if these redshifts and cosmology have been seen before.
+
+        Astropy cosmologies are not hashable, so the cosmology is keyed by its representation, which lists all of \
+        its parameters. The oldest instances are discarded once *max_instances* are stored, so that fits where a \
+        redshift is a free parameter do not grow memory without bound.
+        """
+        key = (tuple(plane_redshifts), repr(cosmology))
+
+        if key not in cls.instances:
+
+            if len(cls.instances) >= cls.max_instances:
+                del cls.instances[next(iter(cls.instances))]
+
+            cls.instances[key] = cls(
+                plane_redshifts=tuple(plane_redshifts), cosmology=cosmology
+            )
+
+        return cls.instances[key]
+
+    def result_from_key_and_func(self, key, func):
+
+        if key not in self.results:
+            self.results[key] = func()
+
+        return self.results[key]
+
+    def arcsec_per_kpc_proper_of_plane(self, i):
+        return self.result_from_key_and_func(
+            key=("arcsec_per_kpc_proper", i),
+            func=lambda: cosmology_util.arcsec_per_kpc_from_redshift_and_cosmology(
+                redshift=self.plane_redshifts[i], cosmology=self.cosmology
+            ),
+        )
+
+    def angular_diameter_distance_of_plane_to_earth_in_units(
+        self, i, unit_length="arcsec"
+    ):
+        return self.result_from_key_and_func(
+            key=("angular_diameter_distance_to_earth", i, unit_length),
+            func=lambda: cosmology_util.angular_diameter_distance_to_earth_from_redshift_and_cosmology(
+                redshift=self.plane_redshifts[i],
+                cosmology=self.cosmology,
+                unit_length=unit_length,
+            ),
+        )
+
+    def angular_diameter_distance_between_planes_in_units(
+        self, i, j, unit_length="arcsec"
+    ):
+        return self.result_from_key_and_func(
+            key=("angular_diameter_distance_between_planes", i, j, unit_length),
+            func=lambda: cosmology_util.angular_diameter_distance_between_redshifts_from_redshifts_and_cosmlology(
+                redshift_0=self.plane_redshifts[i],
+                redshift_1=self.plane_redshifts[j],
+                cosmology=self.cosmology,
+                unit_length=unit_length,
+            ),
+        )
+
+    def critical_surface_density_between_planes_in_units(
+        self, i, j, unit_length="arcsec", unit_mass="solMass"
+    ):
+        return self.result_from_key_and_func(
+            key=("critical_surface_density", i, j, unit_length, unit_mass),
+            func=lambda: cosmology_util.critical_surface_density_between_redshifts_from_redshifts_and_cosmology(
+                redshift_0=self.plane_redshifts[i],
+                redshift_1=self.plane_redshifts[j],
+                cosmology=self.cosmology,
+                unit_length=unit_length,
+                unit_mass=unit_mass,
+            ),
+        )
+
+    def scaling_factor_between_planes(self, i, j):
+
+        total_planes = len(self.plane_redshifts)
+
+        if i % total_planes < j % total_planes:
+            return self.scaling_factors[i, j]
+
+        return self.result_from_key_and_func(
+            key=("scaling_factor", i, j),
+            func=lambda: cosmology_util.scaling_factor_between_redshifts_from_redshifts_and_cosmology(
+                redshift_0=self.plane_redshifts[i],
+                redshift_1=self.plane_redshifts[j],
+                redshift_final=self.plane_redshifts[-1],
+                cosmology=self.cosmology,
+            ),
+        )
+
+
+class BilinearInterpolator:
+    def __init__(self, grid, pixel_scale_interpolation_grid):
+        """Interpolates quantities computed on a coarse uniform grid of (y,x) arc-second coordinates, which covers \
+        an input grid with a buffer of one pixel, to the coordinates of the input grid via bilinear interpolation.
+
+        The pixel and weight of every input coordinate on the interpolation grid are computed once, such that many \
+        quantities (e.g. the deflection angles of every plane of a tracer) can be interpolated cheaply.
+
+        Parameters
+        ----------
+        grid : ndarray or aa.Grid
+            The (y,x) coordinates quantities are interpolated to.
+        pixel_scale_interpolation_grid : float
+            The arc-second pixel scale of the interpolation grid.
+        """
+
+        grid = np.asarray(grid)
+
+        y_min, x_min = np.min(grid, axis=0) - pixel_scale_interpolation_grid
+        y_max, x_max = np.max(grid, axis=0) + pixel_scale_interpolation_grid
+
+        self.shape_2d = (
+            int(np.ceil((y_max - y_min) / pixel_scale_interpolation_grid)) + 1,
+            int(np.ceil((x_max - x_min) / pixel_scale_interpolation_grid)) + 1,
+        )
+
+        self.interp_grid = grids.Grid.uniform(
+            shape_2d=self.shape_2d,
+            pixel_scales=pixel_scale_interpolation_grid,
+            sub_size=1,
+            origin=((y_max + y_min) / 2.0, (x_max + x_min) / 2.0),
+        )
+
+        y_pixels = (
+            self.interp_grid[0, 0] - grid[:, 0]
+        ) / pixel_scale_interpolation_grid
+        x_pixels = (
+            grid[:, 1] - self.interp_grid[0, 1]
+        ) / pixel_scale_interpolation_grid
+
+        self.y_indexes = np.clip(
+            np.floor(y_pixels).astype("int"), 0, self.shape_2d[0] - 2
+        )
+        self.x_indexes = np.clip(
+            np.floor(x_pixels).astype("int"), 0, self.shape_2d[1] - 2
+        )
+
+        self.y_weights = y_pixels - self.y_indexes
+        self.x_weights = x_pixels - self.x_indexes
+
+    @property
+    def total_interp_pixels(self):
+        return self.shape_2d[0] * self.shape_2d[1]
+
+    def interpolated_values_from_values(self, values):
+        """Bilinearly interpolate values computed on the interpolation grid (e.g. an image or deflection angles, with \
+        shape [total_interp_pixels] or [total_interp_pixels, 2]) to the coordinates of the input grid."""
+
+        values_2d = np.asarray(values).reshape(self.shape_2d + np.shape(values)[1:])
+
+        y_weights = self.y_weights.reshape((-1,) + (1,) * (values_2d.ndim - 2))
+        x_weights = self.x_weights.reshape((-1,) + (1,) * (values_2d.ndim - 2))
+
+        return (1.0 - y_weights) * (
+            (1.0 - x_weights) * values_2d[self.y_indexes, self.x_indexes]
+            + x_weights * values_2d[self.y_indexes, self.x_indexes + 1]
+        ) + y_weights * (
+            (1.0 - x_weights) * values_2d[self.y_indexes + 1, self.x_indexes]
+            + x_weights * values_2d[self.y_indexes + 1, self.x_indexes + 1]
+        )
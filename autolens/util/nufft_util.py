@@ -0,0 +1,128 @@
+import numpy as np
+
+from autolens import decorator_util
+
+# The maximum number of images whose visibilities are computed by one non-uniform FFT, with stacks of more images
+# (e.g. the columns of a mapping matrix) transformed in chunks of this size to bound the memory of the padded grids.
+max_transformed_images = 32
+
+
+def kaiser_bessel_beta_from_kernel_width_and_oversampling_factor(
+    kernel_width, oversampling_factor
+):
+    """The shape parameter beta of the Kaiser-Bessel gridding kernel which minimizes the aliasing error of a \
+    non-uniform FFT for a kernel width (in cells of the oversampled grid) and oversampling factor, following \
+    Beatty, Nishimura & Pauly (2005)."""
+    return np.pi * np.sqrt(
+        (kernel_width / oversampling_factor) ** 2 * (oversampling_factor - 0.5) ** 2
+        - 0.8
+    )
+
+
+def kaiser_bessel_kernel_from_offsets(offsets, kernel_width, beta):
+    """The Kaiser-Bessel gridding kernel at offsets (in cells of the oversampled grid) from its centre, which is \
+    zero beyond half the kernel width."""
+
+    argument = 1.0 - (2.0 * offsets / kernel_width) ** 2
+
+    return np.where(
+        argument >= 0.0, np.i0(beta * np.sqrt(np.clip(argument, 0.0, None))), 0.0
+    )
+
+
+def kaiser_bessel_deapodization_from_indexes(indexes, grid_size, kernel_width, beta):
+    """The Fourier transform of the Kaiser-Bessel gridding kernel at the (centred) pixel indexes of an image which \
+    is padded to a grid of *grid_size* pixels, which image pixel values are divided by before the FFT to undo the \
+    apodization of the image by the kernel."""
+
+    z_squared = beta ** 2 - (np.pi * kernel_width * indexes / grid_size) ** 2
+    z = np.sqrt(np.abs(z_squared))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        deapodization = (
+            np.where(z_squared > 0.0, np.sinh(z) / z, np.sin(z) / z) * kernel_width
+        )
+
+    return np.where(z == 0.0, kernel_width, deapodization)
+
+
+def pixel_indexes_from_mask(mask):
+    """The (y,x) indexes of every unmasked pixel of a 2D mask in the 1D ordering of its arrays, relative to the \
+    bounding box of the unmasked pixels, and the shape of that bounding box."""
+
+    pixel_indexes = np.argwhere(~np.asarray(mask).astype("bool"))
+    pixel_indexes -= np.min(pixel_indexes, axis=0)
+
+    return pixel_indexes, tuple(np.max(pixel_indexes, axis=0) + 1)
+
+
+def grid_shape_from_image_shape_and_oversampling_factor(
+    image_shape, oversampling_factor, kernel_width
+):
+    """The shape of the oversampled grid an image is padded to before its FFT, which is even and at least twice \
+    the kernel width along each axis."""
+    return tuple(
+        int(max(2 * np.ceil(oversampling_factor * size / 2.0), 2 * kernel_width))
+        for size in image_shape
+    )
+
+
+def degridding_indexes_and_weights_from_frequencies(
+    frequencies, grid_size, kernel_width, beta
+):
+    """For frequencies (in cycles per image pixel) along one axis, the indexes of the *kernel_width* cells of the \
+    oversampled grid of *grid_size* cells nearest every frequency, wrapped periodically, and the weights of the \
+    Kaiser-Bessel kernel at these cells."""
+
+    grid_positions = grid_size * frequencies
+
+    first_indexes = np.floor(grid_positions - kernel_width / 2.0).astype("int") + 1
+
+    indexes = first_indexes[:, None] + np.arange(kernel_width)[None, :]
+
+    weights = kaiser_bessel_kernel_from_offsets(
+        offsets=grid_positions[:, None] - indexes, kernel_width=kernel_width, beta=beta
+    )
+
+    return np.mod(indexes, grid_size), weights
+
+
+@decorator_util.jit()
+def visibilities_from_gridded_visibilities_jit(
+    gridded_visibilities,
+    degridding_indexes_y,
+    degridding_weights_y,
+    degridding_indexes_x,
+    degridding_weights_x,
+):
+    """Interpolate the visibilities of a stack of images, gridded on the oversampled grid by the FFT with shape \
+    [grid_y, grid_x, total_images], to the uv-wavelengths using the degridding indexes and weights of each axis.
+
+    Returns an array of shape [total_visibilities, total_images]."""
+
+    total_visibilities = degridding_indexes_y.shape[0]
+    kernel_width = degridding_indexes_y.shape[1]
+    total_images = gridded_visibilities.shape[2]
+
+    visibilities = np.zeros(
+        shape=(total_visibilities, total_images), dtype=np.complex128
+    )
+
+    for vis_1d_index in range(total_visibilities):
+        for kernel_y_index in range(kernel_width):
+
+            grid_y_index = degridding_indexes_y[vis_1d_index, kernel_y_index]
+            weight_y = degridding_weights_y[vis_1d_index, kernel_y_index]
+
+            for kernel_x_index in range(kernel_width):
+
+                grid_x_index = degridding_indexes_x[vis_1d_index, kernel_x_index]
+                weight = weight_y * degridding_weights_x[vis_1d_index, kernel_x_index]
+
+                for image_index in range(total_images):
+                    visibilities[vis_1d_index, image_index] += (
+                        weight
+                        * gridded_visibilities[grid_y_index, grid_x_index, image_index]
+                    )
+
+    return visibilities
@@ -0,0 +1,609 @@
+import collections
+
+import numpy as np
+from scipy import spatial
+
+import autofit as af
+from autoarray.structures import grids
+from autoastro.galaxy import galaxy as g
+from autoastro.profiles.mass_profiles import dark_mass_profiles as dmp
+from autoastro.profiles.mass_profiles import total_mass_profiles as tmp
+
+# The maximum number of (profile, coordinate) pairs evaluated at once by a vectorised profile calculation, above which
+# the profiles of a group are evaluated in chunks, limiting the memory of the temporary [profiles, coordinates] arrays.
+max_vectorised_elements = 2 ** 22
+
+# The minimum number of profiles of one type for their calculation to be vectorised, below which each profile is
+# evaluated by its own method (for which a single profile has no overhead to remove).
+min_vectorised_profiles = 2
+
+
+def radial_minimum_from_profile_type(profile_type):
+    """The radial minimum of a profile type in the radial_minimum config, which coordinates closer to the profile's \
+    centre are moved to (see *autoastro.profiles.geometry_profiles.move_grid_to_radial_minimum*)."""
+    return af.conf.NamedConfig(
+        "{}/radial_minimum.ini".format(af.conf.instance.config_path)
+    ).get("radial_minimum", profile_type.__name__, float)
+
+
+def profile_coordinates_from_grid_centres_and_radial_minimum(
+    grid, centres, radial_minimum
+):
+    """Compute the (y,x) coordinates of a grid in the reference frame of many spherical profiles, returning the y \
+    and x coordinates and radii as arrays of shape [total_profiles, total_coordinates]. The grid is either one grid \
+    of shape [total_coordinates, 2] or the grid of every profile, of shape [total_profiles, total_coordinates, 2].
+
+    Coordinates within the radial minimum of a profile's centre are moved to it, as the profile's own calculation \
+    does."""
+
+    grid = np.asarray(grid)
+
+    y = grid[..., 0] - centres[:, 0, None]
+    x = grid[..., 1] - centres[:, 1, None]
+
+    with np.errstate(all="ignore"):
+        radii = np.sqrt(np.square(y) + np.square(x))
+        radial_scale = np.where(radii < radial_minimum, radial_minimum / radii, 1.0)
+
+    y *= radial_scale
+    x *= radial_scale
+    y[np.isnan(y)] = radial_minimum
+    x[np.isnan(x)] = radial_minimum
+
+    return y, x, np.sqrt(np.square(y) + np.square(x))
+
+
+def deflection_radii_of_spherical_isothermals(profiles, radii):
+    einstein_radii_rescaled = np.array(
+        [profile.einstein_radius_rescaled for profile in profiles]
+    )
+    return np.broadcast_to(2.0 * einstein_radii_rescaled[:, None], radii.shape)
+
+
+def deflection_radii_of_point_masses(profiles, radii):
+    einstein_radii = np.array([profile.einstein_radius for profile in profiles])
+    return np.square(einstein_radii)[:, None] / radii
+
+
+def deflection_radii_of_spherical_nfws(profiles, radii):
+    kappa_s = np.array([profile.kappa_s for profile in profiles])
+    scale_radii = np.array([profile.scale_radius for profile in profiles])
+    return (4.0 * kappa_s * scale_radii)[
+        :, None
+    ] * dmp.SphericalNFW.deflection_func_sph(eta=radii / scale_radii[:, None])
+
+
+# The mass profile types whose deflection angles are computed for many profiles at once, mapped to the function giving
+# the magnitude of every profile's (radial) deflection angle at the radii of the coordinates from its centre. Profiles
+# are looked up by their exact type, such that subclasses (which may override the deflection calculation) are
+# evaluated by their own method.
+vectorised_deflection_radii_funcs = {
+    tmp.SphericalIsothermal: deflection_radii_of_spherical_isothermals,
+    tmp.PointMass: deflection_radii_of_point_masses,
+    dmp.SphericalNFW: deflection_radii_of_spherical_nfws,
+}
+
+
+def profiles_of_galaxies_grouped_by_type(galaxies, profiles_of_galaxy):
+    """Group the profiles of galaxies by their type, in the order each type first appears.
+
+    Parameters
+    ----------
+    galaxies : [g.Galaxy]
+        The galaxies whose profiles are grouped.
+    profiles_of_galaxy : (g.Galaxy) -> [Profile]
+        The profiles of a galaxy which are grouped (e.g. its light or mass profiles).
+    """
+    profiles_of_types = collections.OrderedDict()
+
+    for galaxy in galaxies:
+        for profile in profiles_of_galaxy(galaxy):
+            profiles_of_types.setdefault(type(profile), []).append(profile)
+
+    return profiles_of_types
+
+
+def deflections_are_vectorised_for_grid(grid):
+    """Whether the deflection angles of profiles with a vectorised deflection calculation are computed together on \
+    a grid, which they are not if the grid has an interpolator (see *autoarray.structures.grids.grid_interpolate*), \
+    such that every profile's own (decorated) method is used."""
+    return getattr(grid, "interpolator", None) is None
+
+
+def untruncated_galaxies_and_truncated_mass_profiles_from_galaxies(
+    galaxies, truncation_radii_of_galaxies
+):
+    """Separate galaxies into those which are evaluated over the whole grid and the mass profiles of those with a \
+    truncation radius, which are only evaluated on the coordinates of the grid within this radius of their centre.
+
+    Returns the untruncated galaxies, the truncated mass profiles and the truncation radius of every truncated mass \
+    profile.
+
+    Parameters
+    ----------
+    galaxies : [g.Galaxy]
+        The galaxies which are separated.
+    truncation_radii_of_galaxies : [float or None] or None
+        The truncation radius of every galaxy (None if the galaxy is not truncated), or None if no galaxy is \
+        truncated.
+    """
+    if truncation_radii_of_galaxies is None:
+        return galaxies, [], []
+
+    untruncated_galaxies = []
+    truncated_profiles = []
+    truncation_radii = []
+
+    for galaxy, truncation_radius in zip(galaxies, truncation_radii_of_galaxies):
+        if truncation_radius is None:
+            untruncated_galaxies.append(galaxy)
+        else:
+            for profile in galaxy.mass_profiles:
+                truncated_profiles.append(profile)
+                truncation_radii.append(truncation_radius)
+
+    return untruncated_galaxies, truncated_profiles, truncation_radii
+
+
+def indexes_of_grid_within_truncation_radii_of_profiles(
+    grid, profiles, truncation_radii
+):
+    """The indexes of the coordinates of a grid within the truncation radius of the centre of every profile, \
+    returned as a list with one array of indexes per profile.
+
+    These coordinates are found using a k-d tree of the grid, which is built once for all profiles, such that the \
+    cost of each profile scales with the number of coordinates it influences rather than the size of the grid."""
+
+    tree = spatial.cKDTree(np.asarray(grid))
+
+    return [
+        np.asarray(
+            tree.query_ball_point(x=np.asarray(profile.centre), r=truncation_radius),
+            dtype="int",
+        )
+        for profile, truncation_radius in zip(profiles, truncation_radii)
+    ]
+
+
+def add_deflections_of_profiles_to_deflections(
+    profiles, grid, deflections, radial_minimum=None
+):
+    """Add the deflection angles of many spherical mass profiles of the same type (which has a vectorised \
+    deflection calculation) to an array of deflection angles, in-place.
+
+    The profiles are evaluated together on arrays of shape [total_profiles, total_coordinates], in chunks of at most \
+    *max_vectorised_elements* elements."""
+
+    profile_type = type(profiles[0])
+    deflection_radii_func = vectorised_deflection_radii_funcs[profile_type]
+
+    if radial_minimum is None:
+        radial_minimum = radial_minimum_from_profile_type(profile_type=profile_type)
+
+    profiles_per_chunk = max(1, max_vectorised_elements // max(1, deflections.shape[0]))
+
+    for chunk_start in range(0, len(profiles), profiles_per_chunk):
+
+        chunk_profiles = profiles[chunk_start : chunk_start + profiles_per_chunk]
+
+        y, x, radii = profile_coordinates_from_grid_centres_and_radial_minimum(
+            grid=grid,
+            centres=np.array([profile.centre for profile in chunk_profiles]),
+            radial_minimum=radial_minimum,
+        )
+
+        deflections_over_radii = (
+            deflection_radii_func(profiles=chunk_profiles, radii=radii) / radii
+        )
+
+        deflections[:, 0] += np.sum(deflections_over_radii * y, axis=0)
+        deflections[:, 1] += np.sum(deflections_over_radii * x, axis=0)
+
+
+def add_deflections_of_profiles_of_planes_to_deflections_stack(
+    profiles, plane_indexes, grid_stack, deflections_stack, radial_minimum=None
+):
+    """Add the deflection angles of many spherical mass profiles of the same type, which belong to different planes \
+    (e.g. the same plane of many tracers), to a stack of the deflection angles of these planes, in-place.
+
+    The profiles are evaluated together on the grid of their plane in the stack, on arrays of shape \
+    [total_profiles, total_coordinates] in chunks of at most *max_vectorised_elements* elements, and the deflection \
+    angles of the profiles of each plane are summed into its entry of the stack.
+
+    Parameters
+    ----------
+    profiles : [MassProfile]
+        The profiles whose deflection angles are added, which are ordered by their plane index.
+    plane_indexes : np.ndarray
+        The index of the plane of every profile in the stack, in ascending order.
+    grid_stack : np.ndarray
+        The grids of the planes, with shape [total_planes, total_coordinates, 2].
+    deflections_stack : np.ndarray
+        The deflection angles of the planes, with shape [total_planes, total_coordinates, 2].
+    """
+
+    profile_type = type(profiles[0])
+    deflection_radii_func = vectorised_deflection_radii_funcs[profile_type]
+
+    if radial_minimum is None:
+        radial_minimum = radial_minimum_from_profile_type(profile_type=profile_type)
+
+    profiles_per_chunk = max(
+        1, max_vectorised_elements // max(1, deflections_stack.shape[1])
+    )
+
+    for chunk_start in range(0, len(profiles), profiles_per_chunk):
+
+        chunk_profiles = profiles[chunk_start : chunk_start + profiles_per_chunk]
+        chunk_plane_indexes = plane_indexes[
+            chunk_start : chunk_start + profiles_per_chunk
+        ]
+
+        y, x, radii = profile_coordinates_from_grid_centres_and_radial_minimum(
+            grid=grid_stack[chunk_plane_indexes],
+            centres=np.array([profile.centre for profile in chunk_profiles]),
+            radial_minimum=radial_minimum,
+        )
+
+        deflections_over_radii = (
+            deflection_radii_func(profiles=chunk_profiles, radii=radii) / radii
+        )
+
+        planes, plane_starts = np.unique(chunk_plane_indexes, return_index=True)
+
+        deflections_stack[planes, :, 0] += np.add.reduceat(
+            deflections_over_radii * y, plane_starts, axis=0
+        )
+        deflections_stack[planes, :, 1] += np.add.reduceat(
+            deflections_over_radii * x, plane_starts, axis=0
+        )
+
+
+def values_with_values_added(values, added_values):
+    """Add values to an array of summed values in-place, where the array is created (as a copy of the added values) \
+    by the first addition, such that the sum does not allocate a temporary array for every addition."""
+    if values is None:
+        return np.array(added_values, dtype="float64")
+
+    values += added_values
+
+    return values
+
+
+def add_values_of_truncated_profiles_to_values(
+    profiles, truncation_radii, grid, values, profile_func
+):
+    """Add a quantity (e.g. the convergence or potential) of mass profiles with a truncation radius to an array of \
+    values, in-place, where each profile is only evaluated on the coordinates of the grid within its truncation \
+    radius of its centre (see *indexes_of_grid_within_truncation_radii_of_profiles*) and is zero beyond it."""
+
+    grid_1d = np.asarray(grid)
+
+    for profile, indexes in zip(
+        profiles,
+        indexes_of_grid_within_truncation_radii_of_profiles(
+            grid=grid_1d, profiles=profiles, truncation_radii=truncation_radii
+        ),
+    ):
+
+        if indexes.shape[0] == 0:
+            continue
+
+        values[indexes] += np.asarray(
+            profile_func(profile, grids.GridIrregular.manual_1d(grid=grid_1d[indexes]))
+        )
+
+
+def add_deflections_of_truncated_profiles_to_deflections(
+    profiles, truncation_radii, grid, deflections
+):
+    """Add the deflection angles of mass profiles with a truncation radius to an array of deflection angles, \
+    in-place, where each profile is only evaluated on the coordinates of the grid within its truncation radius of \
+    its centre (see *indexes_of_grid_within_truncation_radii_of_profiles*).
+
+    Profiles of a type with a vectorised deflection calculation are evaluated via this calculation on these \
+    coordinates."""
+
+    grid_1d = np.asarray(grid)
+
+    radial_minimums = {}
+
+    for profile, indexes in zip(
+        profiles,
+        indexes_of_grid_within_truncation_radii_of_profiles(
+            grid=grid_1d, profiles=profiles, truncation_radii=truncation_radii
+        ),
+    ):
+
+        if indexes.shape[0] == 0:
+            continue
+
+        profile_type = type(profile)
+
+        if profile_type in vectorised_deflection_radii_funcs:
+
+            if profile_type not in radial_minimums:
+                radial_minimums[profile_type] = radial_minimum_from_profile_type(
+                    profile_type=profile_type
+                )
+
+            profile_deflections = np.zeros(shape=(indexes.shape[0], 2))
+
+            add_deflections_of_profiles_to_deflections(
+                profiles=[profile],
+                grid=grid_1d[indexes],
+                deflections=profile_deflections,
+                radial_minimum=radial_minimums[profile_type],
+            )
+
+        else:
+
+            profile_deflections = profile.deflections_from_grid(
+                grid=grids.GridIrregular.manual_1d(grid=grid_1d[indexes])
+            )
+
+        deflections[indexes] += np.asarray(profile_deflections)
+
+
+def summed_values_of_galaxies_from_grid(
+    galaxies,
+    grid,
+    values_shape,
+    galaxy_func,
+    profile_func,
+    profiles_of_galaxy,
+    truncation_radii_of_galaxies=None,
+):
+    """Sum a quantity (e.g. the image or convergence) of many galaxies on a grid into one array, where the profiles \
+    of all galaxies are evaluated individually by their own methods and added to the array in-place, as opposed to \
+    summing a temporary array of every galaxy. No profile calculation is vectorised across profiles here (only the \
+    deflection angles of some profile types are, see *deflections_of_galaxies_from_grid*).
+
+    Galaxies which are not instances of *Galaxy* (e.g. mock galaxies) are evaluated via their own method. The mass \
+    profiles of galaxies with a truncation radius are only evaluated on the coordinates of the grid within this \
+    radius of their centre (see *add_values_of_truncated_profiles_to_values*).
+
+    Parameters
+    ----------
+    profile_func : (Profile, aa.Grid) -> np.ndarray
+        The quantity of a profile on a grid.
+    """
+
+    galaxies, truncated_profiles, truncation_radii = untruncated_galaxies_and_truncated_mass_profiles_from_galaxies(
+        galaxies=galaxies, truncation_radii_of_galaxies=truncation_radii_of_galaxies
+    )
+
+    values = None
+
+    for galaxy in galaxies:
+        if not isinstance(galaxy, g.Galaxy):
+            values = values_with_values_added(
+                values=values, added_values=galaxy_func(galaxy)
+            )
+        else:
+            for profile in profiles_of_galaxy(galaxy):
+                values = values_with_values_added(
+                    values=values, added_values=profile_func(profile, grid)
+                )
+
+    if values is None:
+        values = np.zeros(shape=values_shape)
+
+    if len(truncated_profiles) > 0:
+        add_values_of_truncated_profiles_to_values(
+            profiles=truncated_profiles,
+            truncation_radii=truncation_radii,
+            grid=grid,
+            values=values,
+            profile_func=profile_func,
+        )
+
+    return values
+
+
+def profile_image_of_galaxies_from_grid(galaxies, grid):
+    """The summed profile image of galaxies on a grid (see *summed_values_of_galaxies_from_grid*)."""
+    return summed_values_of_galaxies_from_grid(
+        galaxies=galaxies,
+        grid=grid,
+        values_shape=(grid.sub_shape_1d,),
+        galaxy_func=lambda galaxy: galaxy.profile_image_from_grid(grid=grid),
+        profile_func=lambda profile, grid: profile.profile_image_from_grid(grid=grid),
+        profiles_of_galaxy=lambda galaxy: galaxy.light_profiles,
+    )
+
+
+def convergence_of_galaxies_from_grid(
+    galaxies, grid, truncation_radii_of_galaxies=None
+):
+    """The summed convergence of galaxies on a grid (see *summed_values_of_galaxies_from_grid*)."""
+    return summed_values_of_galaxies_from_grid(
+        galaxies=galaxies,
+        grid=grid,
+        values_shape=(grid.sub_shape_1d,),
+        galaxy_func=lambda galaxy: galaxy.convergence_from_grid(grid=grid),
+        profile_func=lambda profile, grid: profile.convergence_from_grid(grid=grid),
+        profiles_of_galaxy=lambda galaxy: galaxy.mass_profiles,
+        truncation_radii_of_galaxies=truncation_radii_of_galaxies,
+    )
+
+
+def potential_of_galaxies_from_grid(galaxies, grid, truncation_radii_of_galaxies=None):
+    """The summed potential of galaxies on a grid (see *summed_values_of_galaxies_from_grid*)."""
+    return summed_values_of_galaxies_from_grid(
+        galaxies=galaxies,
+        grid=grid,
+        values_shape=(grid.sub_shape_1d,),
+        galaxy_func=lambda galaxy: galaxy.potential_from_grid(grid=grid),
+        profile_func=lambda profile, grid: profile.potential_from_grid(grid=grid),
+        profiles_of_galaxy=lambda galaxy: galaxy.mass_profiles,
+        truncation_radii_of_galaxies=truncation_radii_of_galaxies,
+    )
+
+
+def deflections_of_galaxies_from_grid(
+    galaxies, grid, truncation_radii_of_galaxies=None
+):
+    """The summed deflection angles of galaxies on a grid.
+
+    The mass profiles of all galaxies are grouped by type. Only the *SphericalIsothermal*, *PointMass* and \
+    *SphericalNFW* types have a vectorised deflection calculation (see *vectorised_deflection_radii_funcs*): groups \
+    of at least *min_vectorised_profiles* of these profiles, for example the many subhalos of a line-of-sight plane, \
+    are evaluated in a single vectorised pass. Every other profile is evaluated individually by its own method. All \
+    profiles accumulate into one array of deflection angles. If the grid has an interpolator, no calculation is \
+    vectorised and every profile is evaluated by its own method, which interpolates its deflection angles if it \
+    supports interpolation.
+
+    The mass profiles of galaxies with a truncation radius, for example the halos of a substructure search, are only \
+    evaluated on the coordinates of the grid within this radius of their centre, which are found via a spatial index \
+    of the grid (see *add_deflections_of_truncated_profiles_to_deflections*).
+
+    Parameters
+    ----------
+    galaxies : [g.Galaxy]
+        The galaxies whose deflection angles are summed.
+    grid : aa.Grid
+        The grid of (y,x) arc-second coordinates the deflection angles are computed on.
+    truncation_radii_of_galaxies : [float or None] or None
+        The truncation radius of every galaxy (None if the galaxy is not truncated), or None if no galaxy is \
+        truncated.
+    """
+
+    galaxies, truncated_profiles, truncation_radii = untruncated_galaxies_and_truncated_mass_profiles_from_galaxies(
+        galaxies=galaxies, truncation_radii_of_galaxies=truncation_radii_of_galaxies
+    )
+
+    deflections = None
+
+    for galaxy in galaxies:
+        if not isinstance(galaxy, g.Galaxy):
+            deflections = values_with_values_added(
+                values=deflections, added_values=galaxy.deflections_from_grid(grid=grid)
+            )
+
+    for profile_type, profiles in profiles_of_galaxies_grouped_by_type(
+        galaxies=[galaxy for galaxy in galaxies if isinstance(galaxy, g.Galaxy)],
+        profiles_of_galaxy=lambda galaxy: galaxy.mass_profiles,
+    ).items():
+
+        if (
+            deflections_are_vectorised_for_grid(grid=grid)
+            and profile_type in vectorised_deflection_radii_funcs
+            and len(profiles) >= min_vectorised_profiles
+        ):
+            if deflections is None:
+                deflections = np.zeros(shape=(grid.sub_shape_1d, 2))
+
+            add_deflections_of_profiles_to_deflections(
+                profiles=profiles, grid=grid, deflections=deflections
+            )
+        else:
+            for profile in profiles:
+                deflections = values_with_values_added(
+                    values=deflections,
+                    added_values=profile.deflections_from_grid(grid=grid),
+                )
+
+    if deflections is None:
+        deflections = np.zeros(shape=(grid.sub_shape_1d, 2))
+
+    if len(truncated_profiles) > 0:
+        add_deflections_of_truncated_profiles_to_deflections(
+            profiles=truncated_profiles,
+            truncation_radii=truncation_radii,
+            grid=grid,
+            deflections=deflections,
+        )
+
+    return deflections
+
+
+def deflections_stack_of_galaxies_of_planes_from_grids(
+    galaxies_of_planes, grids, truncation_radii_of_galaxies_of_planes=None
+):
+    """The summed deflection angles of the galaxies of many planes (e.g. the same plane of many tracers), each on its \
+    own grid, returned as a stack of shape [total_planes, total_coordinates, 2].
+
+    The mass profiles of the galaxies of all planes are grouped by type. Groups of at least *min_vectorised_profiles* \
+    profiles of a type with a vectorised deflection calculation (the *SphericalIsothermal*, *PointMass* and \
+    *SphericalNFW*, see *vectorised_deflection_radii_funcs*) are evaluated for all planes in a single vectorised pass (see \
+    *add_deflections_of_profiles_of_planes_to_deflections_stack*), as opposed to one pass per plane. Galaxies with \
+    any other mass profile or a truncation radius, and all galaxies of a plane whose grid has an interpolator, are \
+    evaluated on the grid of their plane via *deflections_of_galaxies_from_grid*.
+
+    Parameters
+    ----------
+    galaxies_of_planes : [[g.Galaxy]]
+        The galaxies of every plane.
+    grids : [aa.Grid]
+        The grid of every plane, which all have the same number of coordinates.
+    truncation_radii_of_galaxies_of_planes : [[float or None] or None] or None
+        The truncation radii of the galaxies of every plane (see *deflections_of_galaxies_from_grid*), or None if no \
+        galaxy is truncated.
+    """
+
+    if truncation_radii_of_galaxies_of_planes is None:
+        truncation_radii_of_galaxies_of_planes = [None] * len(grids)
+
+    deflections_stack = np.zeros(shape=(len(grids), grids[0].sub_shape_1d, 2))
+
+    grid_stack = np.stack([np.asarray(grid) for grid in grids])
+
+    profiles_of_types = collections.OrderedDict()
+
+    for plane_index, (galaxies, grid, truncation_radii_of_galaxies) in enumerate(
+        zip(galaxies_of_planes, grids, truncation_radii_of_galaxies_of_planes)
+    ):
+
+        if truncation_radii_of_galaxies is None:
+            truncation_radii_of_galaxies = [None] * len(galaxies)
+
+        plane_galaxies = []
+        plane_truncation_radii = []
+
+        for galaxy, truncation_radius in zip(galaxies, truncation_radii_of_galaxies):
+
+            if (
+                deflections_are_vectorised_for_grid(grid=grid)
+                and truncation_radius is None
+                and isinstance(galaxy, g.Galaxy)
+                and all(
+                    [
+                        type(profile) in vectorised_deflection_radii_funcs
+                        for profile in galaxy.mass_profiles
+                    ]
+                )
+            ):
+                for profile in galaxy.mass_profiles:
+                    profiles, plane_indexes = profiles_of_types.setdefault(
+                        type(profile), ([], [])
+                    )
+                    profiles.append(profile)
+                    plane_indexes.append(plane_index)
+            else:
+                plane_galaxies.append(galaxy)
+                plane_truncation_radii.append(truncation_radius)
+
+        if len(plane_galaxies) > 0:
+            deflections_stack[plane_index] += deflections_of_galaxies_from_grid(
+                galaxies=plane_galaxies,
+                grid=grid,
+                truncation_radii_of_galaxies=plane_truncation_radii,
+            )
+
+    for profiles, plane_indexes in profiles_of_types.values():
+
+        if len(profiles) >= min_vectorised_profiles:
+            add_deflections_of_profiles_of_planes_to_deflections_stack(
+                profiles=profiles,
+                plane_indexes=np.asarray(plane_indexes),
+                grid_stack=grid_stack,
+                deflections_stack=deflections_stack,
+            )
+        else:
+            for profile, plane_index in zip(profiles, plane_indexes):
+                deflections_stack[plane_index] += profile.deflections_from_grid(
+                    grid=grids[plane_index]
+                )
+
+    return deflections_stack
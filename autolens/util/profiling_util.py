@@ -0,0 +1,90 @@
+import collections
+import contextlib
+import time
+
+
+class StageTimer:
+    def __init__(self):
+        """Records the total wall time spent in, and number of calls of, every stage of a calculation (e.g. the \
+        tracer construction, profile image, blurring convolution and inversion of an analysis's fits), summed over \
+        every time the stage is timed.
+
+        Stages are timed via the *stage* context manager, either of the timer or (for code which does not have \
+        access to the timer, such as the fits) of this module, which times the stage with the timer that is \
+        activated via *activate*."""
+        self.times = collections.OrderedDict()
+        self.calls = collections.OrderedDict()
+
+    @contextlib.contextmanager
+    def stage(self, name):
+
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.times[name] = self.times.get(name, 0.0) + time.perf_counter() - start
+            self.calls[name] = self.calls.get(name, 0) + 1
+
+    @property
+    def summary(self):
+        """The total time, number of calls and mean time per call of every stage, one line per stage in the order \
+        the stages were first timed."""
+        return [
+            "{} = {:.4f}s ({} calls, {:.6f}s per call)".format(
+                name,
+                self.times[name],
+                self.calls[name],
+                self.times[name] / self.calls[name],
+            )
+            for name in self.times
+        ]
+
+    def output_to_file(self, file_path):
+
+        with open(file_path, "w") as timings_info:
+            for line in self.summary:
+                timings_info.write("{} \n".format(line))
+
+
+class NoStage:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+no_stage = NoStage()
+
+active_timer = None
+
+
+@contextlib.contextmanager
+def activate(timer):
+    """Time every stage timed via this module's *stage* function with a timer, until the context is exited. If the \
+    timer is None, stages are not timed."""
+
+    global active_timer
+
+    previous_timer = active_timer
+    active_timer = timer
+
+    try:
+        yield
+    finally:
+        active_timer = previous_timer
+
+
+def stage(name):
+    """Time a stage with the active timer, or do nothing (with negligible overhead) if no timer is active.
+
+    Parameters
+    ----------
+    name : str
+        The name of the stage, under which its time and calls are summed.
+    """
+    if active_timer is None:
+        return no_stage
+
+    return active_timer.stage(name=name)
@@ -0,0 +1,188 @@
+import numpy as np
+from scipy import sparse
+
+from autolens import decorator_util
+
+
+def sparse_mapping_matrix_from_mapper(mapper):
+    """The mapping matrix of a mapper as a sparse matrix in compressed sparse column (CSC) format, with shape \
+    [total_image_pixels, total_pixelization_pixels].
+
+    Every sub-pixel maps to one pixelization pixel, so the matrix has at most one entry per sub-pixel and is built \
+    directly from the mappings between sub-pixels and pixelization pixels, as opposed to from the dense mapping \
+    matrix (see *mappers.Mapper.mapping_matrix*). The sub-fractions of the sub-pixels of an image pixel mapping to \
+    the same pixelization pixel are summed.
+
+    Parameters
+    ----------
+    mapper : mappers.Mapper
+        The mapper between the sub-pixels of a grid and the pixels of a pixelization.
+    """
+
+    mask_1d_index_for_sub_mask_1d_index = np.asarray(
+        mapper.grid.mask.regions._mask_1d_index_for_sub_mask_1d_index
+    )
+
+    mapping_matrix = sparse.csc_matrix(
+        (
+            np.full(
+                fill_value=mapper.grid.mask.sub_fraction,
+                shape=mask_1d_index_for_sub_mask_1d_index.shape[0],
+            ),
+            (
+                mask_1d_index_for_sub_mask_1d_index,
+                np.asarray(mapper.pixelization_1d_index_for_sub_mask_1d_index),
+            ),
+        ),
+        shape=(mapper.grid.mask.pixels_in_mask, mapper.pixels),
+    )
+
+    mapping_matrix.sum_duplicates()
+
+    return mapping_matrix
+
+
+@decorator_util.jit()
+def blurred_mapping_matrix_csc_arrays_from_mapping_matrix_csc_arrays_jit(
+    indptr,
+    indices,
+    data,
+    total_image_pixels,
+    image_frame_1d_indexes,
+    image_frame_1d_kernels,
+    image_frame_1d_lengths,
+):
+    """Blur every column of a mapping matrix in CSC format (its *indptr*, *indices* and *data* arrays) with the PSF, \
+    using the frames of the convolver which map every image pixel to the image pixels its light is blurred into.
+
+    The entries of every column are accumulated in a dense work array, whose touched image pixels are tracked such \
+    that only they are output and reset. The columns are blurred twice, first to count the entries of the blurred \
+    matrix and then to fill them, such that its arrays are allocated at their exact size. The entries of a column \
+    are summed in the same order as by *Convolver.convolve_mapping_matrix*.
+
+    Returns the *indptr*, *indices* and *data* arrays of the blurred mapping matrix in CSC format, whose indices are \
+    not sorted."""
+
+    total_columns = indptr.shape[0] - 1
+
+    work = np.zeros(total_image_pixels)
+    touched = np.zeros(total_image_pixels, dtype=np.bool_)
+    touched_indexes = np.zeros(total_image_pixels, dtype=np.int64)
+
+    blurred_indptr = np.zeros(total_columns + 1, dtype=np.int64)
+
+    for column_index in range(total_columns):
+
+        total_touched = 0
+
+        for entry_index in range(indptr[column_index], indptr[column_index + 1]):
+
+            image_1d_index = indices[entry_index]
+
+            for kernel_1d_index in range(image_frame_1d_lengths[image_1d_index]):
+
+                vector_index = image_frame_1d_indexes[image_1d_index, kernel_1d_index]
+
+                if not touched[vector_index]:
+                    touched[vector_index] = True
+                    touched_indexes[total_touched] = vector_index
+                    total_touched += 1
+
+        for touched_index in range(total_touched):
+            touched[touched_indexes[touched_index]] = False
+
+        blurred_indptr[column_index + 1] = blurred_indptr[column_index] + total_touched
+
+    blurred_indices = np.zeros(blurred_indptr[total_columns], dtype=np.int64)
+    blurred_data = np.zeros(blurred_indptr[total_columns])
+
+    for column_index in range(total_columns):
+
+        total_touched = 0
+
+        for entry_index in range(indptr[column_index], indptr[column_index + 1]):
+
+            image_1d_index = indices[entry_index]
+            value = data[entry_index]
+
+            for kernel_1d_index in range(image_frame_1d_lengths[image_1d_index]):
+
+                vector_index = image_frame_1d_indexes[image_1d_index, kernel_1d_index]
+
+                if not touched[vector_index]:
+                    touched[vector_index] = True
+                    touched_indexes[total_touched] = vector_index
+                    total_touched += 1
+
+                work[vector_index] += (
+                    value * image_frame_1d_kernels[image_1d_index, kernel_1d_index]
+                )
+
+        for touched_index in range(total_touched):
+
+            vector_index = touched_indexes[touched_index]
+            blurred_index = blurred_indptr[column_index] + touched_index
+
+            blurred_indices[blurred_index] = vector_index
+            blurred_data[blurred_index] = work[vector_index]
+
+            work[vector_index] = 0.0
+            touched[vector_index] = False
+
+    return blurred_indptr, blurred_indices, blurred_data
+
+
+def blurred_sparse_mapping_matrix_from_sparse_mapping_matrix_and_convolver(
+    mapping_matrix, convolver
+):
+    """Blur a sparse mapping matrix with the PSF of a convolver (see \
+    *blurred_mapping_matrix_csc_arrays_from_mapping_matrix_csc_arrays_jit*), returning the blurred mapping matrix \
+    in CSC format.
+
+    Each column is non-zero only within the PSF of the image pixels its pixelization pixel maps to, so the memory of \
+    the blurred mapping matrix scales with the number of image pixels times the PSF size, as opposed to the number \
+    of image pixels times the number of pixelization pixels.
+
+    Parameters
+    ----------
+    mapping_matrix : scipy.sparse.spmatrix
+        The sparse mapping matrix, with shape [total_image_pixels, total_pixelization_pixels].
+    convolver : convolver.Convolver
+        The convolver whose frames blur the image pixels.
+    """
+
+    mapping_matrix = sparse.csc_matrix(mapping_matrix)
+
+    indptr, indices, data = blurred_mapping_matrix_csc_arrays_from_mapping_matrix_csc_arrays_jit(
+        indptr=mapping_matrix.indptr,
+        indices=mapping_matrix.indices,
+        data=mapping_matrix.data,
+        total_image_pixels=mapping_matrix.shape[0],
+        image_frame_1d_indexes=np.asarray(convolver.image_frame_1d_indexes),
+        image_frame_1d_kernels=np.asarray(convolver.image_frame_1d_kernels),
+        image_frame_1d_lengths=np.asarray(convolver.image_frame_1d_lengths),
+    )
+
+    blurred_mapping_matrix = sparse.csc_matrix(
+        (data, indices, indptr), shape=mapping_matrix.shape
+    )
+
+    blurred_mapping_matrix.sort_indices()
+
+    return blurred_mapping_matrix
+
+
+def sparse_curvature_matrix_from_blurred_sparse_mapping_matrix_and_noise_map(
+    blurred_mapping_matrix, noise_map
+):
+    """The curvature matrix F = f^T N^-1 f of a sparse blurred mapping matrix f and 1D noise-map (see Warren & Dye \
+    2003), as a sparse matrix in compressed sparse column (CSC) format.
+
+    Pixelization pixels whose blurred images do not overlap have no entry, so the curvature matrix is sparse for \
+    pixelizations with many pixels."""
+
+    weighted_mapping_matrix = sparse.diags(1.0 / np.asarray(noise_map)).dot(
+        blurred_mapping_matrix
+    )
+
+    return sparse.csc_matrix(weighted_mapping_matrix.T.dot(weighted_mapping_matrix))
@@ -0,0 +1,275 @@
+import numpy as np
+
+from autoarray.structures import visibilities as vis
+from autolens import decorator_util
+
+
+def image_stack_from_images(images):
+    """Stack the binned 1D values of a list of images into one array of shape [total_images, total_image_pixels]."""
+    return np.stack([np.asarray(image.in_1d_binned) for image in images])
+
+
+@decorator_util.jit()
+def complex_visibilities_of_image_stack_jit(image_stack, grid_radians, uv_wavelengths):
+    """The complex visibilities of a stack of 1D images (with shape [total_images, total_image_pixels]) via a direct \
+    Fourier transform, returned with shape [total_visibilities, total_images].
+
+    The phase factor of every image pixel and visibility is computed once and applied to every image."""
+
+    total_images = image_stack.shape[0]
+
+    real_visibilities = np.zeros(shape=(uv_wavelengths.shape[0], total_images))
+    imag_visibilities = np.zeros(shape=(uv_wavelengths.shape[0], total_images))
+
+    for image_1d_index in range(image_stack.shape[1]):
+        for vis_1d_index in range(uv_wavelengths.shape[0]):
+
+            phase = (
+                -2.0
+                * np.pi
+                * (
+                    grid_radians[image_1d_index, 1] * uv_wavelengths[vis_1d_index, 0]
+                    + grid_radians[image_1d_index, 0] * uv_wavelengths[vis_1d_index, 1]
+                )
+            )
+
+            cos_phase = np.cos(phase)
+            sin_phase = np.sin(phase)
+
+            for image_index in range(total_images):
+
+                value = image_stack[image_index, image_1d_index]
+
+                real_visibilities[vis_1d_index, image_index] += value * cos_phase
+                imag_visibilities[vis_1d_index, image_index] += value * sin_phase
+
+    return real_visibilities + 1j * imag_visibilities
+
+
+@decorator_util.jit()
+def complex_visibilities_of_image_stack_via_preload_jit(
+    image_stack, preloaded_reals, preloaded_imags
+):
+    """The complex visibilities of a stack of 1D images (with shape [total_images, total_image_pixels]) via the \
+    preloaded transforms of a direct Fourier transform, returned with shape [total_visibilities, total_images].
+
+    This is the product of the stack and the preloaded transforms, which is summed in the same order as the \
+    visibilities of a single image (see *real_visibilities_from_image_via_preload_jit*), such that the visibilities \
+    of every image are identical to those computed one image at a time."""
+
+    total_images = image_stack.shape[0]
+
+    real_visibilities = np.zeros(shape=(preloaded_reals.shape[1], total_images))
+    imag_visibilities = np.zeros(shape=(preloaded_reals.shape[1], total_images))
+
+    for image_1d_index in range(image_stack.shape[1]):
+        for vis_1d_index in range(preloaded_reals.shape[1]):
+
+            real_transform = preloaded_reals[image_1d_index, vis_1d_index]
+            imag_transform = preloaded_imags[image_1d_index, vis_1d_index]
+
+            for image_index in range(total_images):
+
+                value = image_stack[image_index, image_1d_index]
+
+                real_visibilities[vis_1d_index, image_index] += value * real_transform
+                imag_visibilities[vis_1d_index, image_index] += value * imag_transform
+
+    return real_visibilities + 1j * imag_visibilities
+
+
+def complex_visibilities_of_image_stack_from_transformer(image_stack, transformer):
+    """The complex visibilities of a stack of 1D images (with shape [total_images, total_image_pixels]) computed \
+    by a transformer in one batched transform, returned with shape [total_visibilities, total_images].
+
+    A transformer with a batched transform of its own (e.g. the *TransformerNUFFT*) uses it. For the direct \
+    Fourier transform of the *Transformer*, the stack is multiplied by the preloaded transforms in one \
+    matrix-matrix product, or, if the transforms are not preloaded, the phase factor of every image pixel and \
+    visibility is computed once and shared by every image."""
+
+    if hasattr(transformer, "complex_visibilities_from_image_stack"):
+        return transformer.complex_visibilities_from_image_stack(
+            image_stack=image_stack
+        )
+
+    if transformer.preload_transform:
+        return complex_visibilities_of_image_stack_via_preload_jit(
+            image_stack=image_stack,
+            preloaded_reals=np.asarray(transformer.preload_real_transforms),
+            preloaded_imags=np.asarray(transformer.preload_imag_transforms),
+        )
+
+    return complex_visibilities_of_image_stack_jit(
+        image_stack=image_stack,
+        grid_radians=np.asarray(transformer.grid_radians),
+        uv_wavelengths=transformer.uv_wavelengths,
+    )
+
+
+def visibilities_of_images_from_images_and_transformer(images, transformer):
+    """The visibilities of a list of images (e.g. the profile images of a tracer's planes or of a plane's galaxies), \
+    which are stacked and transformed together (see *complex_visibilities_of_image_stack_from_transformer*) as \
+    opposed to being transformed one by one.
+
+    Parameters
+    ----------
+    images : [arrays.Array]
+        The images whose visibilities are computed.
+    transformer : transformer.Transformer or transformer.TransformerNUFFT
+        The transformer which computes the visibilities.
+    """
+
+    if len(images) == 0:
+        return []
+
+    visibilities = complex_visibilities_of_image_stack_from_transformer(
+        image_stack=image_stack_from_images(images=images), transformer=transformer
+    )
+
+    return [
+        vis.Visibilities(
+            visibilities_1d=np.stack(
+                (visibilities[:, image_index].real, visibilities[:, image_index].imag),
+                axis=-1,
+            )
+        )
+        for image_index in range(len(images))
+    ]
+
+
+def compressed_visibilities_from_visibilities_noise_map_uv_wavelengths_and_mask(
+    visibilities, noise_map, uv_wavelengths, visibilities_mask, uv_cell_size
+):
+    """
+    Compress a set of visibilities by gridding them into square cells of the uv-plane and averaging the \
+    visibilities of every cell, such that a fit's cost scales with the number of occupied cells as opposed to the \
+    number of visibilities.
+
+    The visibilities of the half of the uv-plane with u < 0 (or u = 0 and v < 0) are first mirrored to the other half \
+    by conjugation, which the visibilities of a real image satisfy (V(-u,-v) = V*(u,v)). The real and imaginary \
+    parts of every cell are then the inverse-variance weighted means of its visibilities, whose noise is the inverse \
+    square root of the summed weights, and the uv-wavelengths of every cell are the weighted mean of those of its \
+    visibilities (such that the model visibilities of the cell are the mean of those of its visibilities, to first \
+    order). Masked visibilities (either of whose entries is *True*) are omitted.
+
+    Provided model visibilities vary negligibly (compared to the noise) across every cell, the chi-squared of a fit \
+    to the compressed visibilities is that of the original visibilities minus the chi-squared of their scatter \
+    about the means of their cells, which is independent of the model. Cells must therefore be small compared to \
+    the inverse of the angular extent of the real-space mask.
+
+    Parameters
+    ----------
+    visibilities : np.ndarray
+        The real and imaginary visibilities, with shape [total_visibilities, 2].
+    noise_map : np.ndarray
+        The noise of the real and imaginary visibilities, with shape [total_visibilities, 2].
+    uv_wavelengths : np.ndarray
+        The (u,v) wavelengths of the visibilities, with shape [total_visibilities, 2].
+    visibilities_mask : np.ndarray
+        The mask of the visibilities, with shape [total_visibilities] or [total_visibilities, 2].
+    uv_cell_size : float
+        The size (in wavelengths) of the uv-plane cells.
+
+    Returns
+    -------
+    (np.ndarray, np.ndarray, np.ndarray, float)
+        The compressed visibilities, noise-map and uv-wavelengths of every occupied cell, and the chi-squared of \
+        the scatter of the original visibilities about the means of their cells.
+    """
+
+    visibilities_mask = np.asarray(visibilities_mask).astype("bool")
+
+    if visibilities_mask.ndim == 2:
+        visibilities_mask = np.any(visibilities_mask, axis=1)
+
+    unmasked = ~visibilities_mask
+
+    visibilities = np.array(visibilities, dtype="float")[unmasked]
+    noise_map = np.asarray(noise_map, dtype="float")[unmasked]
+    uv_wavelengths = np.array(uv_wavelengths, dtype="float")[unmasked]
+
+    mirrored = (uv_wavelengths[:, 0] < 0.0) | (
+        (uv_wavelengths[:, 0] == 0.0) & (uv_wavelengths[:, 1] < 0.0)
+    )
+
+    uv_wavelengths[mirrored] *= -1.0
+    visibilities[mirrored, 1] *= -1.0
+
+    cell_indexes = np.floor(uv_wavelengths / uv_cell_size).astype("int")
+
+    visibility_cells = np.unique(cell_indexes, axis=0, return_inverse=True)[1].ravel()
+
+    total_cells = np.max(visibility_cells) + 1
+
+    weights = 1.0 / noise_map ** 2.0
+
+    def cell_sums_from_values(values):
+        return np.stack(
+            [
+                np.bincount(
+                    visibility_cells, weights=values[:, index], minlength=total_cells
+                )
+                for index in range(values.shape[1])
+            ],
+            axis=-1,
+        )
+
+    cell_weights = cell_sums_from_values(values=weights)
+
+    compressed_visibilities = (
+        cell_sums_from_values(values=weights * visibilities) / cell_weights
+    )
+
+    compressed_noise_map = 1.0 / np.sqrt(cell_weights)
+
+    total_weights = np.sum(weights, axis=1)
+
+    compressed_uv_wavelengths = (
+        cell_sums_from_values(values=total_weights[:, None] * uv_wavelengths)
+        / np.sum(cell_weights, axis=1)[:, None]
+    )
+
+    scatter_chi_squared = float(
+        np.sum(
+            weights * (visibilities - compressed_visibilities[visibility_cells]) ** 2.0
+        )
+    )
+
+    return (
+        compressed_visibilities,
+        compressed_noise_map,
+        compressed_uv_wavelengths,
+        scatter_chi_squared,
+    )
+
+
+def uv_compression_noise_normalization_from_noise_maps_and_mask(
+    noise_map, compressed_noise_map, visibilities_mask
+):
+    """
+    The noise normalization of the unmasked visibilities of a dataset minus that of its compressed visibilities (see \
+    *compressed_visibilities_from_visibilities_noise_map_uv_wavelengths_and_mask*), which is independent of the \
+    model and is added to the noise normalization of every fit to the compressed visibilities, such that its \
+    likelihood is that of a fit to the original visibilities.
+
+    Parameters
+    ----------
+    noise_map : np.ndarray
+        The noise of the original real and imaginary visibilities, with shape [total_visibilities, 2].
+    compressed_noise_map : np.ndarray
+        The noise of the compressed real and imaginary visibilities, with shape [total_cells, 2].
+    visibilities_mask : np.ndarray
+        The mask of the original visibilities, with shape [total_visibilities] or [total_visibilities, 2].
+    """
+
+    visibilities_mask = np.asarray(visibilities_mask).astype("bool")
+
+    if visibilities_mask.ndim == 2:
+        visibilities_mask = np.any(visibilities_mask, axis=1)
+
+    noise_map = np.asarray(noise_map, dtype="float")[~visibilities_mask]
+
+    return float(
+        np.sum(np.log(2.0 * np.pi * noise_map ** 2.0))
+        - np.sum(np.log(2.0 * np.pi * np.asarray(compressed_noise_map) ** 2.0))
+    )
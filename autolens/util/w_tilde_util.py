@@ -0,0 +1,181 @@
+import numpy as np
+from scipy import sparse
+
+from autolens.util import nufft_util
+
+# The maximum number of visibilities whose phase factors are held in memory at once when computing the W-tilde
+# tables and dirty images, with more visibilities summed over in chunks of this size.
+max_chunk_visibilities = 10000
+
+
+def cosine_table_from_weights_uv_wavelengths_and_offsets(
+    weights, uv_wavelengths, offsets_y, offsets_x
+):
+    """The table of weighted sums of cosines, sum_k w_k cos(2 pi (x u_k + y v_k)), at every (y,x) offset (in \
+    radians) of a regular table of offsets, returned with shape [total_offsets_y, total_offsets_x].
+
+    Each cosine is separated as cos(a)cos(b) - sin(a)sin(b) for the y and x terms of its phase, such that the table is \
+    the difference of two matrix-matrix products over the visibilities, which are summed in chunks of \
+    *max_chunk_visibilities*."""
+
+    table = np.zeros(shape=(offsets_y.shape[0], offsets_x.shape[0]))
+
+    for chunk_start in range(0, uv_wavelengths.shape[0], max_chunk_visibilities):
+
+        chunk = slice(chunk_start, chunk_start + max_chunk_visibilities)
+
+        phases_y = 2.0 * np.pi * np.outer(offsets_y, uv_wavelengths[chunk, 1])
+        phases_x = 2.0 * np.pi * np.outer(offsets_x, uv_wavelengths[chunk, 0])
+
+        table += np.dot(np.cos(phases_y) * weights[chunk], np.cos(phases_x).T)
+        table -= np.dot(np.sin(phases_y) * weights[chunk], np.sin(phases_x).T)
+
+    return table
+
+
+def w_tilde_from_noise_map_uv_wavelengths_and_grid_radians(
+    noise_map, uv_wavelengths, grid_radians
+):
+    """
+    The W-tilde matrix of an interferometer dataset, which is the curvature matrix of an inversion in the real-space \
+    pixels of its mask (before their mapping to the pixelization's pixels), with shape [total_image_pixels, \
+    total_image_pixels].
+
+    For the real and imaginary transforms T_r and T_i of the image pixels (the direct Fourier transform of the \
+    *Transformer*) and the weights w = 1 / noise ** 2.0 of the real and imaginary visibilities:
+
+    W-tilde = T_r^T W_r T_r + T_i^T W_i T_i
+
+    such that the curvature matrix of any mapping matrix f is f^T W-tilde f. W-tilde is independent of the data and \
+    model, and is therefore computed once per dataset.
+
+    The phases of image pixels i and j are differences and sums of their coordinates, which on a uniform grid are \
+    integer multiples of the pixel scales, so:
+
+    W-tilde_ij = sum_k (w_r + w_i) / 2 cos(phase_i - phase_j) + (w_r - w_i) / 2 cos(phase_i + phase_j)
+
+    is computed from tables of these sums over the offsets between (and sums of) the pixel indexes of the bounding \
+    box of the mask, whose cost scales with the number of pixels of the box times the number of visibilities, as \
+    opposed to the square of the number of image pixels times the number of visibilities. The second table is only \
+    computed if the real and imaginary noise of a visibility differ.
+
+    Parameters
+    ----------
+    noise_map : np.ndarray
+        The noise of the real and imaginary visibilities, with shape [total_visibilities, 2].
+    uv_wavelengths : np.ndarray
+        The (u,v) wavelengths of the visibilities, with shape [total_visibilities, 2].
+    grid_radians : grids.Grid
+        The grid (in radians) of the real-space mask, which must be a uniform grid of pixels.
+    """
+
+    noise_map = np.asarray(noise_map)
+    uv_wavelengths = np.asarray(uv_wavelengths, dtype="float")
+
+    weights = 1.0 / noise_map ** 2.0
+
+    pixel_indexes, shape = nufft_util.pixel_indexes_from_mask(mask=grid_radians.mask)
+
+    pixel_scales = np.asarray(grid_radians.mask.pixel_scales) * np.pi / 648000.0
+
+    # The y coordinates of the grid decrease with the row index of the image, so the y offsets are negated.
+
+    difference_offsets_y = -np.arange(-shape[0] + 1, shape[0]) * pixel_scales[0]
+    difference_offsets_x = np.arange(-shape[1] + 1, shape[1]) * pixel_scales[1]
+
+    difference_table = cosine_table_from_weights_uv_wavelengths_and_offsets(
+        weights=0.5 * (weights[:, 0] + weights[:, 1]),
+        uv_wavelengths=uv_wavelengths,
+        offsets_y=difference_offsets_y,
+        offsets_x=difference_offsets_x,
+    )
+
+    rows = pixel_indexes[:, 0]
+    columns = pixel_indexes[:, 1]
+
+    w_tilde = difference_table[
+        rows[:, None] - rows[None, :] + shape[0] - 1,
+        columns[:, None] - columns[None, :] + shape[1] - 1,
+    ]
+
+    if np.any(weights[:, 0] != weights[:, 1]):
+
+        grid_radians = np.asarray(grid_radians.in_1d_binned)
+
+        origin_y = np.mean(grid_radians[:, 0] + rows * pixel_scales[0])
+        origin_x = np.mean(grid_radians[:, 1] - columns * pixel_scales[1])
+
+        sum_table = cosine_table_from_weights_uv_wavelengths_and_offsets(
+            weights=0.5 * (weights[:, 0] - weights[:, 1]),
+            uv_wavelengths=uv_wavelengths,
+            offsets_y=2.0 * origin_y - np.arange(2 * shape[0] - 1) * pixel_scales[0],
+            offsets_x=2.0 * origin_x + np.arange(2 * shape[1] - 1) * pixel_scales[1],
+        )
+
+        w_tilde += sum_table[
+            rows[:, None] + rows[None, :], columns[:, None] + columns[None, :]
+        ]
+
+    return w_tilde
+
+
+def dirty_image_from_visibilities_noise_map_uv_wavelengths_and_grid_radians(
+    visibilities, noise_map, uv_wavelengths, grid_radians
+):
+    """
+    The noise-weighted dirty image of a set of visibilities at every pixel of a real-space grid:
+
+    d = T_r^T W_r V_r + T_i^T W_i V_i
+
+    which is the data vector of an inversion in the real-space pixels of the mask, such that the data vector of any \
+    mapping matrix f is f^T d. The visibilities are summed over in chunks of *max_chunk_visibilities*.
+
+    Parameters
+    ----------
+    visibilities : np.ndarray
+        The real and imaginary visibilities, with shape [total_visibilities, 2].
+    noise_map : np.ndarray
+        The noise of the real and imaginary visibilities, with shape [total_visibilities, 2].
+    uv_wavelengths : np.ndarray
+        The (u,v) wavelengths of the visibilities, with shape [total_visibilities, 2].
+    grid_radians : grids.Grid
+        The grid (in radians) of the real-space mask.
+    """
+
+    weighted_visibilities = np.asarray(visibilities) / np.asarray(noise_map) ** 2.0
+    uv_wavelengths = np.asarray(uv_wavelengths, dtype="float")
+    grid_radians = np.asarray(grid_radians.in_1d_binned)
+
+    dirty_image = np.zeros(shape=grid_radians.shape[0])
+
+    for chunk_start in range(0, uv_wavelengths.shape[0], max_chunk_visibilities):
+
+        chunk = slice(chunk_start, chunk_start + max_chunk_visibilities)
+
+        phases = (
+            -2.0
+            * np.pi
+            * (
+                np.outer(grid_radians[:, 1], uv_wavelengths[chunk, 0])
+                + np.outer(grid_radians[:, 0], uv_wavelengths[chunk, 1])
+            )
+        )
+
+        dirty_image += np.dot(np.cos(phases), weighted_visibilities[chunk, 0])
+        dirty_image += np.dot(np.sin(phases), weighted_visibilities[chunk, 1])
+
+    return dirty_image
+
+
+def curvature_matrix_from_w_tilde_and_mapping_matrix(w_tilde, mapping_matrix):
+    """The curvature matrix f^T W-tilde f of an inversion from the W-tilde matrix of its dataset and its mapping \
+    matrix f, which is either dense or sparse (see *sparse_inversion_util.sparse_mapping_matrix_from_mapper*).
+
+    Every image pixel maps to only a few pixelization pixels, so the mapping matrix is used as a sparse matrix \
+    and the cost of the product scales with its non-zero entries times the number of image pixels."""
+
+    sparse_mapping_matrix = sparse.csr_matrix(mapping_matrix).T.tocsr()
+
+    w_tilde_mapping_matrix = sparse_mapping_matrix.dot(w_tilde)
+
+    return np.asarray(sparse_mapping_matrix.dot(w_tilde_mapping_matrix.T))
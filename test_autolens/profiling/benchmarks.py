@@ -0,0 +1,432 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import timeit
+
+import numpy as np
+
+import autofit as af
+import autolens as al
+from autolens.simulator import simulator
+
+# This script times the calculations performed for every sample of a non-linear search (ray-tracing, imaging,
+# interferometer and positions fits) and between phases (the hyper galaxy images of a result), over a range of mask
+# sizes, sub sizes, plane counts and galaxy counts. It runs offline on simulated data and writes the timings to a
+# .json file, so that the timings of two commits (or two versions of the dependencies) can be compared via the script
+# compare_benchmarks.py, e.g.:
+#
+# python benchmarks.py --output before.json
+# (checkout the new commit / upgrade the dependencies)
+# python benchmarks.py --output after.json
+# python compare_benchmarks.py before.json after.json
+#
+# Every benchmark builds its dataset, masks and galaxies before it is timed, and its timed function repeats all
+# calculations of one sample (e.g. it clears the traced grids stored by a tracer before tracing its grid again).
+
+profiling_path = os.path.dirname(os.path.realpath(__file__))
+
+pixel_scales = 0.05
+
+# The radii (in arc-seconds) of the circular masks, which for a pixel scale of 0.05" contain ~2800 and ~11300 pixels.
+mask_radii = [1.5, 3.0]
+sub_sizes = [1, 2, 4]
+total_planes = [2, 3, 5]
+total_galaxies = [1, 3, 5]
+
+
+def lens_galaxies_for_total_planes(total_planes):
+    """The lens galaxies of a lens system with a total number of planes, which are spread between redshifts 0.2 \
+    and 0.8 in front of a source galaxy at redshift 2.0."""
+    return [
+        al.Galaxy(
+            redshift=redshift,
+            light=al.lp.EllipticalSersic(
+                centre=(0.0, 0.0), axis_ratio=0.8, intensity=0.1, effective_radius=0.8
+            ),
+            mass=al.mp.EllipticalIsothermal(
+                centre=(0.0, 0.0), axis_ratio=0.8, einstein_radius=1.6 / total_planes
+            ),
+        )
+        for redshift in np.linspace(0.2, 0.8, total_planes - 1)
+    ]
+
+
+def source_galaxy():
+    return al.Galaxy(
+        redshift=2.0,
+        light=al.lp.EllipticalSersic(
+            centre=(0.1, 0.1), axis_ratio=0.8, intensity=0.3, effective_radius=0.3
+        ),
+    )
+
+
+def source_galaxy_with_pixelization(pixelization):
+    return al.Galaxy(
+        redshift=2.0,
+        pixelization=pixelization,
+        regularization=al.reg.Constant(coefficient=1.0),
+    )
+
+
+def simulate_imaging(mask_radius):
+
+    shape_2d = 2 * (int(2.0 * mask_radius / pixel_scales) + 10,)
+
+    psf = al.kernel.from_gaussian(
+        shape_2d=(11, 11), sigma=0.1, pixel_scales=pixel_scales
+    )
+
+    imaging_simulator = simulator.ImagingSimulator(
+        shape_2d=shape_2d,
+        pixel_scales=pixel_scales,
+        sub_size=1,
+        psf=psf,
+        exposure_time=300.0,
+        background_level=0.1,
+        noise_seed=1,
+    )
+
+    return imaging_simulator.from_tracer(
+        tracer=al.Tracer.from_galaxies(
+            galaxies=lens_galaxies_for_total_planes(total_planes=2) + [source_galaxy()]
+        )
+    )
+
+
+def benchmark_traced_grids_of_planes(mask_radius, sub_size, total_planes):
+
+    mask = al.mask.circular(
+        shape_2d=2 * (int(2.0 * mask_radius / pixel_scales) + 10,),
+        pixel_scales=pixel_scales,
+        radius=mask_radius,
+        sub_size=sub_size,
+    )
+
+    grid = al.masked_grid.from_mask(mask=mask)
+
+    tracer = al.Tracer.from_galaxies(
+        galaxies=lens_galaxies_for_total_planes(total_planes=total_planes)
+        + [source_galaxy()]
+    )
+
+    def func():
+        tracer.clear_traced_grids_cache()
+        tracer.traced_grids_of_planes_from_grid(grid=grid)
+
+    return func
+
+
+def benchmark_imaging_fit(mask_radius, sub_size, source):
+
+    imaging = simulate_imaging(mask_radius=mask_radius)
+
+    mask = al.mask.circular(
+        shape_2d=imaging.shape_2d,
+        pixel_scales=pixel_scales,
+        radius=mask_radius,
+        sub_size=sub_size,
+    )
+
+    masked_imaging = al.masked_imaging(imaging=imaging, mask=mask)
+
+    if source == "parametric":
+        galaxy = source_galaxy()
+    elif source == "rectangular":
+        galaxy = source_galaxy_with_pixelization(al.pix.Rectangular(shape=(30, 30)))
+    else:
+        galaxy = source_galaxy_with_pixelization(
+            al.pix.VoronoiMagnification(shape=(30, 30))
+        )
+
+    galaxies = lens_galaxies_for_total_planes(total_planes=2) + [galaxy]
+
+    def func():
+        tracer = al.Tracer.from_galaxies(galaxies=galaxies)
+        al.fit(masked_dataset=masked_imaging, tracer=tracer).figure_of_merit
+
+    return func
+
+
+def benchmark_interferometer_fit(mask_radius, sub_size, source):
+
+    shape_2d = 2 * (int(2.0 * mask_radius / pixel_scales) + 10,)
+
+    uv_wavelengths = np.random.RandomState(seed=1).uniform(
+        low=-1.0e5, high=1.0e5, size=(1000, 2)
+    )
+
+    interferometer_simulator = simulator.InterferometerSimulator(
+        real_space_shape_2d=shape_2d,
+        real_space_pixel_scales=pixel_scales,
+        uv_wavelengths=uv_wavelengths,
+        sub_size=1,
+        exposure_time=300.0,
+        background_level=0.1,
+        noise_seed=1,
+    )
+
+    interferometer = interferometer_simulator.from_tracer(
+        tracer=al.Tracer.from_galaxies(
+            galaxies=lens_galaxies_for_total_planes(total_planes=2) + [source_galaxy()]
+        )
+    )
+
+    masked_interferometer = al.masked_interferometer(
+        interferometer=interferometer,
+        visibilities_mask=np.full(fill_value=False, shape=uv_wavelengths.shape),
+        real_space_mask=al.mask.circular(
+            shape_2d=shape_2d,
+            pixel_scales=pixel_scales,
+            radius=mask_radius,
+            sub_size=sub_size,
+        ),
+    )
+
+    if source == "parametric":
+        galaxy = source_galaxy()
+    else:
+        galaxy = source_galaxy_with_pixelization(al.pix.Rectangular(shape=(20, 20)))
+
+    galaxies = lens_galaxies_for_total_planes(total_planes=2) + [galaxy]
+
+    def func():
+        tracer = al.Tracer.from_galaxies(galaxies=galaxies)
+        al.fit(masked_dataset=masked_interferometer, tracer=tracer).figure_of_merit
+
+    return func
+
+
+def benchmark_positions_fit(total_positions, total_planes):
+
+    positions = al.coordinates(
+        coordinates=[
+            [(1.0, 1.0), (-1.0, -1.0), (1.0, -1.0), (-1.0, 1.0)]
+            for _ in range(total_positions)
+        ]
+    )
+
+    galaxies = lens_galaxies_for_total_planes(total_planes=total_planes) + [
+        source_galaxy()
+    ]
+
+    def func():
+        tracer = al.Tracer.from_galaxies(galaxies=galaxies)
+        fit = al.fit_positions(positions=positions, tracer=tracer, noise_map=1.0)
+        fit.maximum_separation_within_threshold(threshold=0.5)
+        fit.figure_of_merit
+
+    return func
+
+
+def benchmark_hyper_galaxy_image_path_dict(mask_radius, total_galaxies):
+
+    af.conf.instance = af.conf.Config(
+        config_path="{}/../integration/config".format(profiling_path),
+        output_path="{}/output".format(profiling_path),
+    )
+
+    imaging = simulate_imaging(mask_radius=mask_radius)
+
+    mask = al.mask.circular(
+        shape_2d=imaging.shape_2d, pixel_scales=pixel_scales, radius=mask_radius
+    )
+
+    galaxies = {
+        "lens_{}".format(index): al.Galaxy(
+            redshift=0.5,
+            light=al.lp.EllipticalSersic(
+                centre=(0.1 * index, 0.0), intensity=0.1, effective_radius=0.5
+            ),
+        )
+        for index in range(total_galaxies)
+    }
+
+    phase = al.PhaseImaging(
+        phase_name="benchmark_hyper_galaxy_image_path_dict",
+        galaxies=galaxies,
+        sub_size=1,
+    )
+
+    analysis = phase.make_analysis(dataset=imaging, mask=mask)
+
+    instance = phase.model.instance_from_unit_vector([])
+
+    def func():
+        analysis._fit_cache.clear()
+
+        result = phase.Result(
+            instance=instance,
+            likelihood=1.0,
+            previous_model=phase.model,
+            gaussian_tuples=None,
+            analysis=analysis,
+            optimizer=None,
+        )
+
+        result.hyper_galaxy_image_path_dict
+        result.hyper_model_image
+
+    return func
+
+
+def benchmarks(quick=False):
+    """The name, parameters and function (returning the function which is timed) of every benchmark. If *quick* is \
+    True only the first value of every parameter is benchmarked."""
+
+    def values(parameter_values):
+        return parameter_values[:1] if quick else parameter_values
+
+    for mask_radius in values(mask_radii):
+        for sub_size in values(sub_sizes):
+            for planes in values(total_planes):
+                yield (
+                    "traced_grids_of_planes",
+                    dict(
+                        mask_radius=mask_radius, sub_size=sub_size, total_planes=planes
+                    ),
+                    benchmark_traced_grids_of_planes,
+                )
+
+    for mask_radius in values(mask_radii):
+        for sub_size in values(sub_sizes):
+            for source in values(["parametric", "rectangular", "voronoi"]):
+                yield (
+                    "imaging_fit",
+                    dict(mask_radius=mask_radius, sub_size=sub_size, source=source),
+                    benchmark_imaging_fit,
+                )
+
+    for mask_radius in values(mask_radii):
+        for sub_size in values(sub_sizes):
+            for source in values(["parametric", "rectangular"]):
+                yield (
+                    "interferometer_fit",
+                    dict(mask_radius=mask_radius, sub_size=sub_size, source=source),
+                    benchmark_interferometer_fit,
+                )
+
+    for total_positions in values([1, 10]):
+        for planes in values(total_planes):
+            yield (
+                "positions_fit",
+                dict(total_positions=total_positions, total_planes=planes),
+                benchmark_positions_fit,
+            )
+
+    for mask_radius in values(mask_radii):
+        for galaxies in values(total_galaxies):
+            yield (
+                "hyper_galaxy_image_path_dict",
+                dict(mask_radius=mask_radius, total_galaxies=galaxies),
+                benchmark_hyper_galaxy_image_path_dict,
+            )
+
+
+def benchmark_key(name, parameters):
+    return "{}[{}]".format(
+        name,
+        ",".join(
+            "{}={}".format(key, value) for key, value in sorted(parameters.items())
+        ),
+    )
+
+
+def git_commit():
+    try:
+        return (
+            subprocess.check_output(
+                ["git", "rev-parse", "HEAD"],
+                cwd=profiling_path,
+                stderr=subprocess.DEVNULL,
+            )
+            .decode()
+            .strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(output_path, repeats, quick=False, name_filter=None):
+
+    results = {
+        "commit": git_commit(),
+        "autolens_version": al.__version__,
+        "numpy_version": np.__version__,
+        "python_version": platform.python_version(),
+        "machine": platform.machine(),
+        "repeats": repeats,
+        "benchmarks": {},
+    }
+
+    for name, parameters, benchmark in benchmarks(quick=quick):
+
+        key = benchmark_key(name=name, parameters=parameters)
+
+        if name_filter is not None and name_filter not in key:
+            continue
+
+        func = benchmark(**parameters)
+
+        # The first call is not timed, so that numba compilation and one-off caching are excluded.
+        func()
+
+        times = timeit.repeat(func, number=1, repeat=repeats)
+
+        results["benchmarks"][key] = {
+            "name": name,
+            "parameters": parameters,
+            "times": times,
+            "min": min(times),
+            "median": float(np.median(times)),
+            "mean": float(np.mean(times)),
+        }
+
+        print(
+            "{} : median = {:.5f}s, min = {:.5f}s".format(
+                key, np.median(times), min(times)
+            )
+        )
+
+    with open(output_path, "w") as f:
+        json.dump(results, f, indent=4)
+
+    return results
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(
+        description="Time the likelihood hot path of PyAutoLens and output the timings to a .json file."
+    )
+    parser.add_argument(
+        "--output",
+        default="{}/benchmarks.json".format(profiling_path),
+        help="The .json file the timings are output to.",
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=5,
+        help="The number of times every benchmark is timed.",
+    )
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="Only benchmark the first value of every parameter.",
+    )
+    parser.add_argument(
+        "--filter",
+        default=None,
+        help="Only run the benchmarks whose name and parameters contain this string.",
+    )
+
+    args = parser.parse_args()
+
+    run(
+        output_path=args.output,
+        repeats=args.repeats,
+        quick=args.quick,
+        name_filter=args.filter,
+    )
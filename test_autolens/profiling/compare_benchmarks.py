@@ -0,0 +1,91 @@
+import argparse
+import json
+import sys
+
+# This script compares the timings of two runs of benchmarks.py (e.g. of two commits), printing the ratio of the
+# median time of every benchmark in both runs and exiting with status 1 if any benchmark is slower by more than a
+# tolerance, e.g.:
+#
+# python compare_benchmarks.py before.json after.json --tolerance 1.1
+
+
+def load_benchmarks(file_path):
+    with open(file_path, "r") as f:
+        return json.load(f)
+
+
+def ratios_of_medians_from_results(results_before, results_after):
+    """The ratio of the median time after to before of every benchmark in both runs, keyed by its name and \
+    parameters."""
+    return {
+        key: results_after["benchmarks"][key]["median"]
+        / results_before["benchmarks"][key]["median"]
+        for key in results_before["benchmarks"]
+        if key in results_after["benchmarks"]
+    }
+
+
+def compare(file_path_before, file_path_after, tolerance):
+
+    results_before = load_benchmarks(file_path=file_path_before)
+    results_after = load_benchmarks(file_path=file_path_after)
+
+    print(
+        "Comparing commit {} (before) to commit {} (after)".format(
+            results_before["commit"], results_after["commit"]
+        )
+    )
+
+    ratios = ratios_of_medians_from_results(
+        results_before=results_before, results_after=results_after
+    )
+
+    regressions = []
+
+    for key, ratio in sorted(ratios.items()):
+
+        if ratio > tolerance:
+            regressions.append(key)
+
+        print(
+            "{} : {:.5f}s -> {:.5f}s ({:.2f}x){}".format(
+                key,
+                results_before["benchmarks"][key]["median"],
+                results_after["benchmarks"][key]["median"],
+                ratio,
+                " REGRESSION" if ratio > tolerance else "",
+            )
+        )
+
+    print(
+        "{} of {} benchmarks are slower by more than a factor {}".format(
+            len(regressions), len(ratios), tolerance
+        )
+    )
+
+    return regressions
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(
+        description="Compare the timings of two runs of benchmarks.py."
+    )
+    parser.add_argument("before", help="The .json timings of the earlier run.")
+    parser.add_argument("after", help="The .json timings of the later run.")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=1.1,
+        help="The ratio of median times above which a benchmark is a regression.",
+    )
+
+    args = parser.parse_args()
+
+    regressions = compare(
+        file_path_before=args.before,
+        file_path_after=args.after,
+        tolerance=args.tolerance,
+    )
+
+    sys.exit(1 if len(regressions) > 0 else 0)
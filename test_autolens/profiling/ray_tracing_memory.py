@@ -0,0 +1,43 @@
+import tracemalloc
+
+import autolens as al
+
+# This script measures the peak memory allocated when a sub-gridded grid is ray-traced through a multi-plane tracer,
+# comparing the in-place tracing mode (the default) to the mode which allocates a new array for every pair of planes.
+
+sub_size = 4
+
+# A (250, 250) grid with sub_size=4 has 10^6 sub-pixels.
+grid = al.grid.uniform(shape_2d=(250, 250), pixel_scales=0.05, sub_size=sub_size)
+
+print("Number of sub-pixels = {}".format(grid.shape[0]))
+
+galaxies = [
+    al.Galaxy(
+        redshift=redshift,
+        mass=al.mp.SphericalIsothermal(centre=(0.0, 0.0), einstein_radius=0.5),
+    )
+    for redshift in [0.2, 0.4, 0.6, 0.8]
+]
+
+source_galaxy = al.Galaxy(
+    redshift=2.0, light=al.lp.SphericalSersic(centre=(0.0, 0.0), intensity=1.0)
+)
+
+for trace_grids_in_place in [False, True]:
+
+    tracer = al.Tracer.from_galaxies(galaxies=galaxies + [source_galaxy])
+    tracer.trace_grids_in_place = trace_grids_in_place
+
+    tracemalloc.start()
+
+    tracer.traced_grids_of_planes_from_grid(grid=grid)
+
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        "trace_grids_in_place = {}, peak memory allocated = {:.1f} MB".format(
+            trace_grids_in_place, peak / 1e6
+        )
+    )
@@ -1,6 +1,7 @@
 from autoarray.operators import convolver, transformer
 import autolens as al
 import numpy as np
+import pickle
 
 
 class TestMaskedImaging:
@@ -158,6 +159,85 @@ class TestMaskedImaging:
         assert masked_imaging_new.positions_threshold == 2
         assert masked_imaging_new.preload_sparse_grids_of_planes == 3
 
+    def test__output_arrays_to_memory_maps__arrays_memory_mapped_and_unchanged(
+        self, imaging_7x7, sub_mask_7x7, tmpdir
+    ):
+
+        masked_imaging_7x7 = al.masked_imaging(imaging=imaging_7x7, mask=sub_mask_7x7)
+
+        image = masked_imaging_7x7.image.copy()
+        grid = masked_imaging_7x7.grid.copy()
+        image_frame_1d_kernels = (
+            masked_imaging_7x7.convolver.image_frame_1d_kernels.copy()
+        )
+
+        masked_imaging_7x7.output_arrays_to_memory_maps(directory=str(tmpdir))
+
+        assert isinstance(masked_imaging_7x7.image.base, np.memmap)
+        assert isinstance(masked_imaging_7x7.grid.base, np.memmap)
+        assert isinstance(
+            masked_imaging_7x7.convolver.image_frame_1d_kernels.base, np.memmap
+        )
+
+        assert type(masked_imaging_7x7.image) == type(image)
+        assert type(masked_imaging_7x7.grid) == type(grid)
+        assert (masked_imaging_7x7.image == image).all()
+        assert (masked_imaging_7x7.grid == grid).all()
+        assert (masked_imaging_7x7.grid.mask == grid.mask).all()
+        assert (
+            masked_imaging_7x7.convolver.image_frame_1d_kernels
+            == image_frame_1d_kernels
+        ).all()
+
+    def test__pickle_after_output_arrays_to_memory_maps__unpickled_arrays_map_same_files(
+        self, imaging_7x7, sub_mask_7x7, tmpdir
+    ):
+
+        masked_imaging_7x7 = al.masked_imaging(
+            imaging=imaging_7x7, mask=sub_mask_7x7
+        ).output_arrays_to_memory_maps(directory=str(tmpdir))
+
+        masked_imaging_unpickled = pickle.loads(pickle.dumps(masked_imaging_7x7))
+
+        assert masked_imaging_unpickled.image.base.filename == str(
+            tmpdir.join("image.npy")
+        )
+        assert (
+            masked_imaging_unpickled.convolver.blurring_frame_1d_indexes.base.filename
+            == str(tmpdir.join("convolver.blurring_frame_1d_indexes.npy"))
+        )
+        assert not masked_imaging_unpickled.image.flags.writeable
+
+        assert (masked_imaging_unpickled.image == masked_imaging_7x7.image).all()
+        assert (
+            masked_imaging_unpickled.noise_map == masked_imaging_7x7.noise_map
+        ).all()
+        assert (masked_imaging_unpickled.grid == masked_imaging_7x7.grid).all()
+        assert (
+            masked_imaging_unpickled.blurring_grid == masked_imaging_7x7.blurring_grid
+        ).all()
+
+        # Pickling does not change the arrays of the masked imaging being pickled.
+
+        assert isinstance(
+            masked_imaging_7x7.convolver.image_frame_1d_kernels.base, np.memmap
+        )
+
+        fit = al.fit(
+            masked_dataset=masked_imaging_7x7,
+            tracer=al.Tracer.from_galaxies(
+                galaxies=[al.Galaxy(redshift=0.5, light=al.lp.EllipticalSersic())]
+            ),
+        )
+        fit_unpickled = al.fit(
+            masked_dataset=masked_imaging_unpickled,
+            tracer=al.Tracer.from_galaxies(
+                galaxies=[al.Galaxy(redshift=0.5, light=al.lp.EllipticalSersic())]
+            ),
+        )
+
+        assert fit.likelihood == fit_unpickled.likelihood
+
 
 class TestMaskedInterferometer:
     def test__masked_dataset_via_autoarray(
@@ -276,3 +356,47 @@ class TestMaskedInterferometer:
 
         assert (masked_interferometer.positions[0] == np.array([[1.0, 1.0]])).all()
         assert masked_interferometer.positions_threshold == 1.0
+
+    def test__transformer_class__sets_up_transformer_of_that_class(
+        self, interferometer_7, sub_mask_7x7, visibilities_mask_7x2
+    ):
+
+        masked_interferometer_7 = al.masked_interferometer(
+            interferometer=interferometer_7,
+            visibilities_mask=visibilities_mask_7x2,
+            real_space_mask=sub_mask_7x7,
+            transformer_class=al.transformer_nufft,
+        )
+
+        assert type(masked_interferometer_7.transformer) == al.transformer_nufft
+        assert (
+            masked_interferometer_7.transformer.uv_wavelengths
+            == interferometer_7.uv_wavelengths
+        ).all()
+        assert masked_interferometer_7.transformer.total_image_pixels == 9
+        assert (masked_interferometer_7.primary_beam.in_2d == np.ones((3, 3))).all()
+
+    def test__transformer_class_nufft__direct_fourier_transform_not_set_up(
+        self, interferometer_7, sub_mask_7x7, visibilities_mask_7x2, monkeypatch
+    ):
+        def direct_fourier_transform_set_up(*args, **kwargs):
+            raise AssertionError("The direct Fourier transform was set up")
+
+        monkeypatch.setattr(
+            transformer.Transformer, "__init__", direct_fourier_transform_set_up
+        )
+
+        masked_interferometer_7 = al.masked_interferometer(
+            interferometer=interferometer_7,
+            visibilities_mask=visibilities_mask_7x2,
+            real_space_mask=sub_mask_7x7,
+            transformer_class=al.transformer_nufft,
+        )
+
+        assert type(masked_interferometer_7.transformer) == al.transformer_nufft
+        assert not hasattr(
+            masked_interferometer_7.transformer, "preload_real_transforms"
+        )
+        assert not hasattr(
+            masked_interferometer_7.transformer, "preload_imag_transforms"
+        )
@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+import autolens as al
+
+
+@pytest.fixture(name="mask_circular")
+def make_mask_circular():
+    return al.mask.circular(
+        shape_2d=(20, 22), pixel_scales=0.05, radius=0.4, centre=(0.05, -0.1)
+    )
+
+
+@pytest.fixture(name="uv_wavelengths")
+def make_uv_wavelengths():
+    return 1.0e6 * np.random.RandomState(seed=1).randn(100, 2)
+
+
+class TestTransformerNUFFT:
+    def test__visibilities_from_image__same_as_direct_transform_to_tolerance(
+        self, mask_circular, uv_wavelengths
+    ):
+
+        grid_radians = al.masked_grid.from_mask(mask=mask_circular).in_radians
+
+        image = al.masked_array.manual_1d(
+            array=np.random.RandomState(seed=2).uniform(
+                size=mask_circular.pixels_in_mask
+            ),
+            mask=mask_circular,
+        )
+
+        transformer = al.transformer(
+            uv_wavelengths=uv_wavelengths, grid_radians=grid_radians
+        )
+
+        for kernel_width, tolerance in [(6, 1.0e-5), (8, 1.0e-7), (10, 1.0e-9)]:
+
+            transformer_nufft = al.transformer_nufft(
+                uv_wavelengths=uv_wavelengths,
+                grid_radians=grid_radians,
+                kernel_width=kernel_width,
+            )
+
+            visibilities = transformer.visibilities_from_image(image=image)
+            visibilities_nufft = transformer_nufft.visibilities_from_image(image=image)
+
+            assert visibilities_nufft.shape == visibilities.shape
+            assert np.max(
+                np.abs(visibilities_nufft - visibilities)
+            ) < tolerance * np.sum(np.abs(image))
+
+        assert transformer_nufft.real_visibilities_from_image(
+            image=image
+        ) == pytest.approx(visibilities[:, 0], 1.0e-4)
+        assert transformer_nufft.imag_visibilities_from_image(
+            image=image
+        ) == pytest.approx(visibilities[:, 1], 1.0e-4)
+
+    def test__transformed_mapping_matrices__same_as_direct_transform_to_tolerance(
+        self, mask_circular, uv_wavelengths
+    ):
+
+        grid_radians = al.masked_grid.from_mask(mask=mask_circular).in_radians
+
+        mapping_matrix = np.random.RandomState(seed=3).uniform(
+            size=(mask_circular.pixels_in_mask, 40)
+        )
+
+        transformer = al.transformer(
+            uv_wavelengths=uv_wavelengths, grid_radians=grid_radians
+        )
+        transformer_nufft = al.transformer_nufft(
+            uv_wavelengths=uv_wavelengths, grid_radians=grid_radians
+        )
+
+        max_transformed_images = al.util.nufft.max_transformed_images
+
+        al.util.nufft.max_transformed_images = 16
+
+        try:
+            transformed_mapping_matrices = transformer_nufft.transformed_mapping_matrices_from_mapping_matrix(
+                mapping_matrix=mapping_matrix
+            )
+        finally:
+            al.util.nufft.max_transformed_images = max_transformed_images
+
+        tolerance = 1.0e-5 * np.max(np.sum(mapping_matrix, axis=0))
+
+        for transformed_mapping_matrix, transformed_mapping_matrix_nufft in zip(
+            transformer.transformed_mapping_matrices_from_mapping_matrix(
+                mapping_matrix=mapping_matrix
+            ),
+            transformed_mapping_matrices,
+        ):
+
+            assert transformed_mapping_matrix_nufft.shape == (100, 40)
+            assert (
+                np.max(
+                    np.abs(
+                        transformed_mapping_matrix_nufft - transformed_mapping_matrix
+                    )
+                )
+                < tolerance
+            )
@@ -1,9 +1,15 @@
 from autoarray.operators.inversion import inversions
 from autoarray.operators import transformer as trans
 import autolens as al
+from autolens import exc
 from autolens.fit.fit import ImagingFit, InterferometerFit
+from autolens.lens.inversions import (
+    InversionImagingSparse,
+    InversionInterferometerWTilde,
+)
 import numpy as np
 import pytest
+from scipy import sparse
 
 from test_autoastro.mock.mock_profiles import MockLightProfile
 
@@ -950,6 +956,36 @@ class TestImagingFit:
             assert evidence == fit.evidence
             assert evidence == fit.figure_of_merit
 
+        def test___inversion_uses_sparse_matrices__same_fit_as_dense_matrices(
+            self, imaging_7x7, sub_mask_7x7
+        ):
+
+            pix = al.pix.Rectangular(shape=(3, 3))
+            reg = al.reg.Constant(coefficient=1.0)
+
+            g0 = al.Galaxy(redshift=0.5, pixelization=pix, regularization=reg)
+
+            tracer = al.Tracer.from_galaxies(galaxies=[al.Galaxy(redshift=0.5), g0])
+
+            masked_imaging = al.masked_imaging(imaging=imaging_7x7, mask=sub_mask_7x7)
+
+            masked_imaging_sparse = al.masked_imaging(
+                imaging=imaging_7x7,
+                mask=sub_mask_7x7,
+                inversion_uses_sparse_matrices=True,
+            )
+
+            fit = ImagingFit(masked_imaging=masked_imaging, tracer=tracer)
+
+            fit_sparse = ImagingFit(masked_imaging=masked_imaging_sparse, tracer=tracer)
+
+            assert not isinstance(fit.inversion, InversionImagingSparse)
+            assert isinstance(fit_sparse.inversion, InversionImagingSparse)
+            assert fit_sparse.model_image.in_1d == pytest.approx(
+                fit.model_image.in_1d, 1.0e-8
+            )
+            assert fit_sparse.evidence == pytest.approx(fit.evidence, 1.0e-8)
+
         def test___lens_fit_galaxy_model_image_dict__has_inversion_mapped_reconstructed_image(
             self, masked_imaging_7x7
         ):
@@ -1772,6 +1808,270 @@ class TestInterferometerFit:
 
             assert (fit.noise_map.in_1d == np.full(fill_value=3.0, shape=(3, 2))).all()
 
+    class TestUVCompression:
+        def test__chi_squared_and_likelihood_of_compressed_visibilities__same_as_uncompressed(
+            self
+        ):
+
+            random_state = np.random.RandomState(seed=1)
+
+            real_space_mask = al.mask.circular(
+                shape_2d=(15, 15), pixel_scales=0.1, radius=0.5, sub_size=1
+            )
+
+            uv_cell_centres = random_state.uniform(-3.0e5, 3.0e5, size=(50, 1, 2))
+
+            uv_wavelengths = (
+                uv_cell_centres + random_state.uniform(-150.0, 150.0, size=(50, 20, 2))
+            ).reshape(1000, 2)
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(
+                        redshift=0.5,
+                        light=al.lp.EllipticalSersic(
+                            axis_ratio=0.8, intensity=0.1, effective_radius=0.2
+                        ),
+                    )
+                ]
+            )
+
+            noise_map = np.repeat(
+                random_state.uniform(0.05, 0.2, size=(1000, 1)), 2, axis=1
+            )
+
+            visibilities = tracer.profile_visibilities_from_grid_and_transformer(
+                grid=al.masked_grid.from_mask(mask=real_space_mask),
+                transformer=al.transformer(
+                    uv_wavelengths=uv_wavelengths,
+                    grid_radians=al.masked_grid.from_mask(
+                        mask=real_space_mask
+                    ).in_radians,
+                ),
+            ) + noise_map * random_state.randn(1000, 2)
+
+            interferometer = al.interferometer.manual(
+                visibilities=al.visibilities.manual_1d(visibilities=visibilities),
+                noise_map=al.visibilities.manual_1d(visibilities=noise_map),
+                uv_wavelengths=uv_wavelengths,
+            )
+
+            visibilities_mask = np.full(fill_value=False, shape=(1000, 2))
+
+            masked_interferometer = al.masked_interferometer(
+                interferometer=interferometer,
+                visibilities_mask=visibilities_mask,
+                real_space_mask=real_space_mask,
+            )
+
+            masked_interferometer_compressed = al.masked_interferometer(
+                interferometer=interferometer,
+                visibilities_mask=visibilities_mask,
+                real_space_mask=real_space_mask,
+                uv_cell_size=500.0,
+            )
+
+            assert masked_interferometer.uv_compression_chi_squared == 0.0
+            assert masked_interferometer_compressed.visibilities.shape_1d < 250
+            assert masked_interferometer_compressed.uv_compression_chi_squared > 0.0
+
+            other_tracer = al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(
+                        redshift=0.5,
+                        light=al.lp.EllipticalSersic(
+                            axis_ratio=0.7, intensity=0.1, effective_radius=0.21
+                        ),
+                    )
+                ]
+            )
+
+            chi_squareds = []
+
+            for fit_tracer in [tracer, other_tracer]:
+
+                fit = InterferometerFit(
+                    masked_interferometer=masked_interferometer, tracer=fit_tracer
+                )
+
+                fit_compressed = InterferometerFit(
+                    masked_interferometer=masked_interferometer_compressed,
+                    tracer=fit_tracer,
+                )
+
+                assert fit_compressed.chi_squared == pytest.approx(
+                    fit.chi_squared, 1.0e-4
+                )
+                assert fit_compressed.noise_normalization == pytest.approx(
+                    fit.noise_normalization, 1.0e-8
+                )
+                assert fit_compressed.likelihood == pytest.approx(
+                    fit.likelihood, 1.0e-4
+                )
+
+                chi_squareds.append((fit.chi_squared, fit_compressed.chi_squared))
+
+            assert chi_squareds[1][1] - chi_squareds[0][1] == pytest.approx(
+                chi_squareds[1][0] - chi_squareds[0][0], 1.0e-4
+            )
+
+        def test__hyper_background_noise__compressed_fit_raises_error_uncompressed_fit_does_not(
+            self
+        ):
+
+            random_state = np.random.RandomState(seed=1)
+
+            real_space_mask = al.mask.circular(
+                shape_2d=(15, 15), pixel_scales=0.1, radius=0.5, sub_size=1
+            )
+
+            uv_wavelengths = random_state.uniform(-3.0e5, 3.0e5, size=(100, 2))
+
+            interferometer = al.interferometer.manual(
+                visibilities=al.visibilities.manual_1d(
+                    visibilities=random_state.randn(100, 2)
+                ),
+                noise_map=al.visibilities.ones(shape_1d=(100,)),
+                uv_wavelengths=uv_wavelengths,
+            )
+
+            visibilities_mask = np.full(fill_value=False, shape=(100, 2))
+
+            masked_interferometer = al.masked_interferometer(
+                interferometer=interferometer,
+                visibilities_mask=visibilities_mask,
+                real_space_mask=real_space_mask,
+            )
+
+            masked_interferometer_compressed = al.masked_interferometer(
+                interferometer=interferometer,
+                visibilities_mask=visibilities_mask,
+                real_space_mask=real_space_mask,
+                uv_cell_size=500.0,
+            )
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(
+                        redshift=0.5,
+                        light=al.lp.EllipticalSersic(
+                            axis_ratio=0.8, intensity=0.1, effective_radius=0.2
+                        ),
+                    )
+                ]
+            )
+
+            hyper_background_noise = al.hyper_data.HyperBackgroundNoise(noise_scale=1.0)
+
+            fit = InterferometerFit(
+                masked_interferometer=masked_interferometer,
+                tracer=tracer,
+                hyper_background_noise=hyper_background_noise,
+            )
+
+            assert (fit.noise_map == 2.0 * np.ones((100, 2))).all()
+
+            with pytest.raises(exc.SettingsException):
+                InterferometerFit(
+                    masked_interferometer=masked_interferometer_compressed,
+                    tracer=tracer,
+                    hyper_background_noise=hyper_background_noise,
+                )
+
+    class TestWTilde:
+        def test__inversion_via_w_tilde__same_as_via_transformed_mapping_matrices(self):
+
+            random_state = np.random.RandomState(seed=1)
+
+            real_space_mask = al.mask.circular(
+                shape_2d=(15, 15), pixel_scales=0.1, radius=0.5, sub_size=2
+            )
+
+            uv_wavelengths = random_state.uniform(-3.0e5, 3.0e5, size=(200, 2))
+
+            noise_map = random_state.uniform(0.05, 0.2, size=(200, 2))
+
+            interferometer = al.interferometer.manual(
+                visibilities=al.visibilities.manual_1d(
+                    visibilities=random_state.randn(200, 2)
+                ),
+                noise_map=al.visibilities.manual_1d(visibilities=noise_map),
+                uv_wavelengths=uv_wavelengths,
+            )
+
+            visibilities_mask = np.full(fill_value=False, shape=(200, 2))
+
+            masked_interferometer = al.masked_interferometer(
+                interferometer=interferometer,
+                visibilities_mask=visibilities_mask,
+                real_space_mask=real_space_mask,
+            )
+
+            masked_interferometer_w_tilde = al.masked_interferometer(
+                interferometer=interferometer,
+                visibilities_mask=visibilities_mask,
+                real_space_mask=real_space_mask,
+                inversion_uses_w_tilde=True,
+            )
+
+            assert masked_interferometer.w_tilde is None
+            assert masked_interferometer_w_tilde.w_tilde.shape == (
+                real_space_mask.pixels_in_mask,
+                real_space_mask.pixels_in_mask,
+            )
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(
+                        redshift=0.5,
+                        light=al.lp.EllipticalSersic(intensity=0.1),
+                        mass=al.mp.SphericalIsothermal(einstein_radius=0.3),
+                    ),
+                    al.Galaxy(
+                        redshift=1.0,
+                        pixelization=al.pix.Rectangular(shape=(4, 4)),
+                        regularization=al.reg.Constant(coefficient=1.0),
+                    ),
+                ]
+            )
+
+            fit = InterferometerFit(
+                masked_interferometer=masked_interferometer, tracer=tracer
+            )
+
+            fit_w_tilde = InterferometerFit(
+                masked_interferometer=masked_interferometer_w_tilde, tracer=tracer
+            )
+
+            assert isinstance(fit_w_tilde.inversion, InversionInterferometerWTilde)
+            assert sparse.issparse(fit_w_tilde.inversion.mapping_matrix)
+            assert (
+                fit_w_tilde.inversion.mapped_reconstructed_image.in_1d_binned
+                == pytest.approx(
+                    fit.inversion.mapped_reconstructed_image.in_1d_binned, 1.0e-8
+                )
+            )
+            assert fit_w_tilde.inversion.reconstruction == pytest.approx(
+                fit.inversion.reconstruction, 1.0e-8
+            )
+            assert fit_w_tilde.model_visibilities.in_1d == pytest.approx(
+                fit.model_visibilities.in_1d, 1.0e-8
+            )
+            assert fit_w_tilde.likelihood_with_regularization == pytest.approx(
+                fit.likelihood_with_regularization, 1.0e-8
+            )
+            assert fit_w_tilde.evidence == pytest.approx(fit.evidence, 1.0e-8)
+
+            fit_w_tilde = InterferometerFit(
+                masked_interferometer=masked_interferometer_w_tilde,
+                tracer=tracer,
+                hyper_background_noise=al.hyper_data.HyperBackgroundNoise(
+                    noise_scale=1.0
+                ),
+            )
+
+            assert not isinstance(fit_w_tilde.inversion, InversionInterferometerWTilde)
+
     class TestCompareToManualProfilesOnly:
         def test___all_lens_fit_quantities__no_hyper_methods(
             self, masked_interferometer_7
@@ -2536,6 +2836,35 @@ class TestPositionsFit:
         assert fit.maximum_separations[1] == np.sqrt(18)
         assert fit.maximum_separations[2] == np.sqrt(18)
 
+    def test_multiple_sets_of_positions_of_different_sizes__multiple_sets_of_max_distances(
+        self
+    ):
+        positions = al.coordinates(
+            [
+                [(0.0, 0.0), (0.0, 1.0)],
+                [(0.0, 0.0), (0.0, 0.0), (3.0, 3.0), (1.0, 1.0)],
+                [(1.0, 1.0)],
+                [(-2.0, -4.0), (1.0, 3.0), (0.1, 0.1)],
+            ]
+        )
+        tracer = MockTracerPositions(positions=positions)
+
+        fit = al.fit_positions(positions=positions, tracer=tracer, noise_map=1.0)
+
+        assert fit.maximum_separations == [
+            1.0,
+            np.sqrt(18),
+            0.0,
+            np.sqrt(np.square(3.0) + np.square(7.0)),
+        ]
+
+        assert fit.maximum_separation_within_threshold(threshold=np.sqrt(58.0))
+        assert not fit.maximum_separation_within_threshold(threshold=7.6)
+
+        assert al.fit_positions.max_separation_of_grid(
+            grid=al.grid_irregular.manual_1d([(0.0, 0.0), (3.0, 3.0), (1.0, 1.0)])
+        ) == np.sqrt(18)
+
     def test__likelihood__is_sum_of_separations_divided_by_noise(self):
         positions = al.coordinates(
             [
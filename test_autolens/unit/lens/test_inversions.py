@@ -0,0 +1,55 @@
+import pytest
+
+import autolens as al
+from autoarray.operators.inversion import inversions as inv
+from autolens.lens import inversions
+
+
+class TestInversionImagingSparse:
+    def test__same_as_dense_inversion_imaging(self, sub_grid_7x7, masked_imaging_7x7):
+
+        mapper = al.pix.Rectangular(shape=(3, 3)).mapper_from_grid_and_sparse_grid(
+            grid=sub_grid_7x7, inversion_uses_border=False
+        )
+
+        regularization = al.reg.Constant(coefficient=1.0)
+
+        inversion = inv.InversionImaging.from_data_mapper_and_regularization(
+            image=masked_imaging_7x7.image,
+            noise_map=masked_imaging_7x7.noise_map,
+            convolver=masked_imaging_7x7.convolver,
+            mapper=mapper,
+            regularization=regularization,
+        )
+
+        inversion_sparse = inversions.InversionImagingSparse.from_data_mapper_and_regularization(
+            image=masked_imaging_7x7.image,
+            noise_map=masked_imaging_7x7.noise_map,
+            convolver=masked_imaging_7x7.convolver,
+            mapper=mapper,
+            regularization=regularization,
+        )
+
+        assert (
+            inversion_sparse.blurred_mapping_matrix.toarray()
+            == inversion.blurred_mapping_matrix
+        ).all()
+        assert inversion_sparse.curvature_reg_matrix.toarray() == pytest.approx(
+            inversion.curvature_reg_matrix, 1.0e-8
+        )
+        assert inversion_sparse.reconstruction == pytest.approx(
+            inversion.reconstruction, 1.0e-8
+        )
+        assert inversion_sparse.mapped_reconstructed_image == pytest.approx(
+            inversion.mapped_reconstructed_image, 1.0e-8
+        )
+        assert inversion_sparse.errors == pytest.approx(inversion.errors, 1.0e-8)
+        assert inversion_sparse.regularization_term == pytest.approx(
+            inversion.regularization_term, 1.0e-8
+        )
+        assert inversion_sparse.log_det_curvature_reg_matrix_term == pytest.approx(
+            inversion.log_det_curvature_reg_matrix_term, 1.0e-8
+        )
+        assert inversion_sparse.log_det_regularization_matrix_term == pytest.approx(
+            inversion.log_det_regularization_matrix_term, 1.0e-8
+        )
@@ -920,6 +920,62 @@ class TestAbstractPlaneLensing:
             assert (profile_image[0] == 0.0).all()
             assert (profile_image[1] == 0.0).all()
 
+        def test__fractional_accuracy__adaptive_sub_grid_image_matches_fixed_sub_sizes(
+            self
+        ):
+            mask = al.mask.circular(
+                shape_2d=(11, 11), pixel_scales=0.2, sub_size=1, radius=1.0
+            )
+
+            plane = al.Plane(
+                galaxies=[
+                    al.Galaxy(
+                        redshift=0.5,
+                        light=al.lp.EllipticalSersic(
+                            intensity=1.0, effective_radius=0.3, sersic_index=4.0
+                        ),
+                    )
+                ],
+                redshift=None,
+            )
+
+            def profile_image_binned_via_sub_size(sub_size):
+                grid = al.grid.from_mask(
+                    mask=mask.mapping.mask_new_sub_size_from_mask(
+                        mask=mask, sub_size=sub_size
+                    )
+                )
+                return grid.mapping.array_stored_1d_binned_from_sub_array_1d(
+                    sub_array_1d=plane.profile_image_from_grid(grid=grid)
+                )
+
+            grid = al.grid.from_mask(mask=mask)
+
+            profile_image = plane.profile_image_from_grid(
+                grid=grid, fractional_accuracy=1.0e8
+            )
+
+            assert profile_image.shape_2d == (11, 11)
+            assert profile_image.in_1d == pytest.approx(
+                profile_image_binned_via_sub_size(sub_size=2), 1.0e-8
+            )
+
+            profile_image = plane.profile_image_from_grid(
+                grid=grid, fractional_accuracy=0.0
+            )
+
+            assert profile_image.in_1d == pytest.approx(
+                profile_image_binned_via_sub_size(sub_size=8), 1.0e-8
+            )
+
+            profile_image = plane.profile_image_from_grid(
+                grid=grid, fractional_accuracy=1.0e-2
+            )
+
+            assert profile_image.in_1d == pytest.approx(
+                profile_image_binned_via_sub_size(sub_size=8), 1.0e-2
+            )
+
     class TestConvergence:
         def test__convergence_same_as_multiple_galaxies__include_reshape_mapping(
             self, sub_grid_7x7
@@ -3,6 +3,8 @@ from skimage import measure
 import numpy as np
 import pytest
 from astropy import cosmology as cosmo
+from autolens import exc
+from autolens.lens import inversions
 from test_autoarray.mock import mock_inversion as mock_inv
 
 
@@ -1153,6 +1155,73 @@ class TestAbstractTracerCosmology:
         assert tracer.planes[2].galaxies == [g0, g1]
         assert tracer.planes[3].galaxies == [g3, g5]
 
+    def test__scaling_factors_between_planes__matrix_matches_individual_scaling_factors(
+        self
+    ):
+
+        g0 = al.Galaxy(redshift=0.1)
+        g1 = al.Galaxy(redshift=1.0)
+        g2 = al.Galaxy(redshift=2.0)
+        g3 = al.Galaxy(redshift=3.0)
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[g0, g1, g2, g3], cosmology=cosmo.Planck15
+        )
+
+        scaling_factors = tracer.scaling_factors_between_planes
+
+        assert scaling_factors.shape == (4, 4)
+        assert scaling_factors[0, 1] == pytest.approx(0.9348, 1e-4)
+        assert scaling_factors[0, 2] == pytest.approx(0.984, 1e-4)
+        assert scaling_factors[0, 3] == pytest.approx(1.0, 1e-4)
+        assert scaling_factors[1, 2] == pytest.approx(0.754, 1e-4)
+        assert scaling_factors[1, 3] == pytest.approx(1.0, 1e-4)
+        assert scaling_factors[2, 3] == pytest.approx(1.0, 1e-4)
+
+        for i in range(4):
+            for j in range(i + 1, 4):
+                scaling_factor = al.util.cosmology.scaling_factor_between_redshifts_from_redshifts_and_cosmology(
+                    redshift_0=tracer.plane_redshifts[i],
+                    redshift_1=tracer.plane_redshifts[j],
+                    redshift_final=tracer.plane_redshifts[-1],
+                    cosmology=cosmo.Planck15,
+                )
+
+                assert scaling_factors[i, j] == pytest.approx(scaling_factor, 1.0e-8)
+
+    def test__tracer_cosmology__shared_between_tracers_with_same_redshifts_and_cosmology(
+        self
+    ):
+
+        g0 = al.Galaxy(redshift=0.5)
+        g1 = al.Galaxy(redshift=1.0)
+        g2 = al.Galaxy(redshift=2.0)
+
+        tracer_0 = al.Tracer.from_galaxies(galaxies=[g0, g1], cosmology=cosmo.Planck15)
+        tracer_1 = al.Tracer.from_galaxies(galaxies=[g0, g1], cosmology=cosmo.Planck15)
+
+        assert tracer_0.tracer_cosmology is tracer_1.tracer_cosmology
+
+        tracer_1.critical_surface_density_between_planes_in_units(
+            i=0, j=1, unit_length="kpc", unit_mass="solMass"
+        )
+
+        assert (
+            "critical_surface_density",
+            0,
+            1,
+            "kpc",
+            "solMass",
+        ) in tracer_0.tracer_cosmology.results
+
+        tracer_2 = al.Tracer.from_galaxies(galaxies=[g0, g2], cosmology=cosmo.Planck15)
+
+        assert tracer_2.tracer_cosmology is not tracer_0.tracer_cosmology
+
+        tracer_3 = al.Tracer.from_galaxies(galaxies=[g0, g1], cosmology=cosmo.WMAP7)
+
+        assert tracer_3.tracer_cosmology is not tracer_0.tracer_cosmology
+
 
 class TestAbstractTracerLensing:
     class TestTracedGridsFromGrid:
@@ -1657,6 +1726,398 @@ class TestAbstractTracerLensing:
 
             assert len(traced_grids_of_planes) == 2
 
+        def test__grid_traced_twice__traced_grids_reused_until_cache_cleared(
+            self, sub_grid_7x7_simple, gal_x1_mp
+        ):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[gal_x1_mp, al.Galaxy(redshift=1.0)]
+            )
+
+            traced_grids_of_planes_0 = tracer._traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7_simple, plane_index_limit=0
+            )
+
+            assert len(traced_grids_of_planes_0) == 1
+
+            traced_grids_of_planes_1 = tracer._traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7_simple
+            )
+
+            assert len(traced_grids_of_planes_1) == 2
+            assert traced_grids_of_planes_1[0] is traced_grids_of_planes_0[0]
+            assert traced_grids_of_planes_1[1][1] == pytest.approx(
+                np.array([0.0, 0.0]), 1e-3
+            )
+
+            traced_grids_of_planes_2 = tracer._traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7_simple
+            )
+
+            assert traced_grids_of_planes_2[0] is traced_grids_of_planes_1[0]
+            assert traced_grids_of_planes_2[1] is traced_grids_of_planes_1[1]
+
+            traced_deflections_of_planes = tracer.traced_deflections_of_planes_from_grid(
+                grid=sub_grid_7x7_simple
+            )
+
+            assert traced_deflections_of_planes[0][1] == pytest.approx(
+                np.array([1.0, 0.0]), 1e-3
+            )
+
+            tracer.clear_traced_grids_cache()
+
+            traced_grids_of_planes_3 = tracer._traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7_simple
+            )
+
+            assert traced_grids_of_planes_3[1] is not traced_grids_of_planes_1[1]
+            assert (traced_grids_of_planes_3[1] == traced_grids_of_planes_1[1]).all()
+
+        def test__traced_grids_returned__copies_which_do_not_affect_later_tracing(
+            self, sub_grid_7x7_simple, gal_x1_mp
+        ):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[gal_x1_mp, al.Galaxy(redshift=1.0)]
+            )
+
+            traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7_simple
+            )
+
+            source_plane_grid = traced_grids_of_planes[1].copy()
+
+            traced_grids_of_planes[1] += 1.0
+
+            tracer.traced_deflections_of_planes_from_grid(grid=sub_grid_7x7_simple)[0][
+                :
+            ] = 0.0
+
+            assert (
+                tracer.traced_grids_of_planes_from_grid(grid=sub_grid_7x7_simple)[1]
+                == source_plane_grid
+            ).all()
+            assert (
+                tracer.grid_at_redshift_from_grid_and_redshift(
+                    grid=sub_grid_7x7_simple, redshift=1.0
+                )
+                == source_plane_grid
+            ).all()
+
+        def test__grid_garbage_collected__removed_from_cache(
+            self, sub_grid_7x7_simple, gal_x1_mp
+        ):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[gal_x1_mp, al.Galaxy(redshift=1.0)]
+            )
+
+            grid = sub_grid_7x7_simple.copy()
+            grid_id = id(grid)
+
+            tracer.traced_grids_of_planes_from_grid(grid=grid)
+
+            assert grid_id in tracer._traced_grids_cache
+
+            del grid
+
+            assert grid_id not in tracer._traced_grids_cache
+
+        def test__trace_grids_in_place_false__same_traced_grids_as_in_place(
+            self, sub_grid_7x7
+        ):
+
+            galaxies = [
+                al.Galaxy(
+                    redshift=0.5,
+                    mass_profile=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                ),
+                al.Galaxy(
+                    redshift=1.0,
+                    mass_profile=al.mp.SphericalIsothermal(einstein_radius=0.5),
+                ),
+                al.Galaxy(
+                    redshift=1.5,
+                    mass_profile=al.mp.SphericalIsothermal(einstein_radius=0.2),
+                ),
+                al.Galaxy(redshift=2.0),
+            ]
+
+            tracer = al.Tracer.from_galaxies(galaxies=galaxies)
+
+            assert tracer.trace_grids_in_place is True
+
+            traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            tracer = al.Tracer.from_galaxies(galaxies=galaxies)
+            tracer.trace_grids_in_place = False
+
+            traced_grids_of_planes_allocated = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            for traced_grid, traced_grid_allocated in zip(
+                traced_grids_of_planes, traced_grids_of_planes_allocated
+            ):
+                assert (traced_grid == traced_grid_allocated).all()
+
+    class TestTracedGridsOfTracers:
+        def test__grid_traced_through_many_tracers__same_as_tracing_each_tracer(
+            self, sub_grid_7x7
+        ):
+
+            tracers = [
+                al.Tracer.from_galaxies(
+                    galaxies=[
+                        al.Galaxy(
+                            redshift=0.5,
+                            mass_profile=al.mp.SphericalIsothermal(
+                                einstein_radius=einstein_radius
+                            ),
+                        ),
+                        al.Galaxy(
+                            redshift=1.0,
+                            mass_profile=al.mp.SphericalIsothermal(
+                                einstein_radius=0.5 * einstein_radius
+                            ),
+                        ),
+                        al.Galaxy(
+                            redshift=2.0,
+                            light_profile=al.lp.EllipticalSersic(intensity=1.0),
+                        ),
+                    ]
+                )
+                for einstein_radius in [0.8, 1.0, 1.2]
+            ]
+
+            traced_grids_of_planes = al.Tracer.traced_grids_of_planes_of_tracers_from_grid(
+                tracers=tracers, grid=sub_grid_7x7
+            )
+
+            assert len(traced_grids_of_planes) == 3
+            assert traced_grids_of_planes[2].shape == (3, sub_grid_7x7.shape[0], 2)
+
+            profile_images = al.Tracer.profile_images_of_tracers_from_grid(
+                tracers=tracers, grid=sub_grid_7x7
+            )
+
+            assert profile_images.shape[0] == 3
+
+            for tracer_index, tracer in enumerate(tracers):
+
+                tracer_single = al.Tracer(
+                    planes=tracer.planes, cosmology=tracer.cosmology
+                )
+
+                traced_grids_of_planes_single = tracer_single.traced_grids_of_planes_from_grid(
+                    grid=sub_grid_7x7
+                )
+
+                for plane_index in range(3):
+                    assert traced_grids_of_planes[plane_index][
+                        tracer_index
+                    ] == pytest.approx(
+                        traced_grids_of_planes_single[plane_index], 1.0e-8
+                    )
+
+                assert tracer.traced_grids_of_planes_from_grid(grid=sub_grid_7x7)[
+                    2
+                ] == pytest.approx(traced_grids_of_planes_single[2], 1.0e-8)
+
+                assert profile_images[tracer_index] == pytest.approx(
+                    tracer_single.profile_image_from_grid(grid=sub_grid_7x7), 1.0e-8
+                )
+
+        def test__tracers_with_different_plane_redshifts__raises_exception(
+            self, sub_grid_7x7
+        ):
+
+            tracer_0 = al.Tracer.from_galaxies(
+                galaxies=[al.Galaxy(redshift=0.5), al.Galaxy(redshift=1.0)]
+            )
+            tracer_1 = al.Tracer.from_galaxies(
+                galaxies=[al.Galaxy(redshift=0.5), al.Galaxy(redshift=2.0)]
+            )
+
+            with pytest.raises(exc.RayTracingException):
+                al.Tracer.traced_grids_of_planes_of_tracers_from_grid(
+                    tracers=[tracer_0, tracer_1], grid=sub_grid_7x7
+                )
+
+    class TestInterpolatedDeflections:
+        def test__bilinear_interpolator__linear_values_interpolated_exactly(self):
+
+            grid = al.grid.uniform(shape_2d=(10, 10), pixel_scales=0.1, sub_size=1)
+
+            interpolator = al.util.lens.BilinearInterpolator(
+                grid=grid, pixel_scale_interpolation_grid=0.3
+            )
+
+            assert interpolator.shape_2d == (6, 6)
+            assert interpolator.interp_grid[0] == pytest.approx(
+                np.array([0.75, -0.75]), 1.0e-4
+            )
+
+            values = (
+                2.0 * interpolator.interp_grid[:, 0]
+                + 3.0 * interpolator.interp_grid[:, 1]
+            )
+
+            assert interpolator.interpolated_values_from_values(
+                values=values
+            ) == pytest.approx(2.0 * grid[:, 0] + 3.0 * grid[:, 1], 1.0e-4)
+
+        def test__traced_grids_with_interpolated_deflections__close_to_exact_traced_grids(
+            self
+        ):
+
+            grid = al.grid.uniform(shape_2d=(40, 40), pixel_scales=0.1, sub_size=2)
+
+            galaxies = [
+                al.Galaxy(
+                    redshift=0.5,
+                    mass=al.mp.SphericalCoredIsothermal(
+                        einstein_radius=1.0, core_radius=0.5
+                    ),
+                ),
+                al.Galaxy(
+                    redshift=1.0,
+                    mass=al.mp.SphericalCoredIsothermal(
+                        centre=(0.3, 0.2), einstein_radius=0.3, core_radius=0.5
+                    ),
+                ),
+                al.Galaxy(redshift=2.0),
+            ]
+
+            tracer = al.Tracer.from_galaxies(galaxies=galaxies)
+
+            traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(grid=grid)
+            grid_at_redshift = tracer.grid_at_redshift_from_grid_and_redshift(
+                grid=grid, redshift=0.75
+            )
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=galaxies, pixel_scale_interpolation_grid=0.2
+            )
+
+            traced_grids_of_planes_interpolated = tracer.traced_grids_of_planes_from_grid(
+                grid=grid
+            )
+
+            assert type(traced_grids_of_planes_interpolated[-1]) == type(grid)
+            assert (traced_grids_of_planes_interpolated[0] == grid).all()
+            assert (
+                0.0
+                < np.max(
+                    np.abs(
+                        traced_grids_of_planes_interpolated[-1]
+                        - traced_grids_of_planes[-1]
+                    )
+                )
+                < 1.0e-2
+            )
+
+            grid_at_redshift_interpolated = tracer.grid_at_redshift_from_grid_and_redshift(
+                grid=grid, redshift=0.75
+            )
+
+            assert (
+                0.0
+                < np.max(np.abs(grid_at_redshift_interpolated - grid_at_redshift))
+                < 1.0e-2
+            )
+
+        def test__interpolation_accuracy_not_met__exact_deflections_used(self):
+
+            grid = al.grid.uniform(shape_2d=(40, 40), pixel_scales=0.1, sub_size=1)
+
+            galaxies = [
+                al.Galaxy(
+                    redshift=0.5,
+                    mass=al.mp.SphericalCoredIsothermal(
+                        einstein_radius=1.0, core_radius=0.5
+                    ),
+                ),
+                al.Galaxy(redshift=1.0),
+            ]
+
+            tracer = al.Tracer.from_galaxies(galaxies=galaxies)
+
+            traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(grid=grid)
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=galaxies,
+                pixel_scale_interpolation_grid=0.2,
+                interpolation_accuracy=1.0e-8,
+            )
+
+            traced_grids_of_planes_interpolated = tracer.traced_grids_of_planes_from_grid(
+                grid=grid
+            )
+
+            assert (
+                traced_grids_of_planes_interpolated[1] == traced_grids_of_planes[1]
+            ).all()
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=galaxies,
+                pixel_scale_interpolation_grid=0.2,
+                interpolation_accuracy=1.0,
+            )
+
+            traced_grids_of_planes_interpolated = tracer.traced_grids_of_planes_from_grid(
+                grid=grid
+            )
+
+            assert (
+                traced_grids_of_planes_interpolated[1] != traced_grids_of_planes[1]
+            ).any()
+
+        def test__new_object_with_units_converted__keeps_interpolation_settings(self):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(
+                        redshift=0.5,
+                        mass=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                    ),
+                    al.Galaxy(redshift=1.0),
+                ],
+                pixel_scale_interpolation_grid=0.2,
+                interpolation_accuracy=1.0e-4,
+            )
+
+            tracer = tracer.new_object_with_units_converted(unit_length="arcsec")
+
+            assert tracer.pixel_scale_interpolation_grid == 0.2
+            assert tracer.interpolation_accuracy == 1.0e-4
+
+        def test__grid_with_fewer_coordinates_than_interpolation_grid__exact_deflections_used(
+            self
+        ):
+
+            positions = al.grid_irregular.manual_1d([(1.0, 0.0), (-1.0, 0.0)])
+
+            galaxies = [
+                al.Galaxy(
+                    redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)
+                ),
+                al.Galaxy(redshift=1.0),
+            ]
+
+            traced_positions = al.Tracer.from_galaxies(
+                galaxies=galaxies
+            ).traced_grids_of_planes_from_grid(grid=positions)[-1]
+
+            traced_positions_interpolated = al.Tracer.from_galaxies(
+                galaxies=galaxies, pixel_scale_interpolation_grid=0.1
+            ).traced_grids_of_planes_from_grid(grid=positions)[-1]
+
+            assert (traced_positions_interpolated == traced_positions).all()
+
     class TestProfileImages:
         def test__x1_plane__single_plane_tracer(self, sub_grid_7x7):
             g0 = al.Galaxy(
@@ -2063,6 +2524,43 @@ class TestAbstractTracerLensing:
             assert (image_dict[g2].in_2d == g2_image.in_2d).all()
             assert (image_dict[g3].in_2d == g3_image.in_2d).all()
 
+        def test__fractional_accuracy__adaptive_sub_grid_image_close_to_high_sub_size(
+            self
+        ):
+            mask = al.mask.circular(
+                shape_2d=(15, 15), pixel_scales=0.2, sub_size=1, radius=1.4
+            )
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(
+                        redshift=0.5,
+                        mass=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                    ),
+                    al.Galaxy(
+                        redshift=1.0,
+                        light=al.lp.EllipticalSersic(
+                            intensity=1.0, effective_radius=0.1, sersic_index=2.0
+                        ),
+                    ),
+                ]
+            )
+
+            grid = al.grid.from_mask(
+                mask=mask.mapping.mask_new_sub_size_from_mask(mask=mask, sub_size=8)
+            )
+
+            profile_image_sub_8 = grid.mapping.array_stored_1d_binned_from_sub_array_1d(
+                sub_array_1d=tracer.profile_image_from_grid(grid=grid)
+            )
+
+            profile_image = tracer.profile_image_from_grid(
+                grid=al.grid.from_mask(mask=mask), fractional_accuracy=1.0e-3
+            )
+
+            assert profile_image.shape_2d == (15, 15)
+            assert profile_image.in_1d == pytest.approx(profile_image_sub_8, 1.0e-2)
+
     class TestConvergence:
         def test__galaxy_mass_sis__no_source_plane_convergence(self, sub_grid_7x7):
 
@@ -2731,6 +3229,69 @@ class TestAbstractTracerLensing:
                 np.pi * 2.0 ** 2.0, 1.0e-1
             )
 
+    class TestCriticalCurvesAndCaustics:
+        def test__critical_curves_match_eigen_values_on_whole_calculation_grid(self):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(
+                        redshift=0.5,
+                        mass=al.mp.EllipticalIsothermal(
+                            einstein_radius=1.5, axis_ratio=0.7
+                        ),
+                    ),
+                    al.Galaxy(
+                        redshift=0.8,
+                        mass=al.mp.SphericalIsothermal(
+                            centre=(0.3, 0.2), einstein_radius=0.4
+                        ),
+                    ),
+                    al.Galaxy(redshift=1.0),
+                ]
+            )
+
+            grid = tracer.calculation_grid
+
+            for critical_curve, eigen_values in zip(
+                tracer.critical_curves,
+                [
+                    tracer.tangential_eigen_value_from_grid(grid=grid),
+                    tracer.radial_eigen_value_from_grid(grid=grid),
+                ],
+            ):
+
+                critical_curve_indices = measure.find_contours(eigen_values.in_2d, 0)
+
+                critical_curve_dense = grid.geometry.grid_scaled_from_grid_pixels_1d_for_marching_squares(
+                    grid_pixels_1d=critical_curve_indices[0],
+                    shape_2d=eigen_values.sub_shape_2d,
+                )
+
+                assert critical_curve == pytest.approx(critical_curve_dense, 1.0e-4)
+
+            assert tracer.tangential_caustic == pytest.approx(
+                tracer.tangential_critical_curve
+                - tracer.deflections_from_grid(grid=tracer.tangential_critical_curve),
+                1.0e-4,
+            )
+
+        def test__critical_curves_and_caustics_are_computed_once(self):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(
+                        redshift=0.5,
+                        mass=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                    ),
+                    al.Galaxy(redshift=1.0),
+                ]
+            )
+
+            assert tracer.critical_curves is tracer.critical_curves
+            assert tracer.caustics is tracer.caustics
+            assert tracer.tangential_critical_curve is tracer.critical_curves[0]
+            assert tracer.radial_caustic is tracer.caustics[1]
+
 
 class TestAbstractTracerData:
     class TestBlurredProfileImages:
@@ -2918,6 +3479,61 @@ class TestAbstractTracerData:
             assert (blurred_images[0].in_2d == blurred_image_0.in_2d).all()
             assert (blurred_images[1].in_2d == blurred_image_1.in_2d).all()
 
+        def test__grids_with_interpolators__deflections_interpolated_as_separate_tracing(
+            self, imaging_7x7, sub_mask_7x7
+        ):
+
+            masked_imaging = al.masked_imaging.manual(
+                imaging=imaging_7x7,
+                mask=sub_mask_7x7,
+                pixel_scale_interpolation_grid=0.3,
+            )
+
+            assert masked_imaging.grid.interpolator is not None
+            assert masked_imaging.blurring_grid.interpolator is not None
+
+            # The profiles cache their deflection angles of a grid, so every tracer is given new galaxies.
+
+            def make_tracer():
+                return al.Tracer.from_galaxies(
+                    galaxies=[
+                        al.Galaxy(
+                            redshift=0.5,
+                            mass=al.mp.EllipticalGaussian(
+                                axis_ratio=0.8, sigma=1.0, mass_to_light_ratio=1.0
+                            ),
+                        ),
+                        al.Galaxy(
+                            redshift=1.0, light=al.lp.EllipticalSersic(intensity=1.0)
+                        ),
+                    ]
+                )
+
+            blurred_image = make_tracer().blurred_profile_image_from_grid_and_convolver(
+                grid=masked_imaging.grid,
+                convolver=masked_imaging.convolver,
+                blurring_grid=masked_imaging.blurring_grid,
+            )
+
+            image = make_tracer().profile_image_from_grid(grid=masked_imaging.grid)
+            blurring_image = make_tracer().profile_image_from_grid(
+                grid=masked_imaging.blurring_grid
+            )
+
+            blurred_image_separate = masked_imaging.convolver.convolved_image_from_image_and_blurring_image(
+                image=image, blurring_image=blurring_image
+            )
+
+            assert blurred_image == pytest.approx(blurred_image_separate, 1.0e-8)
+
+            exact_image = make_tracer().profile_image_from_grid(
+                grid=al.masked_imaging.manual(
+                    imaging=imaging_7x7, mask=sub_mask_7x7
+                ).grid
+            )
+
+            assert (np.asarray(image) != np.asarray(exact_image)).any()
+
         def test__galaxy_blurred_image_dict_from_grid_and_convolver(
             self, sub_grid_7x7, blurring_grid_7x7, convolver_7x7
         ):
@@ -2986,6 +3602,92 @@ class TestAbstractTracerData:
             assert (blurred_image_dict[g2].in_1d == g2_blurred_image.in_1d).all()
             assert (blurred_image_dict[g3].in_1d == g3_blurred_image.in_1d).all()
 
+        def test__grid_and_blurring_grid_traced_and_evaluated_together__match_separate_calculations(
+            self, sub_grid_7x7, blurring_grid_7x7, convolver_7x7
+        ):
+
+            g0 = al.Galaxy(
+                redshift=0.5,
+                light_profile=al.lp.EllipticalSersic(intensity=1.0),
+                mass_profile=al.mp.SphericalIsothermal(einstein_radius=1.0),
+            )
+            g1 = al.Galaxy(
+                redshift=1.0,
+                light_profile=al.lp.EllipticalSersic(intensity=2.0),
+                mass_profile=al.mp.SphericalIsothermal(einstein_radius=0.5),
+            )
+            g2 = al.Galaxy(redshift=2.0)
+
+            separate_tracer = al.Tracer.from_galaxies(
+                galaxies=[g0, g1, g2], cosmology=cosmo.Planck15
+            )
+
+            profile_images_of_planes = separate_tracer.profile_images_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+            blurring_images_of_planes = separate_tracer.profile_images_of_planes_from_grid(
+                grid=blurring_grid_7x7
+            )
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[g0, g1, g2], cosmology=cosmo.Planck15
+            )
+
+            joint_profile_images_of_planes, joint_blurring_images_of_planes = tracer.profile_images_of_planes_from_grid_and_blurring_grid(
+                grid=sub_grid_7x7, blurring_grid=blurring_grid_7x7
+            )
+
+            assert len(joint_profile_images_of_planes) == 3
+
+            for plane_index in range(3):
+                assert joint_profile_images_of_planes[plane_index] == pytest.approx(
+                    profile_images_of_planes[plane_index], 1.0e-8
+                )
+                assert joint_blurring_images_of_planes[plane_index] == pytest.approx(
+                    blurring_images_of_planes[plane_index], 1.0e-8
+                )
+
+            assert id(sub_grid_7x7) in tracer._traced_grids_cache
+            assert id(blurring_grid_7x7) in tracer._traced_grids_cache
+            assert tracer.traced_grids_of_planes_from_grid(grid=blurring_grid_7x7)[
+                1
+            ] == pytest.approx(
+                separate_tracer.traced_grids_of_planes_from_grid(
+                    grid=blurring_grid_7x7
+                )[1],
+                1.0e-8,
+            )
+
+            blurred_image = tracer.blurred_profile_image_from_grid_and_convolver(
+                grid=sub_grid_7x7,
+                convolver=convolver_7x7,
+                blurring_grid=blurring_grid_7x7,
+            )
+
+            assert blurred_image == pytest.approx(
+                separate_tracer.blurred_profile_image_from_grid_and_convolver(
+                    grid=sub_grid_7x7,
+                    convolver=convolver_7x7,
+                    blurring_grid=blurring_grid_7x7,
+                ),
+                1.0e-8,
+            )
+
+            blurred_images_of_planes = tracer.blurred_profile_images_of_planes_from_grid_and_convolver(
+                grid=sub_grid_7x7,
+                convolver=convolver_7x7,
+                blurring_grid=blurring_grid_7x7,
+            )
+
+            assert sum(blurred_images_of_planes) == pytest.approx(blurred_image, 1.0e-8)
+
+            assert (
+                tracer.profile_images_of_planes_from_grid_and_blurring_grid(
+                    grid=sub_grid_7x7, blurring_grid=blurring_grid_7x7
+                )[0][1]
+                is joint_profile_images_of_planes[1]
+            )
+
     class TestUnmaskedBlurredProfileImages:
         def test__unmasked_images_of_tracer_planes_and_galaxies(self):
 
@@ -3510,10 +4212,25 @@ class TestAbstractTracerData:
                 inversion_uses_border=False,
             )
 
+            assert not isinstance(inversion, inversions.InversionImagingSparse)
             assert inversion.mapped_reconstructed_image == pytest.approx(
                 masked_imaging_7x7.image, 1.0e-2
             )
 
+            inversion_sparse = tracer.inversion_imaging_from_grid_and_data(
+                grid=sub_grid_7x7,
+                image=masked_imaging_7x7.image,
+                noise_map=masked_imaging_7x7.noise_map,
+                convolver=masked_imaging_7x7.convolver,
+                inversion_uses_border=False,
+                inversion_uses_sparse_matrices=True,
+            )
+
+            assert isinstance(inversion_sparse, inversions.InversionImagingSparse)
+            assert inversion_sparse.reconstruction == pytest.approx(
+                inversion.reconstruction, 1.0e-8
+            )
+
         def test__x1_inversion_interferometer_in_tracer__performs_inversion_correctly(
             self, sub_grid_7x7, masked_interferometer_7
         ):
@@ -4040,6 +4757,52 @@ class TestTacerFixedSlices:
             assert tracer.planes[2].galaxies == []
             assert tracer.planes[3].galaxies == [source_g0]
 
+        def test__line_of_sight_truncation_radius__set_on_planes_for_line_of_sight_galaxies(
+            self, sub_grid_7x7
+        ):
+            lens_g0 = al.Galaxy(
+                redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)
+            )
+            source_g0 = al.Galaxy(redshift=2.0)
+            los_g0 = al.Galaxy(
+                redshift=0.1,
+                mass=al.mp.SphericalIsothermal(centre=(1.0, 0.0), einstein_radius=0.1),
+            )
+
+            tracer = al.Tracer.sliced_tracer_from_lens_line_of_sight_and_source_galaxies(
+                lens_galaxies=[lens_g0],
+                line_of_sight_galaxies=[los_g0],
+                source_galaxies=[source_g0],
+                planes_between_lenses=[1, 1],
+                cosmology=cosmo.Planck15,
+                line_of_sight_truncation_radius=0.5,
+            )
+
+            assert tracer.planes[0].galaxies == [los_g0]
+            assert tracer.planes[0].truncation_radii_of_galaxies == [0.5]
+            assert tracer.planes[1].truncation_radii_of_galaxies == [None]
+            assert not hasattr(los_g0.mass, "deflections_truncation_radius")
+
+            deflections = tracer.planes[0].deflections_from_grid(grid=sub_grid_7x7)
+            convergence = tracer.planes[0].convergence_from_grid(grid=sub_grid_7x7)
+
+            within_truncation_radius = (
+                np.sqrt(
+                    np.square(sub_grid_7x7[:, 0] - 1.0) + np.square(sub_grid_7x7[:, 1])
+                )
+                <= 0.5
+            )
+
+            assert within_truncation_radius.any()
+            assert (np.asarray(deflections)[~within_truncation_radius] == 0.0).all()
+            assert (np.asarray(convergence)[~within_truncation_radius] == 0.0).all()
+            assert np.asarray(deflections)[within_truncation_radius] == pytest.approx(
+                np.asarray(los_g0.deflections_from_grid(grid=sub_grid_7x7))[
+                    within_truncation_radius
+                ],
+                1.0e-8,
+            )
+
     class TestPlaneGrids:
         def test__4_planes__data_grid_and_deflections_stacks_are_correct__sis_mass_profile(
             self, sub_grid_7x7_simple
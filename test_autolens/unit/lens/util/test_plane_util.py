@@ -0,0 +1,423 @@
+import numpy as np
+import pytest
+
+import autolens as al
+
+
+class TestDeflectionsOfGalaxies:
+    def test__groups_of_spherical_profiles__match_sum_of_deflections_of_each_galaxy(
+        self, sub_grid_7x7
+    ):
+
+        galaxies = [
+            al.Galaxy(
+                redshift=0.5,
+                mass=al.mp.SphericalIsothermal(
+                    centre=(0.1 * index, -0.05 * index), einstein_radius=0.1 + index
+                ),
+                subhalo=al.mp.SphericalNFW(
+                    centre=(-0.2 * index, 0.1), kappa_s=0.1, scale_radius=1.0 + index
+                ),
+                point=al.mp.PointMass(
+                    centre=(0.3, 0.05 * index), einstein_radius=0.2 * index
+                ),
+            )
+            for index in range(1, 4)
+        ] + [
+            al.Galaxy(
+                redshift=0.5,
+                mass=al.mp.EllipticalIsothermal(axis_ratio=0.7, einstein_radius=1.0),
+                shear=al.mp.ExternalShear(magnitude=0.05),
+            ),
+            al.Galaxy(redshift=0.5, light=al.lp.EllipticalSersic()),
+        ]
+
+        deflections = al.util.plane.deflections_of_galaxies_from_grid(
+            galaxies=galaxies, grid=sub_grid_7x7
+        )
+
+        summed_deflections = sum(
+            [galaxy.deflections_from_grid(grid=sub_grid_7x7) for galaxy in galaxies]
+        )
+
+        assert deflections == pytest.approx(np.asarray(summed_deflections), 1.0e-8)
+
+        plane = al.Plane(redshift=0.5, galaxies=galaxies)
+
+        assert plane.deflections_from_grid(grid=sub_grid_7x7) == pytest.approx(
+            np.asarray(summed_deflections), 1.0e-8
+        )
+
+    def test__groups_evaluated_in_chunks__same_as_single_pass(self, sub_grid_7x7):
+
+        galaxies = [
+            al.Galaxy(
+                redshift=0.5,
+                mass=al.mp.SphericalIsothermal(
+                    centre=(0.1 * index, 0.0), einstein_radius=0.1
+                ),
+            )
+            for index in range(5)
+        ]
+
+        deflections = al.util.plane.deflections_of_galaxies_from_grid(
+            galaxies=galaxies, grid=sub_grid_7x7
+        )
+
+        max_vectorised_elements = al.util.plane.max_vectorised_elements
+
+        al.util.plane.max_vectorised_elements = 2 * sub_grid_7x7.shape[0]
+
+        try:
+            chunked_deflections = al.util.plane.deflections_of_galaxies_from_grid(
+                galaxies=galaxies, grid=sub_grid_7x7
+            )
+        finally:
+            al.util.plane.max_vectorised_elements = max_vectorised_elements
+
+        assert chunked_deflections == pytest.approx(deflections, 1.0e-12)
+
+    def test__coordinates_at_profile_centre__moved_to_radial_minimum_as_profile_does(
+        self
+    ):
+
+        grid = al.grid_irregular.manual_1d(
+            grid=[[0.0, 0.0], [1.0e-10, 0.0], [1.0, 1.0]]
+        )
+
+        profiles = [
+            al.mp.SphericalIsothermal(centre=(0.0, 0.0), einstein_radius=1.0),
+            al.mp.SphericalIsothermal(centre=(1.0, 1.0), einstein_radius=2.0),
+        ]
+
+        deflections = al.util.plane.deflections_of_galaxies_from_grid(
+            galaxies=[al.Galaxy(redshift=0.5, mass=profile) for profile in profiles],
+            grid=grid,
+        )
+
+        assert deflections == pytest.approx(
+            np.asarray(
+                sum([profile.deflections_from_grid(grid=grid) for profile in profiles])
+            ),
+            1.0e-8,
+        )
+
+    def test__subclasses_of_galaxy_and_profiles__dispatched_on_exact_profile_type(
+        self, sub_grid_7x7
+    ):
+        class MockGalaxy(al.Galaxy):
+            pass
+
+        class MockSphericalIsothermal(al.mp.SphericalIsothermal):
+            def deflections_from_grid(self, grid):
+                return np.ones(shape=(grid.sub_shape_1d, 2))
+
+        galaxies = [
+            MockGalaxy(
+                redshift=0.5,
+                mass=al.mp.SphericalIsothermal(
+                    centre=(0.1 * index, 0.0), einstein_radius=0.1
+                ),
+            )
+            for index in range(3)
+        ] + [
+            al.Galaxy(
+                redshift=0.5,
+                mass=MockSphericalIsothermal(
+                    centre=(0.1 * index, 0.0), einstein_radius=0.1
+                ),
+            )
+            for index in range(3)
+        ]
+
+        deflections = al.util.plane.deflections_of_galaxies_from_grid(
+            galaxies=galaxies, grid=sub_grid_7x7
+        )
+
+        summed_deflections = sum(
+            [galaxy.deflections_from_grid(grid=sub_grid_7x7) for galaxy in galaxies]
+        )
+
+        assert deflections == pytest.approx(np.asarray(summed_deflections), 1.0e-8)
+
+    def test__grid_with_interpolator__profiles_evaluated_by_their_own_method(
+        self, sub_grid_7x7, monkeypatch
+    ):
+
+        galaxies = [
+            al.Galaxy(
+                redshift=0.5,
+                mass=al.mp.SphericalIsothermal(
+                    centre=(0.1 * index, 0.0), einstein_radius=0.1
+                ),
+            )
+            for index in range(3)
+        ]
+
+        grid = sub_grid_7x7
+
+        grid.interpolator = object()
+
+        def add_deflections_of_profiles_to_deflections(*args, **kwargs):
+            raise AssertionError()
+
+        monkeypatch.setattr(
+            al.util.plane,
+            "add_deflections_of_profiles_to_deflections",
+            add_deflections_of_profiles_to_deflections,
+        )
+
+        deflections = al.util.plane.deflections_of_galaxies_from_grid(
+            galaxies=galaxies, grid=grid
+        )
+
+        summed_deflections = sum(
+            [galaxy.deflections_from_grid(grid=grid) for galaxy in galaxies]
+        )
+
+        assert deflections == pytest.approx(np.asarray(summed_deflections), 1.0e-8)
+
+
+class TestDeflectionsStackOfGalaxiesOfPlanes:
+    def test__planes_with_different_grids__match_deflections_of_each_plane(
+        self, sub_grid_7x7
+    ):
+
+        galaxies_of_planes = [
+            [
+                al.Galaxy(
+                    redshift=0.5,
+                    mass=al.mp.SphericalIsothermal(
+                        centre=(0.1 * index, 0.0), einstein_radius=0.5 + 0.1 * index
+                    ),
+                ),
+                al.Galaxy(
+                    redshift=0.5,
+                    point=al.mp.PointMass(
+                        centre=(0.2, -0.1 * index), einstein_radius=0.1 * index
+                    ),
+                ),
+                al.Galaxy(
+                    redshift=0.5,
+                    mass=al.mp.EllipticalIsothermal(
+                        axis_ratio=0.7, einstein_radius=0.1 * index
+                    ),
+                ),
+            ]
+            for index in range(1, 4)
+        ]
+
+        grids = [sub_grid_7x7.copy() for index in range(3)]
+
+        for index, grid in enumerate(grids):
+            grid *= 1.0 + 0.1 * index
+
+        deflections_stack = al.util.plane.deflections_stack_of_galaxies_of_planes_from_grids(
+            galaxies_of_planes=galaxies_of_planes, grids=grids
+        )
+
+        assert deflections_stack.shape == (3, sub_grid_7x7.sub_shape_1d, 2)
+
+        max_vectorised_elements = al.util.plane.max_vectorised_elements
+
+        al.util.plane.max_vectorised_elements = 2 * sub_grid_7x7.shape[0]
+
+        try:
+            chunked_deflections_stack = al.util.plane.deflections_stack_of_galaxies_of_planes_from_grids(
+                galaxies_of_planes=galaxies_of_planes, grids=grids
+            )
+        finally:
+            al.util.plane.max_vectorised_elements = max_vectorised_elements
+
+        for galaxies, grid, deflections, chunked_deflections in zip(
+            galaxies_of_planes, grids, deflections_stack, chunked_deflections_stack
+        ):
+
+            plane = al.Plane(redshift=0.5, galaxies=galaxies)
+
+            assert deflections == pytest.approx(
+                np.asarray(plane.deflections_from_grid(grid=grid)), 1.0e-8
+            )
+            assert chunked_deflections == pytest.approx(deflections, 1.0e-12)
+
+    def test__planes_with_truncated_galaxies__match_deflections_of_each_plane(
+        self, sub_grid_7x7
+    ):
+
+        galaxies_of_planes = [
+            [
+                al.Galaxy(
+                    redshift=0.5,
+                    mass=al.mp.SphericalIsothermal(
+                        centre=(0.1 * index, 0.0), einstein_radius=0.5 + 0.1 * index
+                    ),
+                ),
+                al.Galaxy(
+                    redshift=0.5,
+                    mass=al.mp.SphericalIsothermal(
+                        centre=(0.5, -0.1 * index), einstein_radius=0.1 * index
+                    ),
+                ),
+            ]
+            for index in range(1, 4)
+        ]
+
+        truncation_radii_of_galaxies_of_planes = [[None, 0.6], None, [0.6, 0.6]]
+
+        deflections_stack = al.util.plane.deflections_stack_of_galaxies_of_planes_from_grids(
+            galaxies_of_planes=galaxies_of_planes,
+            grids=[sub_grid_7x7 for index in range(3)],
+            truncation_radii_of_galaxies_of_planes=truncation_radii_of_galaxies_of_planes,
+        )
+
+        for galaxies, truncation_radii_of_galaxies, deflections in zip(
+            galaxies_of_planes,
+            truncation_radii_of_galaxies_of_planes,
+            deflections_stack,
+        ):
+
+            plane = al.Plane(
+                redshift=0.5,
+                galaxies=galaxies,
+                truncation_radii_of_galaxies=truncation_radii_of_galaxies,
+            )
+
+            assert deflections == pytest.approx(
+                np.asarray(plane.deflections_from_grid(grid=sub_grid_7x7)), 1.0e-8
+            )
+
+
+class TestTruncatedDeflections:
+    def test__truncated_profiles__evaluated_only_within_truncation_radius(
+        self, sub_grid_7x7
+    ):
+
+        truncated_profiles = [
+            al.mp.SphericalIsothermal(centre=(0.5, -0.5), einstein_radius=0.2),
+            al.mp.SphericalNFW(centre=(-0.5, 0.0), kappa_s=0.1, scale_radius=1.0),
+            al.mp.EllipticalIsothermal(
+                centre=(0.0, 0.5), axis_ratio=0.8, einstein_radius=0.1
+            ),
+        ]
+
+        main_profile = al.mp.SphericalIsothermal(einstein_radius=1.0)
+
+        galaxies = [al.Galaxy(redshift=0.5, mass=main_profile)] + [
+            al.Galaxy(redshift=0.5, mass=profile) for profile in truncated_profiles
+        ]
+
+        deflections = al.util.plane.deflections_of_galaxies_from_grid(
+            galaxies=galaxies,
+            grid=sub_grid_7x7,
+            truncation_radii_of_galaxies=[None, 0.6, 0.6, 0.6],
+        )
+
+        grid = np.asarray(sub_grid_7x7)
+
+        expected_deflections = np.asarray(
+            main_profile.deflections_from_grid(grid=sub_grid_7x7)
+        )
+
+        for profile in truncated_profiles:
+
+            within_truncation_radius = (
+                np.sqrt(np.sum(np.square(grid - np.asarray(profile.centre)), axis=1))
+                <= 0.6
+            )
+
+            assert within_truncation_radius.any()
+            assert not within_truncation_radius.all()
+
+            expected_deflections[within_truncation_radius] += np.asarray(
+                profile.deflections_from_grid(grid=sub_grid_7x7)
+            )[within_truncation_radius]
+
+        assert deflections == pytest.approx(expected_deflections, 1.0e-8)
+
+    def test__truncated_profiles__convergence_and_potential_evaluated_only_within_truncation_radius(
+        self, sub_grid_7x7
+    ):
+
+        truncated_profiles = [
+            al.mp.SphericalIsothermal(centre=(0.5, -0.5), einstein_radius=0.2),
+            al.mp.SphericalIsothermal(centre=(0.0, 0.5), einstein_radius=0.1),
+        ]
+
+        main_profile = al.mp.SphericalIsothermal(einstein_radius=1.0)
+
+        galaxies = [al.Galaxy(redshift=0.5, mass=main_profile)] + [
+            al.Galaxy(redshift=0.5, mass=profile) for profile in truncated_profiles
+        ]
+
+        grid = np.asarray(sub_grid_7x7)
+
+        for values_func, profile_func in [
+            (
+                al.util.plane.convergence_of_galaxies_from_grid,
+                lambda profile: profile.convergence_from_grid(grid=sub_grid_7x7),
+            ),
+            (
+                al.util.plane.potential_of_galaxies_from_grid,
+                lambda profile: profile.potential_from_grid(grid=sub_grid_7x7),
+            ),
+        ]:
+
+            values = values_func(
+                galaxies=galaxies,
+                grid=sub_grid_7x7,
+                truncation_radii_of_galaxies=[None, 0.6, 0.6],
+            )
+
+            expected_values = np.array(profile_func(main_profile))
+
+            for profile in truncated_profiles:
+
+                within_truncation_radius = (
+                    np.sqrt(
+                        np.sum(np.square(grid - np.asarray(profile.centre)), axis=1)
+                    )
+                    <= 0.6
+                )
+
+                expected_values[within_truncation_radius] += np.asarray(
+                    profile_func(profile)
+                )[within_truncation_radius]
+
+            assert values == pytest.approx(expected_values, 1.0e-8)
+
+
+class TestProfileImageOfGalaxies:
+    def test__matches_sum_of_images_of_each_galaxy(self, sub_grid_7x7):
+
+        galaxies = [
+            al.Galaxy(
+                redshift=0.5,
+                light=al.lp.EllipticalSersic(intensity=1.0),
+                bulge=al.lp.SphericalExponential(intensity=2.0),
+            ),
+            al.Galaxy(redshift=0.5, light=al.lp.EllipticalSersic(intensity=3.0)),
+            al.Galaxy(redshift=0.5),
+        ]
+
+        profile_image = al.util.plane.profile_image_of_galaxies_from_grid(
+            galaxies=galaxies, grid=sub_grid_7x7
+        )
+
+        assert profile_image == pytest.approx(
+            np.asarray(
+                sum(
+                    [
+                        galaxy.profile_image_from_grid(grid=sub_grid_7x7)
+                        for galaxy in galaxies
+                    ]
+                )
+            ),
+            1.0e-8,
+        )
+
+        assert (
+            al.util.plane.profile_image_of_galaxies_from_grid(
+                galaxies=[al.Galaxy(redshift=0.5)], grid=sub_grid_7x7
+            )
+            == np.zeros(sub_grid_7x7.sub_shape_1d)
+        ).all()
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+from scipy import sparse
+
+import autolens as al
+
+
+class TestSparseMappingMatrices:
+    def test__sparse_mapping_matrix_and_blurred_mapping_matrix__same_as_dense(
+        self, sub_grid_7x7, masked_imaging_7x7
+    ):
+
+        mapper = al.pix.Rectangular(shape=(3, 3)).mapper_from_grid_and_sparse_grid(
+            grid=sub_grid_7x7, inversion_uses_border=False
+        )
+
+        mapping_matrix = al.util.sparse_inversion.sparse_mapping_matrix_from_mapper(
+            mapper=mapper
+        )
+
+        assert mapping_matrix.format == "csc"
+        assert (mapping_matrix.toarray() == mapper.mapping_matrix).all()
+
+        blurred_mapping_matrix = al.util.sparse_inversion.blurred_sparse_mapping_matrix_from_sparse_mapping_matrix_and_convolver(
+            mapping_matrix=mapping_matrix, convolver=masked_imaging_7x7.convolver
+        )
+
+        assert blurred_mapping_matrix.format == "csc"
+        assert (
+            blurred_mapping_matrix.toarray()
+            == masked_imaging_7x7.convolver.convolve_mapping_matrix(
+                mapping_matrix=mapper.mapping_matrix
+            )
+        ).all()
+
+    def test__sparse_curvature_matrix__same_as_dense(self):
+
+        random_state = np.random.RandomState(seed=1)
+
+        blurred_mapping_matrix = (random_state.uniform(size=(30, 8)) < 0.3) * 0.5
+        noise_map = random_state.uniform(1.0, 2.0, size=30)
+
+        curvature_matrix = al.util.sparse_inversion.sparse_curvature_matrix_from_blurred_sparse_mapping_matrix_and_noise_map(
+            blurred_mapping_matrix=sparse.csc_matrix(blurred_mapping_matrix),
+            noise_map=noise_map,
+        )
+
+        assert curvature_matrix.toarray() == pytest.approx(
+            al.util.inversion.curvature_matrix_from_blurred_mapping_matrix(
+                blurred_mapping_matrix=blurred_mapping_matrix, noise_map=noise_map
+            ),
+            1.0e-8,
+        )
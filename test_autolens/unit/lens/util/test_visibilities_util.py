@@ -0,0 +1,165 @@
+import numpy as np
+import pytest
+
+import autolens as al
+
+
+class TestVisibilitiesOfImages:
+    def test__batched_transform__identical_to_transforming_each_image(
+        self, sub_grid_7x7, uv_wavelengths_7x2
+    ):
+
+        images = [
+            al.lp.EllipticalSersic(intensity=1.0).profile_image_from_grid(
+                grid=sub_grid_7x7
+            ),
+            al.lp.SphericalExponential(
+                centre=(0.1, 0.2), intensity=-2.0
+            ).profile_image_from_grid(grid=sub_grid_7x7),
+            al.masked_array.zeros(mask=sub_grid_7x7.mask),
+        ]
+
+        grid_radians = sub_grid_7x7.mask.geometry.masked_grid.in_radians
+
+        for preload_transform in [True, False]:
+
+            transformer = al.transformer(
+                uv_wavelengths=uv_wavelengths_7x2,
+                grid_radians=grid_radians,
+                preload_transform=preload_transform,
+            )
+
+            visibilities_of_images = al.util.visibilities.visibilities_of_images_from_images_and_transformer(
+                images=images, transformer=transformer
+            )
+
+            assert len(visibilities_of_images) == 3
+
+            for image, visibilities in zip(images, visibilities_of_images):
+                assert (
+                    visibilities == transformer.visibilities_from_image(image=image)
+                ).all()
+
+        transformer = al.transformer_nufft(
+            uv_wavelengths=uv_wavelengths_7x2, grid_radians=grid_radians
+        )
+
+        visibilities_of_images = al.util.visibilities.visibilities_of_images_from_images_and_transformer(
+            images=images, transformer=transformer
+        )
+
+        for image, visibilities in zip(images, visibilities_of_images):
+            assert np.asarray(visibilities) == pytest.approx(
+                np.asarray(transformer.visibilities_from_image(image=image)), 1.0e-8
+            )
+
+    def test__no_images__returns_empty_list(self, transformer_7x7_7):
+
+        assert (
+            al.util.visibilities.visibilities_of_images_from_images_and_transformer(
+                images=[], transformer=transformer_7x7_7
+            )
+            == []
+        )
+
+
+class TestCompressedVisibilities:
+    def test__visibilities_averaged_in_uv_cells_with_inverse_variance_weights(self):
+
+        visibilities = np.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0], [7.0, 8.0]])
+        noise_map = np.array([[1.0, 1.0], [2.0, 2.0], [1.0, 2.0], [1.0, 1.0]])
+        uv_wavelengths = np.array(
+            [[10.0, 10.0], [30.0, 50.0], [-15.0, -20.0], [150.0, 10.0]]
+        )
+
+        compressed_visibilities, compressed_noise_map, compressed_uv_wavelengths, scatter_chi_squared = al.util.visibilities.compressed_visibilities_from_visibilities_noise_map_uv_wavelengths_and_mask(
+            visibilities=visibilities,
+            noise_map=noise_map,
+            uv_wavelengths=uv_wavelengths,
+            visibilities_mask=np.full(fill_value=False, shape=(4, 2)),
+            uv_cell_size=100.0,
+        )
+
+        # The third visibility is mirrored to (15.0, 20.0), with its imaginary part conjugated, joining the cell of
+        # the first two visibilities.
+
+        real_weights = np.array([1.0, 0.25, 1.0])
+        imag_weights = np.array([1.0, 0.25, 0.25])
+
+        assert compressed_visibilities == pytest.approx(
+            np.array(
+                [
+                    [
+                        np.sum(real_weights * np.array([1.0, 3.0, 5.0]))
+                        / np.sum(real_weights),
+                        np.sum(imag_weights * np.array([2.0, 4.0, -6.0]))
+                        / np.sum(imag_weights),
+                    ],
+                    [7.0, 8.0],
+                ]
+            ),
+            1.0e-8,
+        )
+        assert compressed_noise_map == pytest.approx(
+            np.array(
+                [
+                    [
+                        1.0 / np.sqrt(np.sum(real_weights)),
+                        1.0 / np.sqrt(np.sum(imag_weights)),
+                    ],
+                    [1.0, 1.0],
+                ]
+            ),
+            1.0e-8,
+        )
+
+        weights = real_weights + imag_weights
+
+        assert compressed_uv_wavelengths == pytest.approx(
+            np.array(
+                [
+                    [
+                        np.sum(weights * np.array([10.0, 30.0, 15.0]))
+                        / np.sum(weights),
+                        np.sum(weights * np.array([10.0, 50.0, 20.0]))
+                        / np.sum(weights),
+                    ],
+                    [150.0, 10.0],
+                ]
+            ),
+            1.0e-8,
+        )
+
+        assert scatter_chi_squared == pytest.approx(
+            np.sum(
+                real_weights
+                * (np.array([1.0, 3.0, 5.0]) - compressed_visibilities[0, 0]) ** 2.0
+            )
+            + np.sum(
+                imag_weights
+                * (np.array([2.0, 4.0, -6.0]) - compressed_visibilities[0, 1]) ** 2.0
+            ),
+            1.0e-8,
+        )
+
+    def test__masked_visibilities__omitted(self):
+
+        visibilities = np.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]])
+        noise_map = np.ones((3, 2))
+        uv_wavelengths = np.array([[10.0, 10.0], [30.0, 50.0], [150.0, 10.0]])
+
+        compressed = al.util.visibilities.compressed_visibilities_from_visibilities_noise_map_uv_wavelengths_and_mask(
+            visibilities=visibilities,
+            noise_map=noise_map,
+            uv_wavelengths=uv_wavelengths,
+            visibilities_mask=np.array([[False, False], [False, True], [False, False]]),
+            uv_cell_size=100.0,
+        )
+
+        assert compressed[0] == pytest.approx(
+            np.array([[1.0, 2.0], [5.0, 6.0]]), 1.0e-8
+        )
+        assert compressed[2] == pytest.approx(
+            np.array([[10.0, 10.0], [150.0, 10.0]]), 1.0e-8
+        )
+        assert compressed[3] == 0.0
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+import autolens as al
+
+
+@pytest.fixture(name="grid_radians")
+def make_grid_radians():
+    return al.masked_grid.from_mask(
+        mask=al.mask.circular(
+            shape_2d=(12, 14), pixel_scales=0.1, radius=0.45, centre=(0.05, -0.1)
+        )
+    ).in_radians
+
+
+class TestWTilde:
+    def test__w_tilde_and_dirty_image__same_as_via_transformed_pixels(
+        self, grid_radians
+    ):
+
+        random_state = np.random.RandomState(seed=1)
+
+        uv_wavelengths = 1.0e5 * random_state.randn(50, 2)
+        noise_map = random_state.uniform(1.0, 2.0, size=(50, 2))
+        visibilities = random_state.randn(50, 2)
+
+        transformer = al.transformer(
+            uv_wavelengths=uv_wavelengths, grid_radians=grid_radians
+        )
+
+        real_transforms, imag_transforms = transformer.transformed_mapping_matrices_from_mapping_matrix(
+            mapping_matrix=np.eye(grid_radians.shape_1d)
+        )
+
+        max_chunk_visibilities = al.util.w_tilde.max_chunk_visibilities
+
+        al.util.w_tilde.max_chunk_visibilities = 20
+
+        try:
+
+            for noise_map in [noise_map, np.repeat(noise_map[:, 0:1], 2, axis=1)]:
+
+                w_tilde = al.util.w_tilde.w_tilde_from_noise_map_uv_wavelengths_and_grid_radians(
+                    noise_map=noise_map,
+                    uv_wavelengths=uv_wavelengths,
+                    grid_radians=grid_radians,
+                )
+
+                assert w_tilde == pytest.approx(
+                    np.dot(real_transforms.T, real_transforms / noise_map[:, 0:1] ** 2)
+                    + np.dot(
+                        imag_transforms.T, imag_transforms / noise_map[:, 1:2] ** 2
+                    ),
+                    1.0e-8,
+                )
+
+            dirty_image = al.util.w_tilde.dirty_image_from_visibilities_noise_map_uv_wavelengths_and_grid_radians(
+                visibilities=visibilities,
+                noise_map=noise_map,
+                uv_wavelengths=uv_wavelengths,
+                grid_radians=grid_radians,
+            )
+
+        finally:
+            al.util.w_tilde.max_chunk_visibilities = max_chunk_visibilities
+
+        assert dirty_image == pytest.approx(
+            np.dot(real_transforms.T, visibilities[:, 0] / noise_map[:, 0] ** 2)
+            + np.dot(imag_transforms.T, visibilities[:, 1] / noise_map[:, 1] ** 2),
+            1.0e-8,
+        )
+
+    def test__curvature_matrix__same_as_dense_product(self):
+
+        random_state = np.random.RandomState(seed=2)
+
+        w_tilde = random_state.randn(20, 20)
+        w_tilde = w_tilde + w_tilde.T
+
+        mapping_matrix = (random_state.uniform(size=(20, 6)) < 0.2) * 0.25
+
+        assert al.util.w_tilde.curvature_matrix_from_w_tilde_and_mapping_matrix(
+            w_tilde=w_tilde, mapping_matrix=mapping_matrix
+        ) == pytest.approx(
+            np.dot(mapping_matrix.T, np.dot(w_tilde, mapping_matrix)), 1.0e-8
+        )
@@ -434,6 +434,60 @@ class TestMakeAnalysis:
                 tracer=tracer
             )
 
+    def test__positions_rejection_rate__counts_models_checked_and_rejected(
+        self, imaging_7x7, mask_7x7, tmpdir
+    ):
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(source=al.Galaxy(redshift=0.5)),
+            positions_threshold=0.5,
+            cosmology=cosmo.FLRW,
+            phase_name="test_phase",
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(
+            dataset=imaging_7x7, mask=mask_7x7, positions=[[(1.0, 0.0), (-1.0, 0.0)]]
+        )
+
+        assert analysis.positions_rejection_rate is None
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[
+                al.Galaxy(
+                    redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)
+                ),
+                al.Galaxy(redshift=1.0),
+            ]
+        )
+
+        analysis.check_positions_trace_within_threshold_via_tracer(tracer=tracer)
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[
+                al.Galaxy(
+                    redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=0.0)
+                ),
+                al.Galaxy(redshift=1.0),
+            ]
+        )
+
+        with pytest.raises(exc.RayTracingException):
+            analysis.check_positions_trace_within_threshold_via_tracer(tracer=tracer)
+
+        assert analysis.total_positions_checks == 2
+        assert analysis.total_positions_rejections == 1
+        assert analysis.positions_rejection_rate == 0.5
+
+        file_path = str(tmpdir.join("positions.info"))
+
+        analysis.output_positions_rejection_rate(file_path=file_path)
+
+        with open(file_path) as positions_info:
+            assert positions_info.readlines() == [
+                "Positions Checks = 2 \n",
+                "Positions Rejections = 1 \n",
+                "Positions Rejection Rate = 0.5 \n",
+            ]
+
     def test__inversion_resolution_error_raised_if_above_inversion_pixel_limit(
         self, phase_imaging_7x7, imaging_7x7, mask_7x7
     ):
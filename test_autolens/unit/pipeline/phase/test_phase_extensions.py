@@ -141,6 +141,7 @@ class TestImagePassing:
         assert isinstance(image_dict[("galaxies", "source")], np.ndarray)
 
         result.instance.galaxies.lens = al.Galaxy(redshift=0.5)
+        result.invalidate_cache()
 
         image_dict = result.image_galaxy_dict
         assert (image_dict[("galaxies", "lens")].in_2d == np.zeros((7, 7))).all()
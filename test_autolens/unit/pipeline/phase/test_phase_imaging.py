@@ -1,4 +1,5 @@
 import os
+import pickle
 from os import path
 
 import numpy as np
@@ -141,6 +142,25 @@ class TestAttributes:
             == binned_up_masked_imaging.noise_map.in_1d
         ).all()
 
+    def test__inversion_uses_sparse_matrices__passed_to_masked_imaging(
+        self, imaging_7x7, mask_7x7
+    ):
+        phase_imaging_7x7 = al.PhaseImaging(phase_name="phase_imaging_7x7")
+
+        analysis = phase_imaging_7x7.make_analysis(dataset=imaging_7x7, mask=mask_7x7)
+
+        assert analysis.masked_dataset.inversion_uses_sparse_matrices is False
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            phase_name="phase_imaging_7x7",
+            signal_to_noise_limit=1.0,
+            inversion_uses_sparse_matrices=True,
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(dataset=imaging_7x7, mask=mask_7x7)
+
+        assert analysis.masked_dataset.inversion_uses_sparse_matrices is True
+
     def test__phase_can_receive_hyper_image_and_noise_maps(self):
         phase_imaging_7x7 = al.PhaseImaging(
             galaxies=dict(
@@ -246,6 +266,246 @@ class TestFit:
 
         assert fit.likelihood == fit_figure_of_merit
 
+    def test__fit_batch__figures_of_merit_match_fit_of_each_instance(
+        self, imaging_7x7, mask_7x7
+    ):
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.GalaxyModel(redshift=0.5, mass=al.mp.SphericalIsothermal),
+                source=al.GalaxyModel(redshift=1.0, light=al.lp.EllipticalSersic),
+            ),
+            cosmology=cosmo.Planck15,
+            sub_size=1,
+            phase_name="test_phase",
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(dataset=imaging_7x7, mask=mask_7x7)
+
+        instances = [
+            phase_imaging_7x7.model.instance_from_unit_vector(
+                [unit_value] * phase_imaging_7x7.model.prior_count
+            )
+            for unit_value in [0.2, 0.5, 0.8]
+        ]
+
+        figures_of_merit = analysis.fit_batch(instances=instances)
+
+        assert figures_of_merit.shape == (3,)
+
+        for instance, figure_of_merit in zip(instances, figures_of_merit):
+            assert figure_of_merit == pytest.approx(
+                analysis.fit(instance=instance), 1.0e-8
+            )
+
+    def test__fit_of_instance_is_cached__reused_by_fit_for_instance_of_same_parameters(
+        self, imaging_7x7, mask_7x7
+    ):
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.GalaxyModel(redshift=0.5, mass=al.mp.SphericalIsothermal),
+                source=al.GalaxyModel(redshift=1.0, light=al.lp.EllipticalSersic),
+            ),
+            cosmology=cosmo.Planck15,
+            sub_size=1,
+            phase_name="test_phase",
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(dataset=imaging_7x7, mask=mask_7x7)
+
+        instance = phase_imaging_7x7.model.instance_from_unit_vector(
+            [0.5] * phase_imaging_7x7.model.prior_count
+        )
+
+        fit_figure_of_merit = analysis.fit(instance=instance)
+
+        assert len(analysis._fit_cache) == 0
+
+        fit = analysis.masked_dataset_fit_for_instance(instance=instance)
+
+        assert fit is analysis._last_fit[1]
+        assert fit.figure_of_merit == fit_figure_of_merit
+
+        same_instance = phase_imaging_7x7.model.instance_from_unit_vector(
+            [0.5] * phase_imaging_7x7.model.prior_count
+        )
+
+        assert analysis.masked_dataset_fit_for_instance(instance=same_instance) is fit
+
+        other_instance = phase_imaging_7x7.model.instance_from_unit_vector(
+            [0.4] * phase_imaging_7x7.model.prior_count
+        )
+
+        other_fit = analysis.masked_dataset_fit_for_instance(instance=other_instance)
+
+        assert other_fit is not fit
+        assert other_fit.figure_of_merit == pytest.approx(
+            analysis.fit(instance=other_instance), 1.0e-8
+        )
+
+        analysis.fit_cache_size = 2
+
+        for unit_value in [0.1, 0.2, 0.3]:
+            analysis.masked_dataset_fit_for_instance(
+                instance=phase_imaging_7x7.model.instance_from_unit_vector(
+                    [unit_value] * phase_imaging_7x7.model.prior_count
+                )
+            )
+
+        assert len(analysis._fit_cache) == 2
+        assert analysis.masked_dataset_fit_for_instance(instance=instance) is not fit
+
+    def test__stage_timer__records_stages_of_fit_and_outputs_timings(
+        self, imaging_7x7, mask_7x7
+    ):
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.GalaxyModel(redshift=0.5, mass=al.mp.SphericalIsothermal),
+                source=al.GalaxyModel(redshift=1.0, light=al.lp.EllipticalSersic),
+            ),
+            cosmology=cosmo.Planck15,
+            sub_size=1,
+            phase_name="test_phase",
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(dataset=imaging_7x7, mask=mask_7x7)
+
+        assert analysis.stage_timer is None
+
+        timings_path = "{}/timings.info".format(directory)
+
+        analysis.output_stage_timings(file_path=timings_path)
+
+        assert not path.exists(timings_path)
+
+        analysis.stage_timer = al.util.profiling.StageTimer()
+
+        instance = phase_imaging_7x7.model.instance_from_unit_vector(
+            [0.5] * phase_imaging_7x7.model.prior_count
+        )
+
+        analysis.fit(instance=instance)
+        analysis.fit(instance=instance)
+
+        assert list(analysis.stage_timer.times.keys()) == [
+            "tracer",
+            "positions_check",
+            "profile_image",
+            "blurring_convolution",
+            "likelihood",
+            "fit",
+        ]
+        assert analysis.stage_timer.calls["fit"] == 2
+        assert analysis.stage_timer.calls["profile_image"] == 2
+        assert analysis.stage_timer.times["fit"] >= (
+            analysis.stage_timer.times["likelihood"]
+        )
+
+        analysis.output_stage_timings(file_path=timings_path)
+
+        with open(timings_path, "r") as timings_info:
+            lines = timings_info.readlines()
+
+        os.remove(timings_path)
+
+        assert len(lines) == 6
+        assert lines[0].startswith("tracer = ")
+        assert "(2 calls" in lines[0]
+
+    def test__result_galaxy_images_use_cached_fit_of_different_instance_with_same_parameters(
+        self, imaging_7x7, mask_7x7
+    ):
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.GalaxyModel(redshift=0.5, mass=al.mp.SphericalIsothermal),
+                source=al.GalaxyModel(redshift=1.0, light=al.lp.EllipticalSersic),
+            ),
+            cosmology=cosmo.Planck15,
+            sub_size=1,
+            phase_name="test_phase",
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(dataset=imaging_7x7, mask=mask_7x7)
+
+        instance = phase_imaging_7x7.model.instance_from_unit_vector(
+            [0.5] * phase_imaging_7x7.model.prior_count
+        )
+
+        analysis.fit(instance=instance)
+
+        result = phase_imaging_7x7.Result(
+            instance=phase_imaging_7x7.model.instance_from_unit_vector(
+                [0.5] * phase_imaging_7x7.model.prior_count
+            ),
+            likelihood=1.0,
+            previous_model=phase_imaging_7x7.model,
+            gaussian_tuples=None,
+            analysis=analysis,
+            optimizer=None,
+        )
+
+        fit = analysis.masked_dataset_fit_for_instance(instance=instance)
+
+        assert result.most_likely_fit is fit
+        assert (
+            result.image_galaxy_dict[("galaxies", "source")]
+            == fit.galaxy_model_image_dict[instance.galaxies.source]
+        ).all()
+
+    def test__result_computes_most_likely_fit_and_galaxy_images_once__until_invalidated(
+        self, imaging_7x7, mask_7x7
+    ):
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.GalaxyModel(redshift=0.5, light=al.lp.EllipticalSersic),
+                source=al.GalaxyModel(redshift=1.0, light=al.lp.EllipticalSersic),
+            ),
+            cosmology=cosmo.Planck15,
+            sub_size=1,
+            phase_name="test_phase",
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(dataset=imaging_7x7, mask=mask_7x7)
+
+        result = phase_imaging_7x7.Result(
+            instance=phase_imaging_7x7.model.instance_from_unit_vector(
+                [0.5] * phase_imaging_7x7.model.prior_count
+            ),
+            likelihood=1.0,
+            previous_model=phase_imaging_7x7.model,
+            gaussian_tuples=None,
+            analysis=analysis,
+            optimizer=None,
+        )
+
+        assert result.most_likely_tracer is result.most_likely_tracer
+        assert result.most_likely_fit is result.most_likely_fit
+        assert result.image_galaxy_dict is result.image_galaxy_dict
+        assert result.hyper_model_image is result.hyper_model_image
+
+        fit = analysis.masked_dataset_fit_for_instance(instance=result.instance)
+
+        for path, galaxy in result.path_galaxy_tuples:
+
+            assert result.hyper_galaxy_image_path_dict[path] is not (
+                result.image_galaxy_dict[path]
+            )
+            assert (
+                result.image_galaxy_dict[path]
+                == fit.galaxy_model_image_dict[
+                    result.galaxy_of_most_likely_fit(galaxy=galaxy)
+                ]
+            ).all()
+
+        image_galaxy_dict = result.image_galaxy_dict
+
+        result.invalidate_cache()
+
+        assert result.image_galaxy_dict is not image_galaxy_dict
+
+        result = pickle.loads(pickle.dumps(result))
+
+        assert result._cache == {}
+
     def test__figure_of_merit__includes_hyper_image_and_noise__matches_fit(
         self, imaging_7x7, mask_7x7
     ):
@@ -94,6 +94,76 @@ class TestPhase:
         assert isinstance(result.instance.galaxies[0], al.Galaxy)
         assert isinstance(result.instance.galaxies[0], al.Galaxy)
 
+    def test__make_analysis__transformer_class_used_by_masked_interferometer(
+        self, interferometer_7, mask_7x7, visibilities_mask_7x2
+    ):
+        phase_interferometer_7 = al.PhaseInterferometer(
+            phase_name="test_phase", real_space_mask=mask_7x7
+        )
+
+        analysis = phase_interferometer_7.make_analysis(
+            dataset=interferometer_7, mask=visibilities_mask_7x2
+        )
+
+        assert type(analysis.masked_interferometer.transformer) == al.transformer
+
+        phase_interferometer_7 = al.PhaseInterferometer(
+            phase_name="test_phase",
+            real_space_mask=mask_7x7,
+            transformer_class=al.transformer_nufft,
+        )
+
+        assert phase_interferometer_7.paths.phase_tag.endswith("__nufft")
+
+        analysis = phase_interferometer_7.make_analysis(
+            dataset=interferometer_7, mask=visibilities_mask_7x2
+        )
+
+        assert type(analysis.masked_interferometer.transformer) == al.transformer_nufft
+
+    def test__make_analysis__uv_cell_size_compresses_visibilities(
+        self, interferometer_7, mask_7x7, visibilities_mask_7x2
+    ):
+        phase_interferometer_7 = al.PhaseInterferometer(
+            phase_name="test_phase", real_space_mask=mask_7x7, uv_cell_size=1.0e8
+        )
+
+        assert phase_interferometer_7.paths.phase_tag.endswith("__uv_cell_100000000.0")
+
+        analysis = phase_interferometer_7.make_analysis(
+            dataset=interferometer_7, mask=visibilities_mask_7x2
+        )
+
+        assert analysis.masked_interferometer.uv_cell_size == 1.0e8
+        assert analysis.masked_interferometer.visibilities.shape_1d < 7
+        assert analysis.masked_interferometer.transformer.total_visibilities < 7
+
+    def test__make_analysis__inversion_uses_w_tilde__w_tilde_preloaded(
+        self, interferometer_7, mask_7x7, visibilities_mask_7x2
+    ):
+        phase_interferometer_7 = al.PhaseInterferometer(
+            phase_name="test_phase", real_space_mask=mask_7x7
+        )
+
+        analysis = phase_interferometer_7.make_analysis(
+            dataset=interferometer_7, mask=visibilities_mask_7x2
+        )
+
+        assert analysis.masked_interferometer.w_tilde is None
+
+        phase_interferometer_7 = al.PhaseInterferometer(
+            phase_name="test_phase",
+            real_space_mask=mask_7x7,
+            inversion_uses_w_tilde=True,
+        )
+
+        analysis = phase_interferometer_7.make_analysis(
+            dataset=interferometer_7, mask=visibilities_mask_7x2
+        )
+
+        assert analysis.masked_interferometer.w_tilde.shape == (9, 9)
+        assert analysis.masked_interferometer.w_tilde_dirty_image.shape == (9,)
+
     def test_modify_visibilities(
         self, interferometer_7, mask_7x7, visibilities_mask_7x2
     ):
@@ -35,6 +35,15 @@ class TestPhaseTag:
 
         assert phase_tag == "phase_tag__rs_shape_3x3__rs_pix_1.00x2.00__sub_1__pb_2x2"
 
+        phase_tag = al.tagging.phase_tag_from_phase_settings(
+            sub_size=1,
+            real_space_shape_2d=(3, 3),
+            real_space_pixel_scales=(1.0, 2.0),
+            transformer_class=al.transformer_nufft,
+        )
+
+        assert phase_tag == "phase_tag__rs_shape_3x3__rs_pix_1.00x2.00__sub_1__nufft"
+
 
 class TestPhaseTaggers:
     def test__positions_threshold_tagger(self):
@@ -162,3 +171,23 @@ class TestPhaseTaggers:
             real_space_pixel_scales=(2.0, 1.0)
         )
         assert tag == "__rs_pix_2.00x1.00"
+
+    def test__transformer_tagger(self):
+        tag = al.tagging.transformer_tag_from_transformer_class(transformer_class=None)
+        assert tag == ""
+        tag = al.tagging.transformer_tag_from_transformer_class(
+            transformer_class=al.transformer
+        )
+        assert tag == ""
+        tag = al.tagging.transformer_tag_from_transformer_class(
+            transformer_class=al.transformer_nufft
+        )
+        assert tag == "__nufft"
+
+    def test__uv_cell_size_tagger(self):
+        tag = al.tagging.uv_cell_size_tag_from_uv_cell_size(uv_cell_size=None)
+        assert tag == ""
+        tag = al.tagging.uv_cell_size_tag_from_uv_cell_size(uv_cell_size=100.0)
+        assert tag == "__uv_cell_100.0"
+        tag = al.tagging.uv_cell_size_tag_from_uv_cell_size(uv_cell_size=2500.0)
+        assert tag == "__uv_cell_2500.0"
@@ -350,3 +350,61 @@ class TestHyperGalaxyVisualizer:
         )
 
         assert plot_path + "subplots/subplot_fit_hyper_galaxy.png" in plot_patch.paths
+
+
+class MockAnalysis:
+    def __init__(self, file_path):
+        self.file_path = file_path
+
+    def visualize_instance(self, instance, during_analysis):
+        with open(self.file_path, "a") as f:
+            f.write("{} {}\n".format(instance[0], during_analysis))
+
+
+class TestBackgroundVisualizer:
+    def test__submitted_instances_are_visualized_in_worker__last_instance_always_visualized(
+        self, plot_path
+    ):
+
+        os.makedirs(plot_path, exist_ok=True)
+
+        file_path = path.join(plot_path, "background.txt")
+
+        if path.exists(file_path):
+            os.remove(file_path)
+
+        visualizer = vis.BackgroundVisualizer(
+            analysis=MockAnalysis(file_path=file_path)
+        )
+
+        instance = [0]
+
+        for value in range(5):
+            instance[0] = value
+            visualizer.submit(instance=instance, during_analysis=True)
+
+        visualizer.close()
+
+        assert not visualizer.process.is_alive()
+
+        with open(file_path, "r") as f:
+            lines = f.readlines()
+
+        assert 1 <= len(lines) <= 5
+        assert lines[-1] == "4 True\n"
+
+        values = [int(line.split()[0]) for line in lines]
+
+        assert values == sorted(values)
+
+        os.remove(file_path)
+
+    def test__visualizer_setting_default_false_if_not_in_config(
+        self, masked_imaging_7x7, plot_path
+    ):
+
+        visualizer = vis.PhaseDatasetVisualizer(
+            masked_dataset=masked_imaging_7x7, image_path=plot_path
+        )
+
+        assert visualizer.visualize_in_background is False
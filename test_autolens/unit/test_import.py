@@ -0,0 +1,48 @@
+import subprocess
+import sys
+import types
+
+import autolens as al
+
+
+def modules_imported_by(code):
+    """The names of the modules imported by running code in a new Python process, which (unlike this process) has \
+    not already imported autolens or matplotlib."""
+    output = subprocess.check_output(
+        [
+            sys.executable,
+            "-c",
+            "{}\nimport sys\nprint(' '.join(sys.modules))".format(code),
+        ]
+    )
+
+    return output.decode().split()
+
+
+class TestLazyImports:
+    def test__import_autolens__does_not_import_matplotlib_or_pipeline(self):
+
+        modules = modules_imported_by(code="import autolens")
+
+        assert "autolens" in modules
+        assert "matplotlib" not in modules
+        assert "autoarray" not in modules
+        assert "autolens.pipeline" not in modules
+
+    def test__public_names_resolve_to_the_objects_they_are_imported_from(self):
+
+        from autolens.lens.ray_tracing import Tracer
+        from autolens.fit import fit
+        from autolens.pipeline.phase.imaging.phase import PhaseImaging
+        from autoastro.profiles import mass_profiles
+
+        assert al.Tracer is Tracer
+        assert al.PhaseImaging is PhaseImaging
+        assert al.mp is mass_profiles
+        assert al.fit is fit.fit
+        assert isinstance(al.plot, types.ModuleType)
+        assert "Tracer" in dir(al)
+
+    def test__unknown_name__raises_attribute_error(self):
+
+        assert not hasattr(al, "not_a_public_name")